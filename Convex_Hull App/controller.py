@@ -1,10 +1,17 @@
 # controller.py
 # (Owned by integration/lead developer)
 import tkinter as tk
+import time
 from model import ConvexHullModel
 from view import ConvexHullView
+from trace_recorder import TraceRecorder
 
 class ConvexHullController:
+    # Playback runs in frames: each frame advances every step that is due
+    # (spending at most FRAME_BUDGET seconds on it) and draws only the last.
+    FRAME_MS = 16
+    FRAME_BUDGET = 0.012
+
     def __init__(self, root):
         self.root = root
         self.model = ConvexHullModel()
@@ -20,27 +27,42 @@ class ConvexHullController:
         self.animation_job = None
         self.algorithm_generator = None
         self.current_algorithm_name = None
+        self.trace = None # TraceRecorder of the last animated run, kept for scrubbing
+        self.trace_name = None
+        self.step = -1 # Trace step on screen
+        self.fast_forward = None # 'vertex' or 'end' while skipping ahead
+        self._step_credit = 0.0 # Steps due but not drawn yet
+        self._frame_clock = 0 # perf_counter() of the last animation frame
+        self._finish_rate = None # Steps per second in "finish in" mode, once the run's length is known
         
         # Canvas Pan/Click State
         self.is_panning = False
         self.last_pan_x = 0
         self.last_pan_y = 0
         self._click_job = None
+        self.dragged_point = None # Grid position of the point being dragged
+        self._kinetic_clock = 0 # perf_counter() of the last kinetic frame
         
         # Bind View Events to Controller Methods
         self.view.bind_proceed_to_main(self.show_main_app)
         self.view.bind_proceed_to_dual(self.show_dual_comparison)
         self.view.bind_start_animation(self.start_animation)
         self.view.bind_reset(self.reset)
+        self.view.bind_stream_file(self.start_stream)
         self.view.bind_pause_resume(self.toggle_pause_resume)
         self.view.bind_next_step(self.next_step)
+        self.view.bind_next_vertex(self.jump_to_next_vertex)
+        self.view.bind_run_to_end(self.run_to_end)
+        self.view.bind_kinetic_toggle(self.on_kinetic_toggled)
         self.view.bind_back_to_start(self.back_to_start_screen)
+        self.view.bind_timeline(self.seek_step, self.step_back, self.next_step, self.toggle_pause_resume)
         self.view.bind_canvas_events(
             self.on_canvas_press,
             self.on_pan,
             self.on_pan_release,
             self.on_zoom
         )
+        self.view.bind_delete_point(self.on_delete_point)
         self.view.bind_resize(self.on_resize)
         
         self._update_ui_states()
@@ -49,7 +71,7 @@ class ConvexHullController:
     
     def show_main_app(self):
         self.view.show_main_app()
-        self.view.draw_all(self.model.get_points(), self.model.get_hull())
+        self._redraw()
     
     def show_start_screen(self):
         # Hide main app UI
@@ -82,14 +104,23 @@ class ConvexHullController:
         if not self.is_panning:
             self.view.origin_x = event.width / 2
             self.view.origin_y = event.height / 2
-        self.view.draw_all(self.model.get_points(), self.model.get_hull())
+        self._redraw()
     
     def on_canvas_press(self, event):
         if self.is_running: return
         self.last_pan_x, self.last_pan_y = event.x, event.y
+        grid_x_f, grid_y_f = self.view.canvas_to_grid(event.x, event.y)
+        grid_x, grid_y = round(grid_x_f), round(grid_y_f)
+        if self.model.find_point(grid_x, grid_y):
+            # Pressing on a point grabs it instead of adding or panning
+            self.dragged_point = (grid_x, grid_y)
+            return
         self._click_job = self.root.after(200, self._perform_add_point, event)
     
     def on_pan(self, event):
+        if self.dragged_point:
+            self._drag_point(event)
+            return
         if self._click_job:
             self.root.after_cancel(self._click_job)
             self._click_job = None
@@ -99,9 +130,15 @@ class ConvexHullController:
         self.view.origin_x += dx
         self.view.origin_y += dy
         self.last_pan_x, self.last_pan_y = event.x, event.y
-        self.view.draw_all(self.model.get_points(), self.model.get_hull())
+        self._redraw()
     
     def on_pan_release(self, event):
+        if self.dragged_point:
+            self.dragged_point = None
+            self.view.set_eliminated_points(self.model.get_eliminated_ids())
+            self._redraw()
+            self._update_ui_states()
+            return
         if self._click_job:
             self.root.after_cancel(self._click_job)
             self._perform_add_point(event)
@@ -111,9 +148,31 @@ class ConvexHullController:
         grid_x_f, grid_y_f = self.view.canvas_to_grid(event.x, event.y)
         grid_x, grid_y = round(grid_x_f), round(grid_y_f)
         if self.model.add_point(grid_x, grid_y):
-            self.view.draw_all(self.model.get_points(), self.model.get_hull())
+            self._drop_trace()
+            self.view.set_eliminated_points(self.model.get_eliminated_ids())
+            self._redraw()
             self._update_ui_states()
     
+    def _drag_point(self, event):
+        grid_x_f, grid_y_f = self.view.canvas_to_grid(event.x, event.y)
+        target = (round(grid_x_f), round(grid_y_f))
+        if target == self.dragged_point or not self.model.move_point(*self.dragged_point, *target):
+            return
+        self.dragged_point = target
+        self._drop_trace()
+        self.view.draw_dragged_point(self.model.find_point(*target), self.model.get_live_hull())
+        self.view.update_status(f"Moved point to ({target[0]}, {target[1]}).")
+
+    def on_delete_point(self, event):
+        if self.is_running: return
+        grid_x_f, grid_y_f = self.view.canvas_to_grid(event.x, event.y)
+        grid_x, grid_y = round(grid_x_f), round(grid_y_f)
+        if self.model.delete_point(grid_x, grid_y):
+            self._drop_trace()
+            self.view.set_eliminated_points(self.model.get_eliminated_ids())
+            self._redraw()
+            self._update_ui_states()
+
     def on_zoom(self, event):
         zoom_factor = 1.1 if event.num == 4 or event.delta > 0 else 0.9
         new_grid_size = self.view.grid_size * zoom_factor
@@ -125,7 +184,14 @@ class ConvexHullController:
             # wy = (oy - ey) / gs => oy = ey + wy * gs
             #-- FIX: Corrected Y-origin calculation
             self.view.origin_y = event.y + wy * self.view.grid_size 
-            self.view.draw_all(self.model.get_points(), self.model.get_hull())
+            self._redraw()
+
+    def _redraw(self):
+        """Redraws the scene with the last computed hull, or the live hull kept since the last click."""
+        if self.model.get_layers():
+            self.view.draw_layers_step(self.model.get_points(), self.model.get_layers(), None)
+            return
+        self.view.draw_all(self.model.get_points(), self.model.get_hull() or self.model.get_live_hull())
 
     # --- Control Logic ---
     
@@ -135,90 +201,383 @@ class ConvexHullController:
             
         self.is_running = True
         self.is_paused = False
+        self._drop_trace()
         self.view.show_animation_panels()
         self.view.hide_results()
         
         self.current_algorithm_name = self.view.get_selected_algorithm()
+        try:
+            self.model.set_prefilter(self.view.get_selected_prefilter())
+            self.model.set_granularity(self.view.get_selected_granularity())
+            self.model.set_approximation(strips=self.view.get_approx_strips())
+        except ValueError as e:
+            print(e)
+            self.is_running = False
+            return
+
+        if self.view.get_kinetic_mode():
+            self._start_kinetic()
+            return
+
+        if self.view.get_skip_animation() or not self.model.is_animated(self.current_algorithm_name):
+            # Headless run: no generator, jump straight to the final result
+            try:
+                final_data = self.model.compute_hull(algorithm=self.current_algorithm_name)
+            except ValueError as e:
+                print(e)
+                self.is_running = False
+                return
+            self._animation_finished(final_data)
+            return
         
-        if self.current_algorithm_name == "Jarvis March":
-            self.algorithm_generator = self.model.run_jarvis_march()
-        elif self.current_algorithm_name == "Graham Scan":
-            self.algorithm_generator = self.model.run_graham_scan()
-        else:
-            print(f"Unknown algorithm: {self.current_algorithm_name}")
+        try:
+            self.algorithm_generator = self.model.run_algorithm(self.current_algorithm_name)
+        except ValueError as e:
+            print(e)
             self.is_running = False
             return
+        self.trace = TraceRecorder(self.algorithm_generator)
+        self.trace_name = self.current_algorithm_name
             
+        self._start_playback()
+
+    def start_stream(self):
+        """Hulls a point file chunk by chunk, showing the running hull as it converges."""
+        if self.is_running:
+            return
+        path = self.view.ask_stream_source()
+        if not path:
+            return
+        self.is_running = True
+        self.is_paused = False
+        self._drop_trace()
+        self.view.show_animation_panels()
+        self.view.hide_results()
+        self.view.set_eliminated_points(set())
+        self.current_algorithm_name = "Streaming hull"
+        self.algorithm_generator = self.model.run_streaming(path, publish_every=self.view.get_stream_every())
+        # Only the hull on screen is kept: a stream can publish far more hulls than fit in memory
+        self.trace = TraceRecorder(self.algorithm_generator, keep_last=1)
+        self.trace_name = self.current_algorithm_name
+        self._update_ui_states()
+        self._start_playback()
+
+    def _start_playback(self):
+        """(Re)starts the frame clock, with the first step due at once."""
+        self._step_credit = 1.0
+        self._frame_clock = time.perf_counter()
+        self._finish_rate = None
         self._run_animation_step()
 
+    def _step_rate(self):
+        """
+        Steps per second: the speed slider's, or in "finish in" mode the rate
+        that plays the rest of the run in the chosen time. None while the
+        run's length is still unknown.
+        """
+        seconds = self.view.get_finish_seconds()
+        if seconds is None or self.trace.keep_last is not None:
+            # A run that keeps only its latest steps cannot be measured ahead
+            return 1000 / self.view.get_speed()
+        if self._finish_rate is None:
+            if not self.trace.done:
+                return None
+            remaining = max(len(self.trace) - 1 - self.step, 1)
+            self._finish_rate = remaining / seconds
+            self.view.update_status(f"{self.current_algorithm_name} is running: {remaining} steps in {seconds:g} s...")
+        return self._finish_rate
+
     def _run_animation_step(self):
-        """This is the main animation loop, controlled by the Controller."""
+        """This is the main animation loop, controlled by the Controller: one frame per call."""
         if not self.is_running:
             return
             
         if self.is_paused and not self.next_step_requested:
             return
             
+        single = self.next_step_requested
         self.next_step_requested = False
+        self.animation_job = None
         
         try:
-            update_data = next(self.algorithm_generator)
-            
-            if update_data.get('status') == 'finished':
-                self._animation_finished(update_data)
-                return
+            now = time.perf_counter()
+            deadline = now + self.FRAME_BUDGET
+            rate = None
+            if single:
+                due = 1
+            elif self.fast_forward:
+                due = None # As many as the frame budget allows
+            else:
+                rate = self._step_rate()
+                if rate is None:
+                    # "Finish in" mode needs the run's length: record it first, a frame budget at a time
+                    while not self.trace.done and time.perf_counter() < deadline:
+                        self.trace.record(len(self.trace) + 1000)
+                    self.view.update_status(f"Measuring the run: {len(self.trace)} steps so far...")
+                    self._frame_clock = time.perf_counter()
+                    self.animation_job = self.root.after(1, self._run_animation_step)
+                    return
+                self._step_credit += rate * (now - self._frame_clock)
+                due = int(self._step_credit)
+                self._step_credit -= due
+            self._frame_clock = now
 
-            self.view.update_analysis(update_data['description'])
-            
-            if update_data.get('type') == 'jarvis':
-                p = self.model.points[update_data['p_idx']]
-                q = self.model.points[update_data['q_idx']]
-                i = self.model.points[update_data['check_idx']]
-                self.view.draw_jarvis_step(
-                    self.model.get_points(),
-                    p, q, i,
-                    update_data['hull_so_far']
-                )
-                
-            elif update_data.get('type') == 'graham':
-                #-- FIX: Get the full point object from the yield (model was changed)
-                check_point = update_data.get('check_point')
-
-                self.view.draw_graham_step(
-                    self.model.get_points(),
-                    update_data['pivot'],
-                    update_data['sorted_points'],
-                    update_data['stack'],
-                    check_point,
-                    update_data['status']
-                )
+            # Skip over the due steps by status alone; only the last one is built and drawn
+            step = self.step
+            while due is None or step - self.step < due:
+                status = self.trace.status(step + 1)
+                if status is None:
+                    self._animation_finished(self.trace.final)
+                    return
+                step += 1
+                if self.fast_forward == 'vertex' and status in self.model.VERTEX_STATUSES:
+                    self._pause()
+                    break
+                if time.perf_counter() > deadline:
+                    break
+            if due is not None and not single:
+                self._step_credit += due - (step - self.step) # Steps the budget ran out on stay due
+            if step > self.step:
+                self._show_step(step, self.trace.event(step))
 
             if not self.is_paused:
-                delay = self.view.get_speed()
+                delay = self.FRAME_MS
+                if rate and not self.fast_forward:
+                    # Sleep until the next step is due, drawing at most once a frame
+                    delay = max(delay, int((1 - self._step_credit) / rate * 1000))
                 self.animation_job = self.root.after(delay, self._run_animation_step)
                 
-        except StopIteration:
-            self._animation_finished(None)
         except Exception as e:
             print(f"Error during animation: {e}")
             import traceback
             traceback.print_exc()
             self.reset()
             
+    def _show_step(self, step, update_data):
+        """Draws one recorded step and moves the timeline to it."""
+        self.step = step
+        self.view.update_analysis(update_data['description'])
+        self.view.set_eliminated_points(self.model.get_eliminated_ids())
+            
+        if update_data.get('type') == 'jarvis':
+            p = self.model.points[update_data['p_idx']]
+            q = self.model.points[update_data['q_idx']]
+            i = self.model.points[update_data['check_idx']]
+            self.view.draw_jarvis_step(
+                self.model.get_points(),
+                p, q, i,
+                update_data['hull_so_far']
+            )
+                
+        elif update_data.get('type') == 'graham':
+            self.view.draw_graham_step(
+                self.model.get_points(),
+                update_data['order'],
+                update_data.stack_indices(),
+                update_data['check'],
+                update_data['status']
+            )
+
+        elif update_data.get('type') == 'chan':
+            self.view.draw_chan_step(
+                self.model.get_points(),
+                update_data['mini_hulls'],
+                update_data['p'],
+                update_data['probe'],
+                update_data['tangents'],
+                update_data['q'],
+                update_data['hull_so_far']
+            )
+
+        elif update_data.get('type') == 'dc':
+            self.view.draw_dc_step(
+                self.model.get_points(),
+                update_data['sub_hulls'],
+                update_data['split'],
+                update_data['bridge'],
+                update_data['status'],
+                update_data['hull_so_far']
+            )
+
+        elif update_data.get('type') == 'ks':
+            self.view.draw_ks_step(
+                self.model.get_points(),
+                update_data['candidates'],
+                update_data['split'],
+                update_data['support'],
+                update_data['slope'],
+                update_data['pruned'],
+                update_data['bridges'],
+                update_data['hull_so_far']
+            )
+
+        elif update_data.get('type') == 'layers':
+            self.view.draw_layers_step(
+                self.model.get_points(),
+                update_data['layers'],
+                update_data['current']
+            )
+
+        elif update_data.get('type') == 'stream':
+            self.view.draw_all(self.model.get_points(), update_data['hull_so_far'])
+
+        elif update_data.get('type') == 'quickhull':
+            self.view.draw_quickhull_step(
+                self.model.get_points(),
+                update_data['segment'],
+                update_data['farthest'],
+                update_data['candidates'],
+                update_data['kept'],
+                update_data['status'],
+                update_data['hull_so_far']
+            )
+        self.view.set_timeline(step, len(self.trace), self.trace.done)
+
+    # --- Timeline (scrubbing a recorded run) ---
+
+    def _pause(self):
+        self.fast_forward = None
+        if self.is_running and not self.is_paused:
+            self.is_paused = True
+            if self.animation_job:
+                self.root.after_cancel(self.animation_job)
+                self.animation_job = None
+            self._update_ui_states()
+
+    def seek_step(self, step):
+        """Shows any recorded step, pausing a run that is playing."""
+        if self.trace is None or self.model.kinetic is not None:
+            return
+        step = max(self.trace.first, min(step, len(self.trace) - 1))
+        if step == self.step:
+            return
+        self._pause()
+        update_data = self.trace.event(step)
+        if update_data is not None:
+            self._show_step(step, update_data)
+
+    def step_back(self):
+        if self.trace is not None and self.step > self.trace.first:
+            self.seek_step(self.step - 1)
+
+    def _replay(self):
+        """Plays a finished run again from the step on screen (from the start if at the end), without re-running it."""
+        if self.step >= len(self.trace) - 1:
+            self.step = self.trace.first - 1
+        self.is_running = True
+        self.is_paused = False
+        self.current_algorithm_name = self.trace_name
+        self.view.hide_results()
+        self._update_ui_states()
+        self._start_playback()
+
+    def jump_to_next_vertex(self):
+        """Plays ahead without drawing to the next step that adds a hull vertex, and pauses there."""
+        self._skip_ahead('vertex')
+
+    def run_to_end(self):
+        """Plays the rest of the run without drawing and shows the result."""
+        self._skip_ahead('end')
+
+    def _skip_ahead(self, target):
+        if self.trace is None or self.model.kinetic is not None:
+            return
+        if not self.is_running:
+            if self.step >= len(self.trace) - 1:
+                return # Already at the end of a finished run
+            self.is_running = True
+            self.current_algorithm_name = self.trace_name
+            self.view.hide_results()
+        if self.animation_job:
+            self.root.after_cancel(self.animation_job)
+            self.animation_job = None
+        self.is_paused = False
+        self._update_ui_states()
+        self.fast_forward = target
+        self._start_playback()
+
+    def _drop_trace(self):
+        """Forgets the recorded run (the points changed, or a new run starts)."""
+        if self.trace is not None:
+            self.trace.close()
+        self.trace = None
+        self.step = -1
+        self.view.set_timeline(-1, 0, True)
+
+    def _start_kinetic(self):
+        """Kinetic playback: the points move, and the model repairs the hull only when a certificate fails."""
+        self.current_algorithm_name = "Kinetic motion"
+        self.model.start_kinetic()
+        self.view.set_eliminated_points(set())
+        self._kinetic_clock = time.perf_counter()
+        self._update_ui_states()
+        self._run_kinetic_step()
+
+    def _run_kinetic_step(self):
+        if not self.is_running or self.is_paused or self.model.kinetic is None:
+            return
+        now = time.perf_counter()
+        # The speed slider's default (350 ms) plays the motion in real time
+        self._show_kinetic_frame((now - self._kinetic_clock) * 350 / self.view.get_speed())
+        self._kinetic_clock = now
+        self.animation_job = self.root.after(33, self._run_kinetic_step)
+
+    def _show_kinetic_frame(self, dt):
+        """Advances the kinetic run by dt seconds and draws it."""
+        frame = self.model.kinetic_step(dt)
+        stats = frame['stats']
+        self.view.update_analysis(
+            f"t = {frame['time']:.2f} s, hull vertices: {len(frame['hull_so_far'])}\n\n"
+            f"Certificate failures: {stats['events']}\n"
+            f"Vertices caved in: {stats['vertex_events']}\n"
+            f"Points broke out: {stats['breakouts']}\n"
+            f"Fan crossings: {stats['fan_moves']}\n"
+            f"Rebuilds: {stats['rebuilds']}"
+        )
+        self.view.draw_all(frame['points'], frame['hull_so_far'])
+
+    def _stop_kinetic(self):
+        """Ends a kinetic run; the points stay where they were placed."""
+        if self.animation_job:
+            self.root.after_cancel(self.animation_job)
+            self.animation_job = None
+        self.model.stop_kinetic()
+        self.is_running = False
+        self.is_paused = False
+        self.current_algorithm_name = None
+        self.view.update_analysis("Kinetic motion stopped.")
+        self._redraw()
+        self._update_ui_states()
+
+    def on_kinetic_toggled(self):
+        if not self.view.get_kinetic_mode() and self.model.kinetic is not None:
+            self._stop_kinetic()
+
     def _animation_finished(self, final_data):
         self.is_running = False
         self.is_paused = False
+        self.fast_forward = None
         self.algorithm_generator = None
         self.current_algorithm_name = None
         
         if final_data:
             self.view.update_status("Convex hull complete!")
-            self.view.update_analysis("Algorithm finished. The final convex hull is shown.")
+            analysis = "Algorithm finished. The final convex hull is shown."
+            if final_data.get('counters'):
+                analysis += "\n\n" + "\n".join(f"{name.replace('_', ' ').capitalize()}: {value}"
+                                               for name, value in final_data['counters'].items())
+            elif self.model.prefilter_summary():
+                analysis += "\n\n" + self.model.prefilter_summary()
+            self.view.update_analysis(analysis)
+            self.view.set_eliminated_points(self.model.get_eliminated_ids())
+            time_text = f"Time: {final_data['time_ms']:.2f} ms"
+            if 'error_bound' in final_data:
+                time_text += f"  (error ≤ {final_data['error_bound']:.3g} grid units)"
             self.view.show_results(
-                time_text=f"Time: {final_data['time_ms']:.2f} ms",
+                time_text=time_text,
                 complexity_text=final_data['complexity']
             )
-            self.view.draw_all(self.model.get_points(), self.model.get_hull())
+            self._redraw()
         else:
             self.view.update_status("Algorithm finished (or not needed).")
             
@@ -228,36 +587,56 @@ class ConvexHullController:
         if self.animation_job:
             self.root.after_cancel(self.animation_job)
             self.animation_job = None
+        self._drop_trace()
             
         self.is_running = False
         self.is_paused = False
+        self.fast_forward = None
         self.algorithm_generator = None
         self.current_algorithm_name = None
         
         self.model.reset()
+        self.view.set_eliminated_points(self.model.get_eliminated_ids())
         
         self.view.anim_controls_frame.pack_forget()
         self.view.analysis_frame.pack_forget()
         self.view.results_frame.pack_forget()
         
-        self.view.draw_all(self.model.get_points(), self.model.get_hull())
+        self._redraw()
         self._update_ui_states()
 
     def toggle_pause_resume(self):
         if not self.is_running:
+            if self.trace is not None and self.trace.done and len(self.trace):
+                self._replay()
             return
         self.is_paused = not self.is_paused
         if not self.is_paused:
             self.view.update_status(f"Resuming {self.current_algorithm_name}...")
-            self._run_animation_step()
+            if self.model.kinetic is not None:
+                self._kinetic_clock = time.perf_counter()
+                self._run_kinetic_step()
+            else:
+                self._start_playback()
         else:
+            self.fast_forward = None
+            if self.animation_job:
+                self.root.after_cancel(self.animation_job)
+                self.animation_job = None
             self.view.update_status("Animation paused.")
         self._update_ui_states()
 
     def next_step(self):
+        if self.model.kinetic is not None:
+            # One frame of motion (33 ms at the slider's speed), not a trace step
+            if self.is_running and self.is_paused:
+                self._show_kinetic_frame(0.033 * 350 / self.view.get_speed())
+            return
         if self.is_running and self.is_paused:
             self.next_step_requested = True
             self._run_animation_step()
+        elif not self.is_running and self.trace is not None:
+            self.seek_step(self.step + 1)
 
     def _update_ui_states(self):
         """Central place to update all button states."""
@@ -312,15 +691,18 @@ class ConvexHullController:
         if self.animation_job:
             self.root.after_cancel(self.animation_job)
             self.animation_job = None
+        self._drop_trace()
         
         # Reset animation state
         self.is_running = False
         self.is_paused = False
+        self.fast_forward = None
         self.algorithm_generator = None
         self.current_algorithm_name = None
         
         # Reset the model (clear all points)
         self.model.reset()
+        self.view.set_eliminated_points(self.model.get_eliminated_ids())
         
         # Hide animation panels
         self.view.anim_controls_frame.pack_forget()
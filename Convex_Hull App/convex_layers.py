@@ -0,0 +1,263 @@
+# convex_layers.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Convex layers (onion peeling): layer 0 is the convex hull, layer 1 the
+# hull of what remains once its vertices are removed, and so on. Instead of
+# rebuilding a hull per layer, the points sit in one deletion-only hull
+# tree, and removing a vertex only repairs the few bridges that used it.
+import hull_kernels
+
+
+class _HullTree:
+    """
+    Deletion-only hull in the style of Overmars and van Leeuwen. The points,
+    sorted lexicographically, are the leaves of a complete binary tree;
+    every node with two non-empty children stores the bridge (a, b) joining
+    its children's chains, so a node's chain is its left child's chain up
+    to a followed by its right child's chain from b. One tree is kept per
+    chain: `turn` +1 for the lower chain, -1 for the upper chain (Andrew's
+    convention, collinear points are not vertices).
+
+    Deleting a point can only move bridges that had it as an endpoint; those
+    are walked to their new position from the old one's neighbours, with
+    chain neighbours found by descending the tree (O(log n) each).
+    """
+
+    def __init__(self, xs, ys, counts, size, depth):
+        self.xs, self.ys = xs, ys
+        self.count = counts          # Shared with the other chain: alive points per node
+        self.size, self.depth = size, depth
+        self.a = [-1] * size         # Bridge per internal node, as sorted positions
+        self.b = [-1] * size
+        self.walk_steps = 0
+
+    def _bad(self, a, b, q):
+        """True if q lies strictly outside the chain side of the line a->b."""
+        xs, ys = self.xs, self.ys
+        return self.turn * ((xs[b] - xs[a]) * (ys[q] - ys[a]) - (ys[b] - ys[a]) * (xs[q] - xs[a])) < 0
+
+    def _on_line(self, a, b, q):
+        xs, ys = self.xs, self.ys
+        return (xs[b] - xs[a]) * (ys[q] - ys[a]) - (ys[b] - ys[a]) * (xs[q] - xs[a]) == 0
+
+    # --- Build ---
+
+    def build(self, turn):
+        """Computes every bridge bottom-up, merging explicit chains level by level."""
+        self.turn = turn
+        size = self.size
+        chains = [[i] if self.count[size + i] else [] for i in range(size)]
+        for level in range(self.depth - 1, -1, -1):
+            first = 1 << level
+            merged = []
+            for k in range(len(chains) // 2):
+                left, right = chains[2 * k], chains[2 * k + 1]
+                if not left or not right:
+                    merged.append(left or right)
+                    continue
+                ia, ib = len(left) - 1, 0
+                moved = True
+                while moved:
+                    moved = False
+                    while ia > 0 and (self._bad(left[ia], right[ib], left[ia - 1]) or
+                                      self._on_line(left[ia], right[ib], left[ia - 1])):
+                        ia -= 1
+                        moved = True
+                    while ib + 1 < len(right) and (self._bad(left[ia], right[ib], right[ib + 1]) or
+                                                   self._on_line(left[ia], right[ib], right[ib + 1])):
+                        ib += 1
+                        moved = True
+                self.a[first + k], self.b[first + k] = left[ia], right[ib]
+                merged.append(left[:ia + 1] + right[ib:])
+            chains = merged
+        return chains[0]
+
+    # --- Chain Navigation ---
+
+    def succ(self, node, level, pos):
+        """Vertex after pos on the chain of `node` (at tree level `level`), or -1 if pos is its last vertex."""
+        count, a, b = self.count, self.a, self.b
+        leaf, shift = self.size + pos, self.depth - level - 1
+        while shift >= 0:
+            child = leaf >> shift  # Child of node on the way to pos
+            if a[node] == pos and not child & 1 and count[child + 1]:
+                return b[node]
+            node, shift = child, shift - 1
+        return -1
+
+    def pred(self, node, level, pos):
+        """Vertex before pos on the chain of `node` (at tree level `level`), or -1 if pos is its first vertex."""
+        count, a, b = self.count, self.a, self.b
+        leaf, shift = self.size + pos, self.depth - level - 1
+        while shift >= 0:
+            child = leaf >> shift
+            if b[node] == pos and child & 1 and count[child - 1]:
+                return a[node]
+            node, shift = child, shift - 1
+        return -1
+
+    # --- Deletion ---
+
+    def plan(self, pos):
+        """
+        Before pos is deleted: for every ancestor whose bridge ends at pos,
+        where the repair walk should start (pos's chain neighbour in that
+        child, which stays a vertex).
+        """
+        starts = []
+        node, level = 1, 0
+        count, a, b = self.count, self.a, self.b
+        leaf = self.size + pos
+        while level < self.depth:
+            child = leaf >> (self.depth - level - 1)
+            if count[child ^ 1]:
+                if a[node] == pos:
+                    near = self.pred(child, level + 1, pos)
+                    starts.append((node, level, near if near >= 0 else self.succ(child, level + 1, pos), b[node]))
+                elif b[node] == pos:
+                    near = self.succ(child, level + 1, pos)
+                    starts.append((node, level, a[node], near if near >= 0 else self.pred(child, level + 1, pos)))
+            node, level = child, level + 1
+        return starts
+
+    def repair(self, starts):
+        """After the deletion, walks each planned bridge (deepest first) to where it now belongs."""
+        count = self.count
+        for node, level, ia, ib in reversed(starts):
+            left, right = 2 * node, 2 * node + 1
+            if not count[left] or not count[right]:
+                continue  # A side emptied: the node's chain is the other child's
+            self.a[node], self.b[node] = self._walk(left, right, level + 1, ia, ib)
+
+    def _walk(self, left, right, level, ia, ib):
+        """
+        Moves the bridge ends along their chains, either way, until no
+        neighbour lies outside the line (collinear ones count when they are
+        further out). Both chains are convex, so that local test is global.
+        """
+        xs, ys, turn = self.xs, self.ys, self.turn
+        succ, pred = self.succ, self.pred
+        while True:
+            self.walk_steps += 1
+            ax, ay = xs[ia], ys[ia]
+            dx, dy = xs[ib] - ax, ys[ib] - ay
+            q = succ(left, level, ia)
+            if q >= 0 and turn * (dx * (ys[q] - ay) - dy * (xs[q] - ax)) < 0:
+                ia = q
+                continue
+            q = pred(left, level, ia)
+            if q >= 0 and turn * (dx * (ys[q] - ay) - dy * (xs[q] - ax)) <= 0:
+                ia = q
+                continue
+            q = succ(right, level, ib)
+            if q >= 0 and turn * (dx * (ys[q] - ay) - dy * (xs[q] - ax)) <= 0:
+                ib = q
+                continue
+            q = pred(right, level, ib)
+            if q >= 0 and turn * (dx * (ys[q] - ay) - dy * (xs[q] - ax)) < 0:
+                ib = q
+                continue
+            return ia, ib
+
+
+class ConvexLayers:
+    """
+    Peels the convex layers of a point set, one layer per peel(). A lower
+    and an upper hull tree share the sorted order and the alive counts, so
+    the whole peeling costs one sort plus O(log n) tree work per removed
+    vertex, plus the bridge walks (short in practice), instead of a full
+    hull per layer. A layer is the hull's vertices; points on an edge
+    between two vertices are left for the next layer.
+    """
+
+    def __init__(self, xs, ys):
+        self.n = len(xs)
+        self.order = hull_kernels.lexicographic_order(xs, ys)
+        px = [xs[i] for i in self.order]
+        py = [ys[i] for i in self.order]
+        depth = max(1, (self.n - 1).bit_length())
+        size = 1 << depth
+        self.size, self.depth = size, depth
+
+        # Alive points per node; leaves past n are padding
+        self.count = [0] * (2 * size)
+        for i in range(self.n):
+            self.count[size + i] = 1
+        for node in range(size - 1, 0, -1):
+            self.count[node] = self.count[2 * node] + self.count[2 * node + 1]
+
+        self.lower = _HullTree(px, py, self.count, size, depth)
+        self.upper = _HullTree(px, py, self.count, size, depth)
+        self.lower.build(1)
+        self.upper.build(-1)
+        self.layers_peeled = 0
+
+    def _first_alive(self):
+        node, count = 1, self.count
+        while node < self.size:
+            node = 2 * node if count[2 * node] else 2 * node + 1
+        return node - self.size
+
+    def _last_alive(self):
+        node, count = 1, self.count
+        while node < self.size:
+            node = 2 * node + 1 if count[2 * node + 1] else 2 * node
+        return node - self.size
+
+    def hull(self):
+        """Current hull vertices, as sorted positions, counter-clockwise from the left-most."""
+        if self.count[1] == 0:
+            return []
+        first, last = self._first_alive(), self._last_alive()
+        if first == last:
+            return [first]
+        lower, v = [first], first
+        while v != last:
+            v = self.lower.succ(1, 0, v)
+            lower.append(v)
+        upper, v = [], self.upper.pred(1, 0, last)
+        while v != first:
+            upper.append(v)
+            v = self.upper.pred(1, 0, v)
+        return lower + upper
+
+    def _delete(self, pos):
+        lower_plan, upper_plan = self.lower.plan(pos), self.upper.plan(pos)
+        node = self.size + pos
+        while node:
+            self.count[node] -= 1
+            node >>= 1
+        self.lower.repair(lower_plan)
+        self.upper.repair(upper_plan)
+
+    def peel(self):
+        """Removes the current hull and returns its vertices (input indices, counter-clockwise), [] when empty."""
+        layer = self.hull()
+        for pos in layer:
+            self._delete(pos)
+        if layer:
+            self.layers_peeled += 1
+        return [self.order[pos] for pos in layer]
+
+    def __iter__(self):
+        while True:
+            layer = self.peel()
+            if not layer:
+                return
+            yield layer
+
+    def stats(self):
+        return {'layers': self.layers_peeled,
+                'bridge_walk_steps': self.lower.walk_steps + self.upper.walk_steps}
+
+
+def convex_layers(xs, ys, stats=None):
+    """Layer index (0 = outermost) of every point."""
+    peeler = ConvexLayers(xs, ys)
+    depth = [0] * len(xs)
+    for k, layer in enumerate(peeler):
+        for i in layer:
+            depth[i] = k
+    if stats is not None:
+        stats.update(peeler.stats())
+    return depth
@@ -4,6 +4,7 @@ import time
 import traceback
 import math # Import math for validation
 from model import ConvexHullModel
+from step_events import StepEvent
 from PIL import Image, ImageTk, ImageDraw, ImageFont
 
 class DualComparisonView:
@@ -32,6 +33,11 @@ class DualComparisonView:
     FONT_BOLD = ("Inter", 12, "bold")
     FONT_NORMAL = ("Inter", 10)
 
+    # Engines without a canvas here; their headless time is reported next to Jarvis and Graham
+    EXTRA_ENGINES = ("Chan's Algorithm", "QuickHull", "Divide & Conquer", "Kirkpatrick–Seidel")
+    # Timed headlessly too, as the yardstick for the per-(n log n) cost of the extra engines
+    SCALING_BASELINE = "Graham Scan"
+
     def __init__(self, root, main_controller):
         self.root = root
         self.main_controller = main_controller
@@ -40,6 +46,7 @@ class DualComparisonView:
         self.shared_model = main_controller.model # For adding/resetting points
         self.model_jarvis = ConvexHullModel()
         self.model_graham = ConvexHullModel()
+        self.model_extra = ConvexHullModel() # Runs EXTRA_ENGINES on the same points
 
         self.grid_size = 20
         self.min_grid_size = 4
@@ -136,6 +143,13 @@ class DualComparisonView:
         )
         self.back_button.pack(fill=tk.X) # No padding after last button
 
+        # Skip animation: run the headless engines and show the results instantly
+        self.skip_animation_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(main_controls_frame, text="Skip animation", variable=self.skip_animation_var,
+                       font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK,
+                       activebackground=self.C_NEAR_BLACK, activeforeground=self.C_WHITE_TEXT,
+                       selectcolor=self.C_DARK_GRAY, highlightthickness=0, anchor="w").pack(fill=tk.X, pady=(8, 0))
+
         # Animation Controls Separator
         tk.Frame(control_panel, height=1, bg=self.C_MED_GRAY).pack(fill=tk.X, pady=10)
         self.anim_controls_frame = tk.Frame(control_panel, bg=self.C_NEAR_BLACK, pady=0) # Removed pady
@@ -246,6 +260,9 @@ class DualComparisonView:
         self.complexity_text = tk.StringVar(value="—")
         create_vertical_result(results_bg, "Algorithm Complexity", self.complexity_text)
 
+        self.extra_engines_text = tk.StringVar(value="—")
+        create_vertical_result(results_bg, "Other Engines (no animation)", self.extra_engines_text)
+
         self.status_text = tk.StringVar(value="Waiting for algorithm to start...")
         create_vertical_result(results_bg, "Status", self.status_text, accent=self.C_MED_GRAY)
 
@@ -376,7 +393,11 @@ class DualComparisonView:
         except Exception as e: print(f"Unexpected error in draw_jarvis_step: {e}")
 
 
-    def draw_graham_step(self, canvas, points, pivot, sorted_points_with_pivot, stack, check_point, status):
+    def draw_graham_step(self, canvas, points, order, stack, check, status):
+        # `order` is the polar order (pivot first); `stack` (bottom first) and `check` index into it
+        pivot, sorted_points_with_pivot = order[0], order
+        stack = [order[i] for i in stack]
+        check_point = order[check] if check is not None else None
         if pivot and not (isinstance(pivot, dict) and 'grid_x' in pivot and 'grid_y' in pivot): return
         valid_stack = [p for p in stack if isinstance(p, dict) and 'grid_x' in p and 'grid_y' in p]
         stack = valid_stack # Use validated stack
@@ -596,6 +617,19 @@ class DualComparisonView:
         self.model_graham.n = len(self.model_graham.points)
         # ----------------------------------------------------
 
+        if self.skip_animation_var.get():
+            self.jarvis_gen = None
+            self.graham_gen = None
+            self.final_jarvis_state = self.model_jarvis.compute_hull(algorithm="Jarvis March")
+            self.final_graham_state = self.model_graham.compute_hull(algorithm="Graham Scan")
+            self.jarvis_finished = True
+            self.graham_finished = True
+            self.analysis_text_left.set("Finished.")
+            self.analysis_text_right.set("Finished.")
+            self._finish_comparison()
+            self._redraw_all_canvases()
+            return
+
         try: # Get generators
             self.jarvis_gen = self.model_jarvis.run_jarvis_march()
             self.graham_gen = self.model_graham.run_graham_scan()
@@ -723,25 +757,7 @@ class DualComparisonView:
 
         # Check completion - but continue animation if either algorithm is still running
         if self.jarvis_finished and self.graham_finished:
-            self.is_running = False
-            self.status_text.set("Dual Comparison Finished!")
-            self._set_button_states(start_state=tk.DISABLED, reset_state=tk.NORMAL,
-                                    pause_text="Pause", pause_state=tk.DISABLED, next_state=tk.DISABLED)
-
-            # Final results display
-            if self.final_jarvis_state and self.final_graham_state:
-                j_comp = self.final_jarvis_state.get('complexity', 'N/A')
-                g_comp = self.final_graham_state.get('complexity', 'N/A')
-                j_time_val = self.final_jarvis_state.get('time_ms', 0)
-                g_time_val = self.final_graham_state.get('time_ms', 0)
-                j_time = f"Jarvis: {j_time_val:.2f} ms ({j_comp})"
-                g_time = f"Graham: {g_time_val:.2f} ms ({g_comp})"
-
-                self.time_text.set(j_time)
-                self.complexity_text.set(g_time)
-                self.show_results()
-                self.hide_animation_controls()
-
+            self._finish_comparison()
             return # Stop animation loop
 
         # Schedule next step if either algorithm is still running AND we're not paused
@@ -750,10 +766,50 @@ class DualComparisonView:
             self.animation_job = self.root.after(delay, self._animate_step)
 
 
+    def _finish_comparison(self):
+        """Stops the comparison and shows both final states in the results panel."""
+        self.is_running = False
+        self.status_text.set("Dual Comparison Finished!")
+        self._set_button_states(start_state=tk.DISABLED, reset_state=tk.NORMAL,
+                                pause_text="Pause", pause_state=tk.DISABLED, next_state=tk.DISABLED)
+
+        # Final results display
+        if self.final_jarvis_state and self.final_graham_state:
+            j_comp = self.final_jarvis_state.get('complexity', 'N/A')
+            g_comp = self.final_graham_state.get('complexity', 'N/A')
+            j_time_val = self.final_jarvis_state.get('time_ms', 0)
+            g_time_val = self.final_graham_state.get('time_ms', 0)
+            j_time = f"Jarvis: {j_time_val:.2f} ms ({j_comp})"
+            g_time = f"Graham: {g_time_val:.2f} ms ({g_comp})"
+
+            self.time_text.set(j_time)
+            self.complexity_text.set(g_time)
+            self.extra_engines_text.set(self._run_extra_engines())
+            self.show_results()
+            self.hide_animation_controls()
+
+    def _run_extra_engines(self):
+        """
+        Times EXTRA_ENGINES (and SCALING_BASELINE) headlessly on the compared
+        points, one line per engine, each with its time per n log2 n so the
+        O(n log n) engines can be compared as n grows.
+        """
+        lines = []
+        for algorithm in (self.SCALING_BASELINE,) + self.EXTRA_ENGINES:
+            try:
+                result = self.model_extra.compute_hull(list(self.model_jarvis.points), algorithm=algorithm)
+            except Exception as e:
+                print(f"{algorithm} Error: {e}")
+                continue
+            n = max(result['n'], 2)
+            per_n_log_n = result['time_ms'] * 1e6 / (n * math.log2(n))
+            lines.append(f"{algorithm}: {result['time_ms']:.2f} ms, {per_n_log_n:.0f} ns per n log n ({result['complexity']})")
+        return "\n".join(lines) or "—"
+
     # ... (rest of _process_single_state, event handlers, UI management, button drawing remain the same) ...
     # ... Make sure all methods below _animate_step are included ...
     def _process_single_state(self, canvas, state, algorithm_type):
-        if not isinstance(state, dict): return
+        if not isinstance(state, (dict, StepEvent)): return
         model_to_use = self.model_jarvis if algorithm_type == "Jarvis" else self.model_graham
         points = model_to_use.get_points()
         if not state: return
@@ -778,10 +834,9 @@ class DualComparisonView:
                 # For final state, ensure we draw the complete hull (not outline_only)
                 self.draw_all(canvas, points, hull_so_far, clear=True)
             else:
-                pivot, sorted_pts, stack = state.get('pivot'), state.get('sorted_points', []), state.get('stack', [])
-                check_pt, current_status = state.get('check_point'), state.get('status')
-                if not pivot or not isinstance(sorted_pts, list) or not isinstance(stack, list) or not current_status: return
-                self.draw_graham_step(canvas, points, pivot, sorted_pts, stack, check_pt, current_status)
+                order, current_status = state.get('order'), state.get('status')
+                if not order or not current_status: return
+                self.draw_graham_step(canvas, points, order, state.stack_indices(), state.get('check'), current_status)
 
     def _bind_canvas_events(self):
         for canvas, canvas_id in [(self.canvas_left, 'left'), (self.canvas_right, 'right')]:
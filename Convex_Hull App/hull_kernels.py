@@ -0,0 +1,1477 @@
+# hull_kernels.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Array-level hull kernels used by the model's non-animated engines.
+# They work on plain coordinate sequences (xs, ys) and return point
+# indices, so the model can map them back to its point dicts.
+import math
+import random
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, every kernel has a pure Python path
+    np = None
+
+# Beyond this magnitude int64 cross products could overflow.
+_INT64_SAFE_COORD = 2**30
+
+
+def _as_arrays(xs, ys):
+    """Converts coordinate sequences to NumPy arrays with an exact dtype where possible."""
+    if np is None:
+        raise ImportError("NumPy is required for the vectorized kernels.")
+    X, Y = np.asarray(xs), np.asarray(ys)
+    if X.dtype.kind in 'iu' and Y.dtype.kind in 'iu':
+        if len(X) == 0 or max(int(np.abs(X).max()), int(np.abs(Y).max())) < _INT64_SAFE_COORD:
+            return X.astype(np.int64, copy=False), Y.astype(np.int64, copy=False)
+        # Huge integers: stay exact with Python ints inside object arrays
+        return X.astype(object), Y.astype(object)
+    if X.dtype == object or Y.dtype == object:
+        return X.astype(object), Y.astype(object)
+    return X.astype(np.float64, copy=False), Y.astype(np.float64, copy=False)
+
+
+# --- Interior-point pre-filters ---
+# Each filter returns the (ascending) indices of the points that may still
+# be hull vertices; the engines then only run on those.
+
+def akl_toussaint(xs, ys, stats=None):
+    """
+    Akl-Toussaint elimination. The points extreme in x, y, x + y and x - y
+    span a convex polygon (up to an octagon) inside the hull, so any point
+    strictly inside it cannot be a hull vertex and is dropped.
+    `stats`, if given, receives the kept and eliminated counts.
+    """
+    n = len(xs)
+    X = Y = None
+    if np is not None and n > 64:
+        X, Y = _as_arrays(xs, ys)
+        if X.dtype == object:
+            X = Y = None
+
+    if n < 3:
+        kept = list(range(n))
+    elif X is not None:
+        extremes = {int(f(k)) for k in (X, Y, X + Y, X - Y) for f in (np.argmin, np.argmax)}
+        polygon = _extreme_polygon(xs, ys, extremes)
+        inside = np.full(n, len(polygon) >= 3)
+        for a, b in zip(polygon, polygon[1:] + polygon[:1]):
+            inside &= (X[b] - X[a]) * (Y - Y[a]) - (Y[b] - Y[a]) * (X - X[a]) > 0
+        kept = np.flatnonzero(~inside).tolist()
+    else:
+        extremes = set()
+        for key in (lambda i: xs[i], lambda i: ys[i], lambda i: xs[i] + ys[i], lambda i: xs[i] - ys[i]):
+            extremes.add(min(range(n), key=key))
+            extremes.add(max(range(n), key=key))
+        polygon = _extreme_polygon(xs, ys, extremes)
+        edges = list(zip(polygon, polygon[1:] + polygon[:1])) if len(polygon) >= 3 else []
+
+        def inside(i):
+            return bool(edges) and all((xs[b] - xs[a]) * (ys[i] - ys[a]) - (ys[b] - ys[a]) * (xs[i] - xs[a]) > 0
+                                       for a, b in edges)
+        kept = [i for i in range(n) if not inside(i)]
+
+    if stats is not None:
+        stats.update(prefilter_kept=len(kept), prefilter_eliminated=n - len(kept))
+    return kept
+
+
+def _extreme_polygon(xs, ys, extremes):
+    """Convex polygon (counter-clockwise indices) through a handful of extreme points."""
+    extremes = sorted(extremes)
+    local = monotone_chain([xs[i] for i in extremes], [ys[i] for i in extremes])
+    return [extremes[i] for i in local]
+
+
+def lattice_extremes(xs, ys, stats=None, by_row=False):
+    """
+    Column-extremes reduction for grid-snapped points. On any vertical line
+    only the lowest and the highest point can be a hull vertex (anything
+    between them sits on a segment of two other points), so one bucketing
+    pass keeps at most two points per distinct x. With `by_row` a point must
+    also be the left-most or right-most of its row.
+    `stats`, if given, receives the kept and eliminated counts.
+    """
+    n = len(xs)
+    X = Y = None
+    if np is not None and n > 64:
+        X, Y = _as_arrays(xs, ys)
+        if X.dtype == object:
+            X = Y = None
+
+    if X is not None:
+        keep = _line_extremes_numpy(X, Y)
+        if by_row:
+            keep &= _line_extremes_numpy(Y, X)
+        kept = np.flatnonzero(keep).tolist()
+    else:
+        keep = _line_extremes(xs, ys)
+        if by_row:
+            keep &= _line_extremes(ys, xs)
+        kept = sorted(keep)
+
+    if stats is not None:
+        stats.update(prefilter_kept=len(kept), prefilter_eliminated=n - len(kept))
+    return kept
+
+
+def lattice_row_column_extremes(xs, ys, stats=None):
+    """lattice_extremes() by column and by row."""
+    return lattice_extremes(xs, ys, stats, by_row=True)
+
+
+def _line_extremes(keys, values):
+    """Indices holding the smallest or largest value among the points sharing their key."""
+    lowest, highest = {}, {}
+    for i, (k, v) in enumerate(zip(keys, values)):
+        if k not in lowest or v < values[lowest[k]]:
+            lowest[k] = i
+        if k not in highest or v > values[highest[k]]:
+            highest[k] = i
+    return set(lowest.values()) | set(highest.values())
+
+
+def _line_extremes_numpy(K, V):
+    """Mask form of _line_extremes(). Integer keys over a short span are bucketed directly."""
+    if K.dtype.kind in 'iu' and int(K.max()) - int(K.min()) < 4 * len(K):
+        bucket = K - K.min()
+        size = int(bucket.max()) + 1
+    else:
+        _, bucket = np.unique(K, return_inverse=True)
+        size = int(bucket.max()) + 1
+    low = np.full(size, V.max())
+    high = np.full(size, V.min())
+    np.minimum.at(low, bucket, V)
+    np.maximum.at(high, bucket, V)
+    return (V == low[bucket]) | (V == high[bucket])
+
+
+# --- Jarvis March ---
+
+def jarvis_march(xs, ys, stats=None):
+    """
+    Gift wrapping without the generator overhead.
+    Returns hull indices in the same order as ConvexHullModel.run_jarvis_march():
+    start at the bottom-most (then left-most) point, keep the most clockwise
+    candidate and break collinear ties on the farthest point.
+    `stats`, if given, receives the wrap-step and orientation-test counts.
+    """
+    n = len(xs)
+    if n < 3:
+        return []
+    if np is not None:
+        return jarvis_march_numpy(xs, ys, stats)
+
+    start = min(range(n), key=lambda i: (ys[i], xs[i]))
+    hull = []
+    p = start
+    while True:
+        hull.append(p)
+        px, py = xs[p], ys[p]
+        q = (p + 1) % n
+        qx, qy = xs[q] - px, ys[q] - py
+        for r in range(n):
+            if r == p:
+                continue
+            rx, ry = xs[r] - px, ys[r] - py
+            val = qx * ry - qy * rx
+            if val < 0 or (val == 0 and rx * rx + ry * ry > qx * qx + qy * qy):
+                q, qx, qy = r, rx, ry
+        p = q
+        if p == start or len(hull) > n:
+            break
+    if stats is not None:
+        stats.update(wrap_steps=len(hull), orientation_tests=len(hull) * (n - 1))
+    return hull
+
+
+def jarvis_march_numpy(xs, ys, stats=None):
+    """
+    Vectorized Jarvis March. Each wrap step is one cross-product pass over
+    the point arrays: the most clockwise point (argmin of the cross product)
+    replaces Q until no point lies clockwise of P->Q, then collinear ties are
+    broken on distance. Only the points still clockwise of Q are re-tested,
+    so a step usually costs one or two full passes. `orientation_tests` in
+    `stats` counts the cross products those passes evaluate.
+    """
+    X, Y = _as_arrays(xs, ys)
+    n = len(X)
+    if n < 3:
+        return []
+
+    bottom = np.flatnonzero(Y == Y.min())
+    start = int(bottom[np.argmin(X[bottom])])
+    hull = []
+    tests = 0
+    p = start
+    while True:
+        hull.append(p)
+        dx = X - X[p]
+        dy = Y - Y[p]
+        q = (p + 1) % n
+
+        # Shrink the candidate set until nothing is clockwise of P->Q
+        cand = None
+        while True:
+            if cand is None:
+                cross = dx[q] * dy - dy[q] * dx
+            else:
+                cross = dx[q] * dy[cand] - dy[q] * dx[cand]
+            tests += len(cross)
+            clockwise = np.flatnonzero(cross < 0)
+            if len(clockwise) == 0:
+                break
+            best = clockwise[np.argmin(cross[clockwise])]
+            q = int(best if cand is None else cand[best])
+            cand = clockwise if cand is None else cand[clockwise]
+
+        # Collinear tie-break: farthest point on the P->Q ray
+        collinear = np.flatnonzero(dx[q] * dy - dy[q] * dx == 0)
+        tests += n
+        dist = dx[collinear] * dx[collinear] + dy[collinear] * dy[collinear]
+        q = int(collinear[np.argmax(dist)])
+
+        p = q
+        if p == start or len(hull) > n:
+            break
+    if stats is not None:
+        stats.update(wrap_steps=len(hull), orientation_tests=tests)
+    return hull
+
+
+# --- Graham Scan polar sort ---
+
+# While |dx| + dy stays below this, distinct pseudo-angles of lattice points
+# differ by more than a float64 rounding step, so the float key is exact.
+_PSEUDO_ANGLE_EXACT_SPAN = 2**26
+
+
+def polar_order(xs, ys, pivot):
+    """
+    Returns the indices of all points except `pivot`, sorted counter-clockwise
+    around it (closer first when collinear), exactly like the old
+    cmp_to_key comparator.
+
+    The pivot is the bottom-most, left-most point, so every other point has
+    dy >= 0 and its angle lies in [0, pi). On that range the pseudo-angle
+    -dx / (|dx| + dy) is strictly increasing with the true angle, needs no
+    atan2, and is a rational number we can compare exactly.
+    """
+    n = len(xs)
+    px, py = xs[pivot], ys[pivot]
+    if n < 2:
+        return []
+
+    if np is not None:
+        X, Y = np.asarray(xs), np.asarray(ys)
+        if X.dtype.kind == 'i' and Y.dtype.kind == 'i':
+            dx = X - px
+            dy = Y - py
+            if int(np.abs(dx).max()) + int(dy.max()) < _PSEUDO_ANGLE_EXACT_SPAN:
+                # One native call sorts by (pseudo-angle, distance)
+                denom = np.abs(dx) + dy
+                denom[pivot] = 1
+                pseudo = -dx / denom
+                dist = dx * dx + dy * dy
+                order = np.lexsort((dist, pseudo))
+                return order[order != pivot].tolist()
+
+    others = [i for i in range(n) if i != pivot]
+    is_int = all(type(v) is int for v in xs) and all(type(v) is int for v in ys)
+    if is_int and max(abs(x - px) for x in xs) + max(y - py for y in ys) < _PSEUDO_ANGLE_EXACT_SPAN:
+        def key(i):
+            dx, dy = xs[i] - px, ys[i] - py
+            return (-dx / ((abs(dx) + dy) or 1), dx * dx + dy * dy)
+    else:
+        # Floats or huge coordinates: compare the same key as exact fractions
+        fpx, fpy = Fraction(px), Fraction(py)
+
+        def key(i):
+            dx, dy = Fraction(xs[i]) - fpx, Fraction(ys[i]) - fpy
+            return (-dx / ((abs(dx) + dy) or 1), dx * dx + dy * dy)
+
+    return sorted(others, key=key)
+
+
+def graham_scan(xs, ys, stats=None):
+    """
+    Graham Scan without the generator overhead. Returns hull indices in the
+    same (counter-clockwise, pivot first) order as run_graham_scan().
+    `stats`, if given, receives the orientation-test, push and pop counts.
+    """
+    n = len(xs)
+    if n < 3:
+        return []
+    pivot = bottom_left(xs, ys)
+    order = polar_order(xs, ys, pivot)
+    if len(order) < 2:
+        return [pivot] + order
+
+    # Like the generator, the first two sorted points are pushed unchecked
+    stack = [pivot, order[0], order[1]]
+    tests = pops = 0
+    for i in order[2:]:
+        x, y = xs[i], ys[i]
+        while len(stack) > 1:
+            a, b = stack[-2], stack[-1]
+            ax, ay = xs[a], ys[a]
+            tests += 1
+            if (xs[b] - ax) * (y - ay) - (ys[b] - ay) * (x - ax) > 0:
+                break  # Counter-clockwise, stop popping
+            stack.pop()
+            pops += 1
+        stack.append(i)
+
+    if stats is not None:
+        stats.update(orientation_tests=tests, pushes=len(order) + 1, pops=pops)
+    return stack
+
+
+def bottom_left(xs, ys):
+    """Index of the bottom-most, then left-most point (the Graham pivot / Jarvis start)."""
+    if np is not None and len(xs) > 64:
+        Y = np.asarray(ys)
+        bottom = np.flatnonzero(Y == Y.min())
+        X = np.asarray(xs)[bottom]
+        return int(bottom[np.argmin(X)])
+    return min(range(len(xs)), key=lambda i: (ys[i], xs[i]))
+
+
+# --- Andrew's Monotone Chain ---
+
+def lexicographic_order(xs, ys):
+    """Indices sorted by x, then y (one lexsort call with NumPy)."""
+    if np is not None and len(xs) > 64:
+        X, Y = np.asarray(xs), np.asarray(ys)
+        if X.dtype != object and Y.dtype != object:
+            return np.lexsort((Y, X)).tolist()
+    return sorted(range(len(xs)), key=lambda i: (xs[i], ys[i]))
+
+
+def monotone_chain(xs, ys, stats=None):
+    """
+    Andrew's monotone chain. Only needs a lexicographic sort, then builds the
+    lower and upper chains with a stack, popping collinear points.
+    Points strictly above the line from the left-most to the right-most point
+    can only be on the upper chain (and vice versa), so each chain only scans
+    its own side. Returns hull indices counter-clockwise, starting at the
+    left-most point.
+    """
+    n = len(xs)
+    if n < 3:
+        return []
+    if np is not None and n > 64:
+        X, Y = _as_arrays(xs, ys)
+        if X.dtype != object:
+            lower_side, upper_side = _monotone_chain_sides_numpy(X, Y)
+            return _monotone_chain_build(xs, ys, lower_side, upper_side, stats)
+
+    order = lexicographic_order(xs, ys)
+    first, last = order[0], order[-1]
+    fx, fy = xs[first], ys[first]
+    lx, ly = xs[last] - fx, ys[last] - fy
+    lower_side, upper_side = [first], [first]
+    for i in order[1:-1]:
+        side = lx * (ys[i] - fy) - ly * (xs[i] - fx)
+        if side < 0:
+            lower_side.append(i)
+        elif side > 0:
+            upper_side.append(i)
+    lower_side.append(last)
+    upper_side.append(last)
+    return _monotone_chain_build(xs, ys, lower_side, upper_side, stats)
+
+
+def _monotone_chain_sides_numpy(X, Y):
+    """
+    Lexicographic sort plus a vectorized split into lower/upper candidates.
+    Each side also drops the points inside the triangle formed with its
+    extreme (lowest / highest) point, which can never reach that chain.
+    """
+    order = np.lexsort((Y, X))
+    X, Y = X[order], Y[order]
+    fx, fy, lx, ly = X[0], Y[0], X[-1], Y[-1]
+
+    def cross(ax, ay, bx, by):
+        return (bx - ax) * (Y - ay) - (by - ay) * (X - ax)
+
+    side = cross(fx, fy, lx, ly)
+    b = int(np.argmin(Y))  # lowest point, on the lower chain
+    t = int(np.argmax(Y))  # highest point, on the upper chain
+    lower = (side < 0) & ((cross(fx, fy, X[b], Y[b]) <= 0) | (cross(X[b], Y[b], lx, ly) <= 0))
+    upper = (side > 0) & ((cross(lx, ly, X[t], Y[t]) <= 0) | (cross(X[t], Y[t], fx, fy) <= 0))
+    lower[[0, -1]] = True
+    upper[[0, -1]] = True
+    return order[lower].tolist(), order[upper].tolist()
+
+
+def _monotone_chain_build(xs, ys, lower_side, upper_side, stats):
+    tests = pops = 0
+
+    def build(indices):
+        nonlocal tests, pops
+        chain = []
+        for i in indices:
+            x, y = xs[i], ys[i]
+            while len(chain) > 1:
+                a, b = chain[-2], chain[-1]
+                ax, ay = xs[a], ys[a]
+                tests += 1
+                if (xs[b] - ax) * (y - ay) - (ys[b] - ay) * (x - ax) > 0:
+                    break
+                chain.pop()
+                pops += 1
+            chain.append(i)
+        return chain
+
+    lower = build(lower_side)
+    upper = build(reversed(upper_side))
+    hull = lower[:-1] + upper[:-1]
+
+    if stats is not None:
+        stats.update(orientation_tests=tests, pushes=len(lower_side) + len(upper_side), pops=pops)
+    return hull
+
+
+# --- QuickHull ---
+
+def quickhull_split(xs, ys, a, b, candidates):
+    """
+    One QuickHull partition step for the segment a->b and the candidate
+    indices strictly right of it. Returns the farthest candidate c and the
+    candidates strictly right of a->c and of c->b; everything else lies in
+    the triangle a, c, b and is dropped. Distance ties go to the point
+    nearest a, so c is never a collinear (non-vertex) point.
+    """
+    ax, ay = xs[a], ys[a]
+    ex, ey = xs[b] - ax, ys[b] - ay
+    c = max(candidates, key=lambda i: (ey * (xs[i] - ax) - ex * (ys[i] - ay),
+                                       -(ex * (xs[i] - ax) + ey * (ys[i] - ay))))
+    cx, cy = xs[c], ys[c]
+    left, right = [], []
+    for i in candidates:
+        x, y = xs[i], ys[i]
+        if (cy - ay) * (x - ax) - (cx - ax) * (y - ay) > 0:
+            left.append(i)
+        elif (ys[b] - cy) * (x - cx) - (xs[b] - cx) * (y - cy) > 0:
+            right.append(i)
+    return c, left, right
+
+
+def _quickhull_split_numpy(X, Y, a, b, candidates):
+    """quickhull_split() on an index array, with one vectorized pass per test."""
+    ax, ay = X[a], Y[a]
+    ex, ey = X[b] - ax, Y[b] - ay
+    dx, dy = X[candidates] - ax, Y[candidates] - ay
+    dist = ey * dx - ex * dy
+    far = np.flatnonzero(dist == dist.max())
+    if len(far) > 1:
+        far = far[np.argmin(ex * dx[far] + ey * dy[far])]
+    else:
+        far = far[0]
+    c = candidates[far]
+    cx, cy = X[c] - ax, Y[c] - ay
+    left = cy * dx - cx * dy > 0
+    bx, by = X[b] - X[c], Y[b] - Y[c]
+    right = ~left & (by * (dx - cx) - bx * (dy - cy) > 0)
+    return int(c), candidates[left], candidates[right]
+
+
+def quickhull_start(xs, ys):
+    """
+    The left-most and right-most points (lexicographically) and the
+    indices strictly below and above the line between them.
+    """
+    n = len(xs)
+    a = min(range(n), key=lambda i: (xs[i], ys[i]))
+    b = max(range(n), key=lambda i: (xs[i], ys[i]))
+    ax, ay = xs[a], ys[a]
+    ex, ey = xs[b] - ax, ys[b] - ay
+    below, above = [], []
+    for i in range(n):
+        side = ex * (ys[i] - ay) - ey * (xs[i] - ax)
+        if side < 0:
+            below.append(i)
+        elif side > 0:
+            above.append(i)
+    return a, b, below, above
+
+
+def quickhull(xs, ys, stats=None):
+    """
+    QuickHull with an explicit work stack (no recursion limit on big inputs).
+    Each segment keeps only the points strictly outside it; the farthest
+    one becomes a hull vertex and every point inside the new triangle is
+    discarded at once. Returns hull indices in the same order as jarvis_march().
+    `stats`, if given, receives the segment, distance-test and discard counts.
+    """
+    n = len(xs)
+    if n < 3:
+        return []
+
+    X = Y = None
+    if np is not None and n > 64:
+        X, Y = _as_arrays(xs, ys)
+        if X.dtype == object:
+            X = Y = None
+
+    if X is not None:
+        left, right = np.flatnonzero(X == X.min()), np.flatnonzero(X == X.max())
+        a, b = int(left[np.argmin(Y[left])]), int(right[np.argmax(Y[right])])
+        side = (X[b] - X[a]) * (Y - Y[a]) - (Y[b] - Y[a]) * (X - X[a])
+        below, above = np.flatnonzero(side < 0), np.flatnonzero(side > 0)
+        split = lambda s, t, cand: _quickhull_split_numpy(X, Y, s, t, cand)
+    else:
+        a, b, below, above = quickhull_start(xs, ys)
+        split = lambda s, t, cand: quickhull_split(xs, ys, s, t, cand)
+
+    # Segments are popped left to right along the hull (counter-clockwise from a)
+    stack = [(b, a, above), (a, b, below)]
+    hull = []
+    segments = tests = 0
+    while stack:
+        s, t, cand = stack.pop()
+        if len(cand) == 0:
+            hull.append(s)
+            continue
+        segments += 1
+        tests += len(cand)
+        c, left, right = split(s, t, cand)
+        stack.append((c, t, right))
+        stack.append((s, c, left))
+
+    # Same start as Jarvis March: the bottom-most, then left-most vertex
+    first = min(range(len(hull)), key=lambda k: (ys[hull[k]], xs[hull[k]]))
+    hull = hull[first:] + hull[:first]
+
+    if stats is not None:
+        stats.update(segments=segments, distance_tests=tests, discarded=n - len(hull))
+    return hull
+
+
+# --- Chan's Algorithm ---
+
+def chan_mini_hulls(xs, ys, m, indices=None):
+    """
+    Splits `indices` (all points by default) into consecutive groups of `m`
+    and returns each group's hull (point indices, counter-clockwise, no
+    collinear vertices). Groups that are too small or collinear keep their
+    two end points.
+    """
+    if indices is None:
+        indices = range(len(xs))
+    hulls = []
+    for start in range(0, len(indices), m):
+        group = indices[start:start + m]
+        gx, gy = [xs[i] for i in group], [ys[i] for i in group]
+        local = monotone_chain(gx, gy) if len(group) >= 3 else []
+        if not local:
+            local = sorted(range(len(group)), key=lambda i: (gx[i], gy[i]))
+            local = local[:1] + local[-1:] if len(local) > 1 else local
+        hulls.append([group[i] for i in local])
+    return hulls
+
+
+def chan_tangent(xs, ys, hull, p, probes=None):
+    """
+    Binary search on the convex polygon `hull` (indices, counter-clockwise)
+    for the vertex T seen most clockwise from point `p`, so that every
+    vertex lies on or left of P->T. Collinear ties go to the farthest vertex.
+    `p` must lie outside the polygon. Returns T's position in `hull`.
+    `probes`, if given, collects the positions tested along the way.
+    """
+    k = len(hull)
+    px, py = xs[p], ys[p]
+
+    def turn(a, b):
+        # > 0 when hull[b] is counter-clockwise of hull[a] seen from P
+        a, b = hull[a % k], hull[b % k]
+        return (xs[a] - px) * (ys[b] - py) - (ys[a] - py) * (xs[b] - px)
+
+    def dist(a):
+        a = hull[a % k]
+        return (xs[a] - px) ** 2 + (ys[a] - py) ** 2
+
+    def is_min(c):
+        return turn(c - 1, c) <= 0 and turn(c, c + 1) >= 0
+
+    if k <= 3:
+        best = 0
+        for c in range(1, k):
+            if probes is not None:
+                probes.append(c)
+            if turn(best, c) < 0:
+                best = c
+    else:
+        # Seen from P the vertex angles rise to one maximum and fall to one
+        # minimum around the polygon; search [lo, hi] for the minimum.
+        best = None
+        lo, hi = 0, k
+        if probes is not None:
+            probes.append(0)
+        if is_min(0):
+            best = 0
+        while best is None and hi - lo > 1:
+            c = (lo + hi) // 2
+            if probes is not None:
+                probes.append(c)
+            if is_min(c):
+                best = c
+                break
+            c_down = turn(c, c + 1) < 0
+            if turn(lo, lo + 1) < 0:
+                # lo is on the falling side: keep going only while c still falls below it
+                if c_down and turn(lo, c) < 0:
+                    lo = c
+                else:
+                    hi = c
+            else:
+                # lo is on the rising side: the minimum is past c unless c is already rising back
+                if c_down or turn(lo, c) >= 0:
+                    lo = c
+                else:
+                    hi = c
+        if best is None:
+            best = lo if turn(lo, hi) >= 0 else hi % k
+
+    # Collinear tie-break: the farthest vertex on the tangent ray
+    for c in (best - 1, best + 1):
+        if turn(best, c) == 0 and dist(c) > dist(best):
+            best = c % k
+            break
+    return best
+
+
+def chan(xs, ys, stats=None):
+    """
+    Chan's output-sensitive O(n log h) algorithm. For m = 4, 16, 256, ...
+    (squaring each round) it splits the points into groups of m, builds each
+    group's mini-hull, then gift-wraps for at most m steps, taking the next
+    vertex from one binary-search tangent query per mini-hull. A round that
+    does not close the hull within m steps is retried with a larger m, on
+    the mini-hull vertices only (no other point can be on the hull).
+    Returns hull indices in the same order as jarvis_march().
+    `stats`, if given, receives the round, wrap-step and tangent-query counts.
+    """
+    n = len(xs)
+    if n < 3:
+        return []
+    start = bottom_left(xs, ys)
+    counts = {'rounds': 0, 'group_size': 0, 'wrap_steps': 0, 'tangent_queries': 0}
+
+    X = Y = None
+    if np is not None:
+        X, Y = _as_arrays(xs, ys)
+        if X.dtype == object:
+            X = Y = None
+
+    alive = list(range(n)) if X is None else np.arange(n)
+    t = 1
+    while True:
+        m = min(len(alive), 2 ** (2 ** t))
+        counts['rounds'] += 1
+        counts['group_size'] = m
+        if X is not None:
+            hulls, lengths = _chan_mini_hulls_numpy(xs, ys, X, Y, m, alive)
+            hull = _chan_wrap_numpy(X, Y, hulls, lengths, start, m, counts)
+            alive = hulls[hulls >= 0]
+        else:
+            hulls = chan_mini_hulls(xs, ys, m, alive)
+            hull = _chan_wrap(xs, ys, hulls, start, m, counts)
+            alive = [i for mini in hulls for i in mini]
+        if hull is not None:
+            break
+        t += 1
+
+    if stats is not None:
+        stats.update(counts)
+    return hull
+
+
+def _chan_wrap(xs, ys, hulls, start, m, counts):
+    """One round of Chan's algorithm: at most m wrap steps, or None."""
+    g = next(i for i, mini in enumerate(hulls) if start in mini)
+    pos = hulls[g].index(start)
+    hull = []
+    for _ in range(m):
+        p = hulls[g][pos]
+        hull.append(p)
+        px, py = xs[p], ys[p]
+
+        # Own group: the next mini-hull vertex. Other groups: tangent query.
+        candidates = []
+        if len(hulls[g]) > 1:
+            candidates.append((g, (pos + 1) % len(hulls[g])))
+        for other, mini in enumerate(hulls):
+            if other != g:
+                candidates.append((other, chan_tangent(xs, ys, mini, p)))
+        counts['tangent_queries'] += len(hulls) - 1
+
+        best = None
+        for cand in candidates:
+            r = hulls[cand[0]][cand[1]]
+            if best is None:
+                best, q = cand, r
+                continue
+            val = (xs[q] - px) * (ys[r] - py) - (ys[q] - py) * (xs[r] - px)
+            if val < 0 or (val == 0 and (xs[r] - px) ** 2 + (ys[r] - py) ** 2 > (xs[q] - px) ** 2 + (ys[q] - py) ** 2):
+                best, q = cand, r
+
+        counts['wrap_steps'] += 1
+        if best is None:
+            return hull
+        g, pos = best
+        if q == start:
+            return hull
+    return None
+
+
+# Below this many groups the mini-hulls are built one group at a time;
+# above it, all groups advance through their points in lockstep.
+_LOCKSTEP_MIN_GROUPS = 64
+
+
+def _monotone_chain_lockstep(X, Y, groups):
+    """
+    Monotone chain over every row of `groups` (a G x m array of point
+    indices) at once: each row is sorted, then each column is pushed onto
+    all G stacks with vectorized pops.
+    Returns (hulls, lengths): a G x K array of hull indices (counter-clockwise,
+    padded with -1) and each row's hull length.
+    """
+    G, m = groups.shape
+    ordered = np.take_along_axis(groups, np.lexsort((Y[groups], X[groups])), axis=1)
+    OX, OY = X[ordered], Y[ordered]
+    all_rows = np.arange(G)
+
+    def build(columns):
+        stack = np.zeros((G, m), dtype=np.int64)  # column positions in `ordered`
+        top = np.zeros(G, dtype=np.int64)
+        for j in columns:
+            r = all_rows[top >= 2]
+            while len(r):
+                a, b = stack[r, top[r] - 2], stack[r, top[r] - 1]
+                ax, ay = OX[r, a], OY[r, a]
+                cross = (OX[r, b] - ax) * (OY[r, j] - ay) - (OY[r, b] - ay) * (OX[r, j] - ax)
+                r = r[cross <= 0]
+                top[r] -= 1
+                r = r[top[r] >= 2]
+            stack[all_rows, top] = j
+            top += 1
+        return stack, top
+
+    lower, lower_top = build(range(m))
+    upper, upper_top = build(range(m - 1, -1, -1))
+
+    # hull = lower[:-1] + upper[:-1], row by row
+    lower_len, lengths = lower_top - 1, lower_top + upper_top - 2
+    col = np.arange(lengths.max())[None, :]
+    from_upper = np.clip(col - lower_len[:, None], 0, m - 1)
+    cols = np.where(col < lower_len[:, None],
+                    np.take_along_axis(lower, np.minimum(col, m - 1), axis=1),
+                    np.take_along_axis(upper, from_upper, axis=1))
+    hulls = np.take_along_axis(ordered, cols, axis=1)
+    hulls[col >= lengths[:, None]] = -1
+    return hulls, lengths
+
+
+def _chan_mini_hulls_numpy(xs, ys, X, Y, m, alive):
+    """Mini-hulls of the consecutive groups of m in `alive`, packed as (hulls, lengths)."""
+    full = len(alive) // m
+    if full < _LOCKSTEP_MIN_GROUPS:
+        rows = chan_mini_hulls(xs, ys, m, alive.tolist())
+        lengths = np.array([len(r) for r in rows])
+        hulls = np.full((len(rows), lengths.max()), -1, dtype=np.int64)
+        for g, r in enumerate(rows):
+            hulls[g, :len(r)] = r
+        return hulls, lengths
+
+    hulls, lengths = _monotone_chain_lockstep(X, Y, alive[:full * m].reshape(full, m))
+    if full * m < len(alive):
+        # The short last group is built on its own and appended as one more row
+        last = chan_mini_hulls(xs, ys, m, alive[full * m:].tolist())[0]
+        if len(last) > hulls.shape[1]:
+            hulls = np.pad(hulls, ((0, 0), (0, len(last) - hulls.shape[1])), constant_values=-1)
+        row = np.full((1, hulls.shape[1]), -1, dtype=np.int64)
+        row[0, :len(last)] = last
+        hulls = np.vstack([hulls, row])
+        lengths = np.append(lengths, len(last))
+    return hulls, lengths
+
+
+def _chan_tangents_numpy(HX, HY, lengths, width):
+    """
+    chan_tangent() for every mini-hull at once. HX, HY hold the mini-hull
+    coordinates relative to P, flattened from rows of `width` that repeat
+    each hull cyclically, shifted by one (column j + 1 is vertex j mod L),
+    so positions -1 .. L can be read without a modulo.
+    Returns the tangent positions.
+    """
+    G = len(lengths)
+    rows = np.arange(G)
+    base = rows * width + 1
+
+    def turn(r, a, b):
+        a, b = base[r] + a, base[r] + b
+        return HX[a] * HY[b] - HY[a] * HX[b]
+
+    def dist(r, a):
+        a = base[r] + a
+        return HX[a] ** 2 + HY[a] ** 2
+
+    def is_min(r, c):
+        return (turn(r, c - 1, c) <= 0) & (turn(r, c, c + 1) >= 0)
+
+    best = np.full(G, -1, dtype=np.int64)
+
+    # Up to three vertices: test them all
+    small = rows[lengths <= 3]
+    best[small] = 0
+    for c in (1, 2):
+        r = small[lengths[small] > c]
+        better = turn(r, best[r], c) < 0
+        best[r[better]] = c
+
+    # Larger mini-hulls: the binary search of chan_tangent(), one row per group
+    lo = np.zeros(G, dtype=np.int64)
+    hi = lengths.copy()
+    r = rows[lengths > 3]
+    found = is_min(r, 0)
+    best[r[found]] = 0
+    r = r[~found]
+    while len(r):
+        r = r[hi[r] - lo[r] > 1]
+        if not len(r):
+            break
+        r_lo = lo[r]
+        c = (r_lo + hi[r]) // 2
+        found = is_min(r, c)
+        best[r[found]] = c[found]
+        keep = ~found
+        r, r_lo, c = r[keep], r_lo[keep], c[keep]
+        c_down = turn(r, c, c + 1) < 0
+        lo_down = turn(r, r_lo, r_lo + 1) < 0
+        c_below_lo = turn(r, r_lo, c) < 0
+        move_lo = np.where(lo_down, c_down & c_below_lo, c_down | ~c_below_lo)
+        lo[r[move_lo]] = c[move_lo]
+        hi[r[~move_lo]] = c[~move_lo]
+    r = rows[best < 0]
+    best[r] = np.where(turn(r, lo[r], hi[r]) >= 0, lo[r], hi[r] % lengths[r])
+
+    # Collinear tie-break: the farthest vertex on the tangent ray
+    moved = np.zeros(G, dtype=bool)
+    for step in (-1, 1):
+        nb = best + step
+        take = ~moved & (turn(rows, best, nb) == 0) & (dist(rows, nb) > dist(rows, best))
+        best[take] = nb[take] % lengths[take]
+        moved |= take
+    return best
+
+
+def _chan_wrap_numpy(X, Y, hulls, lengths, start, m, counts):
+    """_chan_wrap() with the tangent queries of each step done in one batch."""
+    G, K = hulls.shape
+    all_groups = np.arange(G)
+    # Each row repeated cyclically from vertex -1 to vertex K (see _chan_tangents_numpy)
+    cyclic = np.take_along_axis(hulls, np.arange(-1, K + 1)[None, :] % lengths[:, None], axis=1)
+    HX, HY = X[cyclic].ravel(), Y[cyclic].ravel()
+    g, pos = (int(i) for i in np.argwhere(hulls == start)[0])
+    hull = []
+    for _ in range(m):
+        p = int(hulls[g, pos])
+        hull.append(p)
+
+        best = _chan_tangents_numpy(HX - X[p], HY - Y[p], lengths, K + 2)
+        counts['tangent_queries'] += G - 1
+        # Own group: the next mini-hull vertex
+        best[g] = (pos + 1) % lengths[g]
+        groups = all_groups if lengths[g] > 1 else np.delete(all_groups, g)
+        cand = hulls[groups, best[groups]]
+        counts['wrap_steps'] += 1
+        if not len(cand):
+            return hull
+
+        # Most clockwise candidate, farthest on collinear ties (as in jarvis_march_numpy)
+        dx, dy = X[cand] - X[p], Y[cand] - Y[p]
+        j = 0
+        while True:
+            cross = dx[j] * dy - dy[j] * dx
+            k = int(np.argmin(cross))
+            if cross[k] >= 0:
+                break
+            j = k
+        collinear = np.flatnonzero(dx[j] * dy - dy[j] * dx == 0)
+        j = int(collinear[np.argmax(dx[collinear] ** 2 + dy[collinear] ** 2)])
+
+        g, pos = int(groups[j]), int(best[groups[j]])
+        if int(cand[j]) == start:
+            return hull
+    return None
+
+
+# --- Batched hulls (many independent groups) ---
+
+def _group_hull(xs, ys, lo, hi):
+    """Hull of points lo..hi-1 alone; groups of one or two points are their own hull, left-most first."""
+    if hi - lo < 3:
+        return sorted(range(lo, hi), key=lambda i: (xs[i], ys[i]))
+    return [lo + i for i in monotone_chain(xs[lo:hi], ys[lo:hi])]
+
+
+def monotone_chain_batch(xs, ys, offsets, stats=None):
+    """
+    Hulls of many independent groups in CSR layout: group g is the points
+    offsets[g] to offsets[g + 1] - 1 of (xs, ys). With NumPy, groups are
+    bucketed by size rounded up to a power of two (padded by repeating a
+    member, which the chains absorb), and each bucket is built in one
+    lockstep monotone chain, so the per-group Python cost disappears.
+    Returns (hull_indices, hull_offsets) in the same CSR form, every hull
+    counter-clockwise from its left-most point as monotone_chain() gives it.
+    """
+    G = len(offsets) - 1
+    X = Y = None
+    if np is not None and G >= _LOCKSTEP_MIN_GROUPS:
+        X, Y = _as_arrays(xs, ys)
+        if X.dtype == object:
+            X = Y = None
+    if X is None:
+        hulls = [_group_hull(xs, ys, offsets[g], offsets[g + 1]) for g in range(G)]
+        hull_offsets = [0]
+        for hull in hulls:
+            hull_offsets.append(hull_offsets[-1] + len(hull))
+        if stats is not None:
+            stats.update(groups=G, lockstep_buckets=0, hull_vertices=hull_offsets[-1])
+        return [i for hull in hulls for i in hull], hull_offsets
+
+    offsets = np.asarray(offsets, dtype=np.int64)
+    sizes = np.diff(offsets)
+    width = np.maximum(sizes, 4)  # The chains need a few columns to close even a lone point
+    bucket = 1 << np.ceil(np.log2(width)).astype(np.int64)
+    lengths = np.zeros(G, dtype=np.int64)
+    results = []
+    for m in np.unique(bucket).tolist():
+        rows = np.flatnonzero((bucket == m) & (sizes > 0))
+        if len(rows) == 0:
+            continue
+        if len(rows) < _LOCKSTEP_MIN_GROUPS:
+            # Too few groups of this size to be worth a lockstep pass
+            for g in rows.tolist():
+                hull = _group_hull(X, Y, int(offsets[g]), int(offsets[g + 1]))
+                lengths[g] = len(hull)
+                results.append((np.array([g]), np.array([hull], dtype=np.int64).reshape(1, -1)))
+            continue
+        col = np.arange(m)
+        groups = offsets[rows, None] + np.minimum(col, sizes[rows, None] - 1)
+        hulls, counts = _monotone_chain_lockstep(X, Y, groups)
+        lengths[rows] = np.minimum(counts, sizes[rows])  # A lone point comes back twice
+        results.append((rows, hulls))
+
+    hull_offsets = np.concatenate(([0], np.cumsum(lengths)))
+    hull_indices = np.empty(hull_offsets[-1], dtype=np.int64)
+    for rows, hulls in results:
+        col = np.arange(hulls.shape[1])
+        filled = col < lengths[rows, None]
+        hull_indices[(hull_offsets[rows, None] + col)[filled]] = hulls[filled]
+    if stats is not None:
+        stats.update(groups=G, lockstep_buckets=sum(len(r) >= _LOCKSTEP_MIN_GROUPS for r, _ in results),
+                     hull_vertices=int(hull_offsets[-1]))
+    return hull_indices, hull_offsets
+
+
+# --- Divide and Conquer (Preparata-Hong) ---
+
+# Leaves of the recursion; all of them are hulled together in lockstep
+_DC_LEAF_SIZE = 64
+
+
+def dc_leaf_hull(xs, ys, indices):
+    """
+    Hull of a few points given in lexicographic order (monotone chain),
+    counter-clockwise from the first one. One or two points are their own
+    hull; collinear points keep only their two ends.
+    """
+    if len(indices) < 3:
+        return list(indices)
+
+    def build(chain_order):
+        chain = []
+        for i in chain_order:
+            while len(chain) > 1:
+                a, b = chain[-2], chain[-1]
+                if (xs[b] - xs[a]) * (ys[i] - ys[a]) - (ys[b] - ys[a]) * (xs[i] - xs[a]) > 0:
+                    break
+                chain.pop()
+            chain.append(i)
+        return chain
+
+    return build(indices)[:-1] + build(reversed(indices))[:-1]
+
+
+def dc_bridge(xs, ys, left, right, lower, trace=None):
+    """
+    Walks to the lower (or upper) common tangent of two hulls, `left` lying
+    lexicographically before `right`, both counter-clockwise from their
+    smallest point. Starts from left's last and right's first point and
+    alternately advances each end while the next vertex is on the wrong
+    side of the bridge (or collinear with it but farther out).
+    Returns the bridge as (position in left, position in right, steps);
+    `trace`, if given, receives every (position, position) visited.
+    """
+    na, nb = len(left), len(right)
+    ia = max(range(na), key=lambda k: (xs[left[k]], ys[left[k]]))
+    ib = 0
+    # Lower: a turns clockwise, b counter-clockwise, nothing may be right of a->b
+    step_a, step_b, sign = (-1, 1, 1) if lower else (1, -1, -1)
+
+    def outside(a, b, c, moving):
+        """True if c, a neighbour of the bridge end `moving` (a or b), should replace it."""
+        o = sign * ((xs[b] - xs[a]) * (ys[c] - ys[a]) - (ys[b] - ys[a]) * (xs[c] - xs[a]))
+        if o != 0:
+            return o < 0
+        fixed = b if moving == a else a
+        return (xs[c] - xs[fixed]) ** 2 + (ys[c] - ys[fixed]) ** 2 > (xs[moving] - xs[fixed]) ** 2 + (ys[moving] - ys[fixed]) ** 2
+
+    if trace is not None:
+        trace.append((ia, ib))
+    steps = 0
+    moved = True
+    while moved:
+        moved = False
+        while na > 1 and outside(left[ia], right[ib], left[(ia + step_a) % na], left[ia]):
+            ia = (ia + step_a) % na
+            moved = True
+            steps += 1
+            if trace is not None:
+                trace.append((ia, ib))
+        while nb > 1 and outside(left[ia], right[ib], right[(ib + step_b) % nb], right[ib]):
+            ib = (ib + step_b) % nb
+            moved = True
+            steps += 1
+            if trace is not None:
+                trace.append((ia, ib))
+    return ia, ib, steps
+
+
+def dc_stitch(left, right, lower, upper):
+    """
+    Joins two hulls along their bridges (each a (position in left, position
+    in right) pair): left from the upper to the lower bridge, then right
+    from the lower to the upper one. Counter-clockwise from left[0].
+    """
+    (la, lb), (ua, ub) = lower, upper
+    na, nb = len(left), len(right)
+    merged = [left[(ua + k) % na] for k in range((la - ua) % na + 1)]
+    merged += [right[(lb + k) % nb] for k in range((ub - lb) % nb + 1)]
+    first = merged.index(left[0])
+    return merged[first:] + merged[:first]
+
+
+def dc_merge(xs, ys, left, right, stats=None):
+    """Merges two lexicographically separated hulls in O(len(left) + len(right))."""
+    la, lb, lower_steps = dc_bridge(xs, ys, left, right, lower=True)
+    ua, ub, upper_steps = dc_bridge(xs, ys, left, right, lower=False)
+    if stats is not None:
+        stats['merges'] = stats.get('merges', 0) + 1
+        stats['bridge_steps'] = stats.get('bridge_steps', 0) + lower_steps + upper_steps
+    return dc_stitch(left, right, (la, lb), (ua, ub))
+
+
+def divide_and_conquer(xs, ys, stats=None):
+    """
+    Preparata-Hong divide and conquer. One lexicographic sort, then the
+    sorted points are cut into leaves of _DC_LEAF_SIZE, and neighbouring
+    hulls are merged pairwise, level by level, with dc_merge(). The leaves
+    are independent, so with NumPy they are all hulled at once in lockstep.
+    Returns hull indices counter-clockwise from the left-most point.
+    """
+    n = len(xs)
+    if n < 3:
+        return []
+    order = lexicographic_order(xs, ys)
+    full = n // _DC_LEAF_SIZE
+
+    hulls = None
+    if np is not None and full >= _LOCKSTEP_MIN_GROUPS:
+        X, Y = _as_arrays(xs, ys)
+        if X.dtype != object:
+            groups = np.asarray(order[:full * _DC_LEAF_SIZE], dtype=np.int64).reshape(full, _DC_LEAF_SIZE)
+            rows, lengths = _monotone_chain_lockstep(X, Y, groups)
+            hulls = [row[:length] for row, length in zip(rows.tolist(), lengths.tolist())]
+            xs, ys = X.tolist(), Y.tolist()  # The merges index single points
+            if full * _DC_LEAF_SIZE < n:
+                hulls.append(dc_leaf_hull(xs, ys, order[full * _DC_LEAF_SIZE:]))
+    if hulls is None:
+        hulls = [dc_leaf_hull(xs, ys, order[k:k + _DC_LEAF_SIZE]) for k in range(0, n, _DC_LEAF_SIZE)]
+
+    counts = {'leaves': len(hulls)}
+    while len(hulls) > 1:
+        merged = [dc_merge(xs, ys, a, b, counts) for a, b in zip(hulls[0::2], hulls[1::2])]
+        if len(hulls) % 2:
+            merged.append(hulls[-1])
+        hulls = merged
+
+    if stats is not None:
+        stats.update(counts)
+    return hulls[0]
+
+
+# --- Kirkpatrick-Seidel (marriage before conquest) ---
+
+# Candidate sets at least this large find their bridge with NumPy
+_KS_VECTOR_MIN = 64
+
+# Bound on the rounding error of a float height or pair side below, relative
+# to the magnitude of its terms (a few roundings, with a wide margin)
+_KS_FLOAT_ERR = 16 * 2.0 ** -53
+
+
+def _kth_smallest(values, k):
+    """k-th smallest of `values` (0-based) by randomized selection, expected O(n)."""
+    values = list(values)
+    while True:
+        pivot = random.choice(values)
+        lower = [v for v in values if v < pivot]
+        if k < len(lower):
+            values = lower
+            continue
+        equal = sum(1 for v in values if v == pivot)
+        if k < len(lower) + equal:
+            return pivot
+        k -= len(lower) + equal
+        values = [v for v in values if v > pivot]
+
+
+def ks_bridge(xs, ys, candidates, xm, trace=None):
+    """
+    Upper bridge over the vertical line x = xm: the upper hull edge (i, j)
+    of `candidates` with xs[i] <= xm < xs[j]. The candidates are paired up
+    and the median pair slope K is picked by randomized selection; the
+    points a line of slope K touches from above either straddle xm (and
+    are the bridge) or tell which side of K the bridge slope lies, so one
+    point of every pair on the other side is pruned. Each round drops a
+    constant fraction of the candidates, so the bridge costs O(n).
+    `trace`, if given, receives (candidates, K, touching points, pruned)
+    per round, K as a (dy, dx) pair.
+
+    Float coordinates are compared as exact fractions: with rounded heights
+    the touching set can miss a point and prune a bridge end.
+    """
+    cand = list(candidates)
+    exact = Fraction if any(isinstance(xs[i], float) or isinstance(ys[i], float) for i in cand) else _same
+    while True:
+        if len(cand) == 2:
+            i, j = sorted(cand, key=lambda p: xs[p])
+            return i, j
+        kept, pairs = cand[len(cand) - len(cand) % 2:], []
+        for p, q in zip(cand[0::2], cand[1::2]):
+            if xs[p] > xs[q]:
+                p, q = q, p
+            if xs[p] == xs[q]:
+                kept.append(p if ys[p] > ys[q] else q)  # Only the higher one can be on the upper hull
+            else:
+                pairs.append((p, q))
+        if not pairs:
+            cand = kept
+            continue
+
+        slopes = [(ys[q] - ys[p]) / (xs[q] - xs[p]) for p, q in pairs]
+        median = _kth_smallest(slopes, len(slopes) // 2)
+        p, q = pairs[slopes.index(median)]
+        dy, dx = exact(ys[q]) - exact(ys[p]), exact(xs[q]) - exact(xs[p])  # K, kept exact for the comparisons below
+
+        height = {i: exact(ys[i]) * dx - dy * exact(xs[i]) for i in cand}
+        top = max(height.values())
+        touching = [i for i in cand if height[i] == top]
+        pk, pm = min(touching, key=lambda i: xs[i]), max(touching, key=lambda i: xs[i])
+        if xs[pk] <= xm < xs[pm]:
+            if trace is not None:
+                trace.append((cand, (dy, dx), (pk, pm), []))
+            return pk, pm
+
+        steeper_bridge = xs[pk] > xm  # The bridge slope is above K, else below it
+        pruned = []
+        for p, q in pairs:
+            side = (exact(ys[q]) - exact(ys[p])) * dx - dy * (exact(xs[q]) - exact(xs[p]))  # Sign of slope(p, q) - K
+            if steeper_bridge and side <= 0:
+                kept.append(p)
+                pruned.append(q)
+            elif not steeper_bridge and side >= 0:
+                kept.append(q)
+                pruned.append(p)
+            else:
+                kept += (p, q)
+        if trace is not None:
+            trace.append((cand, (dy, dx), (pk, pm), pruned))
+        cand = kept
+
+
+def _same(v):
+    return v
+
+
+def _exact_cross(X, Y, a, b, c, d):
+    """(Y[b] - Y[a]) * (X[d] - X[c]) - (X[b] - X[a]) * (Y[d] - Y[c]) in exact arithmetic."""
+    fx, fy = (lambda i: Fraction(float(X[i]))), (lambda i: Fraction(float(Y[i])))
+    return (fy(b) - fy(a)) * (fx(d) - fx(c)) - (fx(b) - fx(a)) * (fy(d) - fy(c))
+
+
+def _ks_bridge_numpy(X, Y, cand, xm):
+    """
+    ks_bridge() with each round's pairing, median slope and pruning
+    vectorized. On float input, the heights near the top and the pair
+    sides near zero (within rounding error) are settled exactly.
+    """
+    floats = X.dtype.kind == 'f'
+    while len(cand) >= _KS_VECTOR_MIN:
+        half = len(cand) // 2
+        p, q = cand[:half], cand[half:2 * half]
+        swap = X[p] > X[q]
+        p, q = np.where(swap, q, p), np.where(swap, p, q)
+        vertical = X[p] == X[q]
+        higher = np.where(Y[p[vertical]] > Y[q[vertical]], p[vertical], q[vertical])
+        p, q = p[~vertical], q[~vertical]
+        kept = [cand[2 * half:], higher]
+        if len(p) == 0:
+            cand = np.concatenate(kept)
+            continue
+
+        slopes = (Y[q] - Y[p]) / (X[q] - X[p])
+        m = np.argpartition(slopes, len(slopes) // 2)[len(slopes) // 2]
+        dy, dx = Y[q[m]] - Y[p[m]], X[q[m]] - X[p[m]]
+
+        height = Y[cand] * dx - dy * X[cand]
+        if floats:
+            err = _KS_FLOAT_ERR * (np.abs(Y[cand] * dx) + np.abs(dy * X[cand])).max()
+            near = cand[height >= height.max() - 2 * err]
+            # Exact height relative to pair m's line: cross of (p, q) against (p, i)
+            exact_height = {int(i): -_exact_cross(X, Y, p[m], q[m], p[m], i) for i in near}
+            top = max(exact_height.values())
+            touching = np.array([i for i, h in exact_height.items() if h == top])
+        else:
+            touching = cand[height == height.max()]
+        pk, pm = touching[np.argmin(X[touching])], touching[np.argmax(X[touching])]
+        if X[pk] <= xm < X[pm]:
+            return int(pk), int(pm)
+
+        side = (Y[q] - Y[p]) * dx - dy * (X[q] - X[p])
+        if floats:
+            err = _KS_FLOAT_ERR * (np.abs((Y[q] - Y[p]) * dx) + np.abs(dy * (X[q] - X[p])))
+            side = side.copy()
+            for k in np.flatnonzero(np.abs(side) <= err):
+                side[k] = np.sign(float(-_exact_cross(X, Y, p[m], q[m], p[k], q[k])))
+        if X[pk] > xm:
+            keep_p, keep_q = np.ones(len(p), dtype=bool), side > 0
+        else:
+            keep_p, keep_q = side < 0, np.ones(len(p), dtype=bool)
+        cand = np.concatenate(kept + [p[keep_p], q[keep_q]])
+    return ks_bridge(X, Y, cand.tolist(), xm)
+
+
+def _ks_upper_hull(X, Y, vectorized, stats, trace):
+    """
+    Upper hull, left to right, by marriage before conquest: the bridge over
+    the median x is found first, then only the points above each new hull
+    edge, strictly left of its left end or right of its right end, are
+    recursed on. `vectorized` says X and Y are NumPy arrays.
+    """
+    n = len(X)
+    if vectorized:
+        left, right = np.flatnonzero(X == X.min()), np.flatnonzero(X == X.max())
+        first, last = int(left[np.argmax(Y[left])]), int(right[np.argmax(Y[right])])
+    else:
+        x_min, x_max = min(X), max(X)
+        first = max((i for i in range(n) if X[i] == x_min), key=lambda i: Y[i])
+        last = max((i for i in range(n) if X[i] == x_max), key=lambda i: Y[i])
+    if first == last:
+        return [first]
+
+    def above(a, b, pool):
+        """Points of `pool` strictly between a and b in x and strictly above the line a->b."""
+        if vectorized:
+            side = (X[b] - X[a]) * (Y[pool] - Y[a]) - (Y[b] - Y[a]) * (X[pool] - X[a])
+            return pool[(side > 0) & (X[pool] > X[a]) & (X[pool] < X[b])]
+        return [i for i in pool if X[a] < X[i] < X[b] and
+                (X[b] - X[a]) * (Y[i] - Y[a]) - (Y[b] - Y[a]) * (X[i] - X[a]) > 0]
+
+    # Tasks: ('emit', v) appends a vertex; ('solve', a, b, inner) appends the
+    # vertices strictly between hull vertices a and b, then b
+    hull = [first]
+    stack = [('solve', first, last, above(first, last, np.arange(n) if vectorized else range(n)))]
+    while stack:
+        task = stack.pop()
+        if task[0] == 'emit':
+            hull.append(task[1])
+            continue
+        _, a, b, inner = task
+        if len(inner) == 0:
+            hull.append(b)
+            continue
+
+        # Median x of the points between a and b, so the bridge has an end on each side
+        k = (len(inner) - 1) // 2
+        if vectorized:
+            xm = np.partition(X[inner], k)[k]
+            T = np.concatenate(([a], inner, [b]))
+            i, j = _ks_bridge_numpy(X, Y, T, xm) if len(T) >= _KS_VECTOR_MIN else ks_bridge(X, Y, T.tolist(), xm)
+            i, j = int(i), int(j)
+        else:
+            xm = _kth_smallest([X[v] for v in inner], k)
+            T = [a] + list(inner) + [b]
+            rounds = [] if trace is not None else None
+            i, j = ks_bridge(X, Y, T, xm, rounds)
+            if trace is not None:
+                trace.append((a, b, T, xm, rounds, (i, j)))
+        if stats is not None:
+            stats['bridges'] = stats.get('bridges', 0) + 1
+
+        if j != b:
+            stack.append(('solve', j, b, above(j, b, inner)))
+        stack.append(('emit', j))
+        if i != a:
+            stack.append(('solve', a, i, above(a, i, inner)))
+    return hull
+
+
+def kirkpatrick_seidel(xs, ys, stats=None, trace=None):
+    """
+    Kirkpatrick-Seidel "ultimate" planar hull, O(n log h): the upper hull
+    as above, and the lower hull as the upper hull of the points mirrored
+    in the x axis. Returns hull indices counter-clockwise from the
+    left-most point, like monotone_chain(). `trace`, if given (pure Python
+    path only), receives ('upper' or 'lower', a, b, candidates, xm, rounds,
+    bridge) for every bridge, with rounds as ks_bridge() reports them (in
+    mirrored coordinates for the lower hull).
+    """
+    n = len(xs)
+    if n < 3:
+        return []
+    vectorized = False
+    if np is not None and n > 64 and trace is None:
+        X, Y = _as_arrays(xs, ys)
+        vectorized = X.dtype != object
+    if vectorized:
+        flipped = -Y
+    else:
+        X, Y = xs, ys
+        flipped = [-y for y in ys]
+
+    counts = {}
+    upper_trace = [] if trace is not None else None
+    lower_trace = [] if trace is not None else None
+    upper = _ks_upper_hull(X, Y, vectorized, counts, upper_trace)
+    lower = _ks_upper_hull(X, flipped, vectorized, counts, lower_trace)
+    if trace is not None:
+        trace += [('lower',) + t for t in lower_trace] + [('upper',) + t for t in upper_trace]
+
+    back = upper[::-1]
+    if back[0] == lower[-1]:
+        back = back[1:]
+    if back and back[-1] == lower[0]:
+        back = back[:-1]
+    if stats is not None:
+        stats.update(counts)
+    return lower + back
+
+
+# --- Approximate hull (Bentley-Faust-Preparata) ---
+
+def approximate_hull(xs, ys, stats=None, strips=64, epsilon=None):
+    """
+    Bentley-Faust-Preparata approximation. The x-range is cut into `strips`
+    vertical strips (or as many as needed for strips no wider than
+    `epsilon`), only the lowest and highest point of each strip (plus the
+    extreme left and right points) are kept, and their exact hull is
+    returned. O(n + k): every input point is within one strip width of the
+    result, which `stats` receives as 'error_bound' along with the strip
+    and candidate counts.
+    """
+    n = len(xs)
+    if n < 3:
+        return []
+
+    X = Y = None
+    if np is not None and n > 64:
+        X, Y = _as_arrays(xs, ys)
+        if X.dtype == object:
+            X = Y = None
+    x_min, x_max = (X.min(), X.max()) if X is not None else (min(xs), max(xs))
+    width = x_max - x_min
+    if epsilon is not None:
+        strips = max(1, math.ceil(width / epsilon))
+    strips = max(1, int(strips))
+    if strips >= n:
+        # As many strips as points: the exact hull is no more work
+        if stats is not None:
+            stats.update(strips=strips, candidates=n, error_bound=0.0)
+        return monotone_chain(xs, ys)
+
+    if X is not None:
+        candidates = _strip_extremes_numpy(X, Y, strips, x_min, x_max)
+    else:
+        lowest, highest = {}, {}
+        for i in range(n):
+            s = min(int((xs[i] - x_min) * strips // width), strips - 1) if width else 0
+            if s not in lowest or ys[i] < ys[lowest[s]]:
+                lowest[s] = i
+            if s not in highest or ys[i] > ys[highest[s]]:
+                highest[s] = i
+        ends = [i for i in range(n) if xs[i] == x_min or xs[i] == x_max]
+        candidates = set(lowest.values()) | set(highest.values())
+        for x_end in (x_min, x_max):
+            column = [i for i in ends if xs[i] == x_end]
+            candidates.add(min(column, key=lambda i: ys[i]))
+            candidates.add(max(column, key=lambda i: ys[i]))
+        candidates = sorted(candidates)
+
+    local = monotone_chain([xs[i] for i in candidates], [ys[i] for i in candidates])
+    if stats is not None:
+        stats.update(strips=strips, candidates=len(candidates), error_bound=float(width) / strips)
+    return [candidates[i] for i in local]
+
+
+def _strip_extremes_numpy(X, Y, strips, x_min, x_max):
+    """Indices of the lowest and highest point per strip, and of the left and right end columns."""
+    width = x_max - x_min
+    if width == 0:
+        strip = np.zeros(len(X), dtype=np.int64)
+    elif X.dtype.kind == 'i':
+        strip = np.minimum((X - x_min) * strips // width, strips - 1)
+    else:
+        strip = np.minimum(((X - x_min) * (strips / width)).astype(np.int64), strips - 1)
+
+    picked = []
+    for reduce, start in ((np.minimum, Y.max()), (np.maximum, Y.min())):
+        best = np.full(strips, start, dtype=Y.dtype)
+        reduce.at(best, strip, Y)
+        hits = np.flatnonzero(Y == best[strip])
+        _, first = np.unique(strip[hits], return_index=True)
+        picked.append(hits[first])
+    for x_end in (x_min, x_max):
+        column = np.flatnonzero(X == x_end)
+        picked.append(column[[np.argmin(Y[column]), np.argmax(Y[column])]])
+    return np.unique(np.concatenate(picked)).tolist()
+
+
+# --- Dynamic hull updates ---
+
+def triangle_points(xs, ys, u, v, w):
+    """
+    Indices of the points in the counter-clockwise triangle of the coordinate
+    pairs u, v, w, edges u-v and v-w included, edge w-u excluded. When hull
+    vertex v is deleted (u and w being its neighbours), these are the only
+    points that can become new vertices.
+    """
+    (ux, uy), (vx, vy), (wx, wy) = u, v, w
+    n = len(xs)
+    if np is not None and n > 64:
+        X, Y = _as_arrays(xs, ys)
+        if X.dtype != object:
+            inside = (vx - ux) * (Y - uy) - (vy - uy) * (X - ux) >= 0
+            inside &= (wx - vx) * (Y - vy) - (wy - vy) * (X - vx) >= 0
+            inside &= (ux - wx) * (Y - wy) - (uy - wy) * (X - wx) > 0
+            return np.flatnonzero(inside).tolist()
+    return [i for i in range(n)
+            if (vx - ux) * (ys[i] - uy) - (vy - uy) * (xs[i] - ux) >= 0
+            and (wx - vx) * (ys[i] - vy) - (wy - vy) * (xs[i] - vx) >= 0
+            and (ux - wx) * (ys[i] - wy) - (uy - wy) * (xs[i] - wx) > 0]
@@ -0,0 +1,286 @@
+# kinetic_hull.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Kinetic convex hull for points moving along straight trajectories
+# p(t) = p0 + v * t. Instead of recomputing the hull every frame, the
+# structure holds certificates (orientation tests that are true for the
+# current combinatorial hull), schedules the time each one fails in a
+# priority queue, and repairs the hull locally only when one does.
+import heapq
+import hull_kernels
+
+# Relative tolerance under which an orientation counts as zero; its sign is
+# then taken from where the certificate is heading (derivative), not from
+# rounding noise.
+_ZERO_TOL = 1e-9
+
+
+class KineticHull:
+    """
+    Kinetic hull over a fan triangulation from a root hull vertex r: the
+    triangles (r, a, next[a]) cover the hull, and every interior point is
+    filed under the triangle containing it.
+
+    Certificates:
+      - each hull vertex b is convex: orient(prev[b], b, next[b]) >= 0
+      - each interior point p in triangle (r, a, b) is left of the hull
+        edge a->b and between the rays r->a and r->b
+
+    A failure is one combinatorial change (a vertex caves in, a point
+    breaks out through a hull edge, or a point crosses into the adjacent
+    fan triangle), repaired by re-certifying only the points of the
+    triangles involved. If the root itself stops being a vertex, or the
+    hull degenerates to three points or fewer, the structure is rebuilt.
+    """
+
+    def __init__(self, xs, ys, vxs, vys):
+        self.x0 = [float(x) for x in xs]
+        self.y0 = [float(y) for y in ys]
+        self.vx = [float(v) for v in vxs]
+        self.vy = [float(v) for v in vys]
+        self.n = len(self.x0)
+        self.now = 0.0
+        self.stats = {'events': 0, 'vertex_events': 0, 'breakouts': 0, 'fan_moves': 0, 'rebuilds': 0}
+        self._build()
+
+    # --- Trajectories ---
+
+    def positions(self, t=None):
+        """Point coordinates (xs, ys) at time t (the current time by default)."""
+        t = self.now if t is None else t
+        return ([x + v * t for x, v in zip(self.x0, self.vx)],
+                [y + v * t for y, v in zip(self.y0, self.vy)])
+
+    def _at(self, i):
+        t = self.now
+        return self.x0[i] + self.vx[i] * t, self.y0[i] + self.vy[i] * t
+
+    def _failure_time(self, a, b, c):
+        """
+        First time >= now at which orient(a, b, c), a quadratic in t for
+        linear motion, turns negative; None if it never does.
+        """
+        (ax, ay), (bx, by), (cx, cy) = self._at(a), self._at(b), self._at(c)
+        d1x, d1y, d2x, d2y = bx - ax, by - ay, cx - ax, cy - ay
+        e1x, e1y = self.vx[b] - self.vx[a], self.vy[b] - self.vy[a]
+        e2x, e2y = self.vx[c] - self.vx[a], self.vy[c] - self.vy[a]
+        # f(s) = C + B s + A s^2, with s the time from now
+        C = d1x * d2y - d1y * d2x
+        B = d1x * e2y - d1y * e2x + e1x * d2y - e1y * d2x
+        A = e1x * e2y - e1y * e2x
+
+        tol = _ZERO_TOL * (abs(d1x * d2y) + abs(d1y * d2x))
+        if C < -tol:
+            return self.now
+        if C <= tol:
+            # On the boundary right now: fails at once if heading outwards,
+            # otherwise at the other root (if the parabola comes back down)
+            if B < 0 or (B == 0 and A < 0):
+                return self.now
+            return self.now - B / A if A < 0 else None
+        if A == 0:
+            return self.now - C / B if B < 0 else None
+        disc = B * B - 4 * A * C
+        if disc <= 0:
+            return None # Opens upwards and never reaches zero
+        root = disc ** 0.5
+        s1, s2 = sorted(((-B - root) / (2 * A), (-B + root) / (2 * A)))
+        if A > 0:
+            # Negative between the roots, which share a sign since C > 0
+            return self.now + s1 if s1 > 0 else None
+        return self.now + s2 # Roots straddle zero; negative after the larger one
+
+    # --- Structure ---
+
+    def _build(self):
+        """(Re)builds the hull, the fan and every certificate at the current time."""
+        self._next, self._prev = {}, {}
+        self._tri = {}        # interior point -> key vertex a of its triangle (r, a, next[a])
+        self._members = {}    # key vertex -> interior points in its triangle
+        self._version = {}
+        self._queue = []
+        self._seq = 0
+
+        xs, ys = self.positions()
+        hull = hull_kernels.monotone_chain(xs, ys) if self.n >= 3 else []
+        self.degenerate = len(hull) < 3
+        if self.degenerate:
+            self._hull_cache = hull or list(range(self.n))
+            return
+
+        self.root = r = hull[0]
+        for a, b in zip(hull, hull[1:] + hull[:1]):
+            self._next[a], self._prev[b] = b, a
+        for a in hull[1:-1]:
+            self._members[a] = set()
+
+        # File every interior point by binary search over the fan rays
+        fan = hull[1:-1]
+        on_hull = set(hull)
+        rx, ry = xs[r], ys[r]
+        for p in range(self.n):
+            if p in on_hull:
+                continue
+            lo, hi = 0, len(fan) - 1
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                h = fan[mid]
+                if (xs[h] - rx) * (ys[p] - ry) - (ys[h] - ry) * (xs[p] - rx) >= 0:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            self._tri[p] = fan[lo]
+            self._members[fan[lo]].add(p)
+
+        for b in hull:
+            self._schedule_vertex(b)
+        for p in self._tri:
+            self._schedule_point(p)
+
+    def hull(self):
+        """Current hull vertices (indices), counter-clockwise."""
+        if self.degenerate:
+            return list(self._hull_cache)
+        hull, v = [self.root], self._next[self.root]
+        while v != self.root:
+            hull.append(v)
+            v = self._next[v]
+        return hull
+
+    # --- Certificates ---
+
+    def _push(self, key, when, kind):
+        version = self._version.get(key, 0) + 1
+        self._version[key] = version
+        if when is not None:
+            self._seq += 1
+            heapq.heappush(self._queue, (when, self._seq, key, version, kind))
+
+    def _schedule_vertex(self, b):
+        self._push(('v', b), self._failure_time(self._prev[b], b, self._next[b]), 'convex')
+
+    def _schedule_point(self, p):
+        r, a = self.root, self._tri[p]
+        b = self._next[a]
+        best, kind = None, None
+        for when, name in ((self._failure_time(a, b, p), 'edge'),
+                           (self._failure_time(r, a, p), 'ray_a'),
+                           (self._failure_time(b, r, p), 'ray_b')):
+            if when is not None and (best is None or when < best):
+                best, kind = when, name
+        self._push(('p', p), best, kind)
+
+    def _cancel(self, key):
+        self._version[key] = self._version.get(key, 0) + 1
+
+    # --- Event Loop ---
+
+    def advance(self, t):
+        """Moves time forward to t, repairing the hull at every certificate failure. Returns the number of failures."""
+        if self.degenerate:
+            self.now = t
+            self._build()
+            return 0
+        handled = 0
+        budget = 64 + 16 * self.n  # Guards against rounding making events ping-pong
+        while self._queue and self._queue[0][0] <= t:
+            when, _, key, version, kind = heapq.heappop(self._queue)
+            if self._version.get(key) != version:
+                continue # Superseded by a later reschedule
+            self.now = max(self.now, when)
+            handled += 1
+            self.stats['events'] += 1
+            if key[0] == 'v':
+                self._vertex_fails(key[1])
+            else:
+                self._point_fails(key[1], kind)
+            if self.degenerate or handled > budget:
+                break
+        self.now = t
+        if self.degenerate or handled > budget:
+            self.stats['rebuilds'] += 1
+            self._build()
+        return handled
+
+    def _vertex_fails(self, b):
+        """Hull vertex b caved in: splice it out and file it (and its triangle's points) as interior."""
+        self.stats['vertex_events'] += 1
+        r = self.root
+        if b == r or len(self._members) <= 1:
+            self.degenerate = True  # Rebuilt by advance()
+            return
+        a, c = self._prev[b], self._next[b]
+        self._next[a], self._prev[c] = c, a
+        del self._next[b], self._prev[b]
+        self._cancel(('v', b))
+
+        if a == r:
+            # The first triangle (r, b, c) collapsed; c's triangle takes over
+            moved, target = self._members.pop(b), c
+        elif c == r:
+            # The last triangle (r, a, b) collapsed; a is no longer a key vertex
+            moved, target = self._members.pop(a), self._prev[a]
+        else:
+            # (r, a, b) and (r, b, c) merge into (r, a, c): a's points face a new edge
+            moved, target = self._members.pop(b) | self._members[a], a
+        moved.add(b)
+        self._members[target] |= moved
+        for p in moved:
+            self._tri[p] = target
+            self._schedule_point(p)
+        self._schedule_vertex(a)
+        self._schedule_vertex(c)
+
+    def _point_fails(self, p, kind):
+        r, a = self.root, self._tri[p]
+        b = self._next[a]
+        if kind == 'ray_a' and a != self._next[r]:
+            self._move_point(p, self._prev[a])
+        elif kind == 'ray_b' and b != self._prev[r]:
+            self._move_point(p, b)
+        elif kind == 'edge':
+            self._break_out(p, a, b)
+        elif kind == 'ray_a':
+            self._break_out(p, r, a)
+        else:
+            self._break_out(p, b, r)
+
+    def _move_point(self, p, target):
+        """p crossed a fan ray into the neighbouring triangle."""
+        self.stats['fan_moves'] += 1
+        self._members[self._tri[p]].discard(p)
+        self._members[target].add(p)
+        self._tri[p] = target
+        self._schedule_point(p)
+
+    def _break_out(self, p, a, b):
+        """Interior point p crossed hull edge a->b: it becomes a vertex between them."""
+        self.stats['breakouts'] += 1
+        r = self.root
+        self._members[self._tri[p]].discard(p)
+        del self._tri[p]
+        self._cancel(('p', p))
+        self._next[a], self._prev[p], self._next[p], self._prev[b] = p, a, b, p
+
+        if a == r:
+            self._members[p] = set()  # New first triangle (r, p, b), flat for now
+        elif b == r:
+            self._members[a] = set()  # a becomes a key vertex: (r, a, p), flat for now
+        else:
+            # Split triangle (r, a, b) along the new ray r->p
+            px, py = self._at(p)
+            rx, ry = self._at(r)
+            stay, move = set(), set()
+            for q in self._members[a]:
+                qx, qy = self._at(q)
+                if (px - rx) * (qy - ry) - (py - ry) * (qx - rx) > 0:
+                    move.add(q)
+                else:
+                    stay.add(q)
+            self._members[a], self._members[p] = stay, move
+            for q in move:
+                self._tri[q] = p
+            for q in stay | move:
+                self._schedule_point(q)
+        for v in (a, p, b):
+            self._schedule_vertex(v)
@@ -3,38 +3,275 @@
 # --- NO TKINTER OR PIL IMPORTS ---
 import math
 import time
-from functools import cmp_to_key
+import random
+import predicates
+import bisect
+import hull_kernels
+import parallel_hull
+from point_store import PointStore
+from online_hull import OnlineHull
+from kinetic_hull import KineticHull
+from convex_layers import ConvexLayers
+from step_events import JarvisStep, GrahamStep, MonotoneStep, unwind_stack
+from streaming_hull import StreamingHull, read_chunks
 
 # --- RENAMED CLASS ---
 class ConvexHullModel:
+    # Non-animated engines used by compute_hull(), keyed by the names
+    # the view's algorithm combobox shows.
+    _FAST_ENGINES = {
+        "Jarvis March": hull_kernels.jarvis_march,
+        "Graham Scan": hull_kernels.graham_scan,
+        "Monotone Chain": hull_kernels.monotone_chain,
+        "Chan's Algorithm": hull_kernels.chan,
+        "QuickHull": hull_kernels.quickhull,
+        "Divide & Conquer": hull_kernels.divide_and_conquer,
+        "Kirkpatrick–Seidel": hull_kernels.kirkpatrick_seidel,
+        "Approximate (BFP)": hull_kernels.approximate_hull,
+        "Parallel (sharded)": parallel_hull.parallel_hull,
+    }
+
+    # Animated (step generator) engines, by the same names
+    _STEP_ENGINES = {
+        "Jarvis March": "run_jarvis_march",
+        "Graham Scan": "run_graham_scan",
+        "Monotone Chain": "run_monotone_chain",
+        "Chan's Algorithm": "run_chan",
+        "QuickHull": "run_quickhull",
+        "Divide & Conquer": "run_divide_and_conquer",
+        "Kirkpatrick–Seidel": "run_kirkpatrick_seidel",
+        "Convex Layers": "run_convex_layers",
+    }
+
+    # Interior-point pre-filters any engine can run behind. Each maps a name
+    # (as the view's pre-filter combobox shows it) to a kernel returning the
+    # indices of the points that may still be hull vertices.
+    PREFILTERS = {
+        "None": None,
+        "Akl–Toussaint": hull_kernels.akl_toussaint,
+        "Lattice columns": hull_kernels.lattice_extremes,
+        "Lattice columns + rows": hull_kernels.lattice_row_column_extremes,
+    }
+
+    # How much of a run the step generators yield, finest first: 'fine' is
+    # every comparison, 'candidate' only changes of the best candidate (or
+    # stack pushes and pops), 'vertex' only each confirmed hull vertex.
+    # Events below the selected level are never built.
+    GRANULARITIES = ("fine", "candidate", "vertex")
+
+    # Event statuses that add a hull vertex (for the stack scans, a push that
+    # may still be undone): where "jump to next vertex" stops.
+    VERTEX_STATUSES = frozenset(('vertex', 'pushing', 'farthest', 'wrapping', 'merged', 'bridge', 'peel'))
+
     def __init__(self):
-        self.points = []
+        self.points = PointStore()
+        self.online_hull = OnlineHull() # Kept current by add_point(s)
         self.hull = []
         self.n = 0
         self.h = 0
+        self.k = 0
+        self.workers = 1
         self.start_time = 0
         self.pivot = None # For Graham Scan
+        self.prefilter = "None"
+        self.granularity = "fine"
+        self.eliminated_ids = set() # Points the last pre-filter run dropped
+        self.prefilter_stats = {}
+        self.kinetic = None # KineticHull while a kinetic run is active
+        self.layers = [] # Convex layers of the last layers run, outermost first
+        # Extra keyword arguments for the fast engines that take any
+        self.engine_options = {"Approximate (BFP)": {'strips': 64}}
 
     def add_point(self, grid_x, grid_y):
-        """Adds a new unique point to the list."""
-        if not any(p['grid_x'] == grid_x and p['grid_y'] == grid_y for p in self.points):
-            self.points.append({'grid_x': grid_x, 'grid_y': grid_y, 'id': len(self.points)})
+        """
+        Adds a new unique point to the list. The point store only takes
+        64-bit integer grid coordinates, so the float path of
+        predicates.orient() is never reached through the model.
+        """
+        if self.points.add(grid_x, grid_y):
+            self.online_hull.add(grid_x, grid_y, self.points.ids[-1])
+            self.hull = [] # The last computed hull is out of date
+            self.layers = []
+            self.eliminated_ids = set()
             return True
         return False
 
+    def add_points(self, xs, ys):
+        """Adds every new unique (xs[i], ys[i]) in one batch. Returns how many were added."""
+        first = len(self.points)
+        added = self.points.add_points(xs, ys)
+        if added:
+            # Only the batch's own hull vertices can reach the online hull
+            new_xs, new_ys = self.points.xs[first:], self.points.ys[first:]
+            for i in hull_kernels.quickhull(new_xs, new_ys) if added >= 3 else range(added):
+                self.online_hull.add(new_xs[i], new_ys[i], self.points.ids[first + i])
+            self.hull = []
+            self.layers = []
+            self.eliminated_ids = set()
+        return added
+
+    def find_point(self, grid_x, grid_y):
+        """The point at (grid_x, grid_y), or None."""
+        row = self.points.find(grid_x, grid_y)
+        return self.points[row] if row >= 0 else None
+
+    def delete_point(self, grid_x, grid_y):
+        """Removes the point at (grid_x, grid_y). Returns False if there is none."""
+        row = self.points.find(grid_x, grid_y)
+        if row < 0:
+            return False
+        point_id = self.points.ids[row]
+        self.points.remove(row)
+        self._remove_from_online_hull(grid_x, grid_y, point_id)
+        self.hull = []
+        self.layers = []
+        self.eliminated_ids = set()
+        return True
+
+    def move_point(self, grid_x, grid_y, new_x, new_y):
+        """
+        Moves the point at (grid_x, grid_y) to (new_x, new_y), keeping its id.
+        Returns False if there is no such point or the target is taken.
+        """
+        row = self.points.find(grid_x, grid_y)
+        if row < 0 or not self.points.move(row, new_x, new_y):
+            return False
+        point_id = self.points.ids[row]
+        self._remove_from_online_hull(grid_x, grid_y, point_id)
+        self.online_hull.add(new_x, new_y, point_id)
+        self.hull = []
+        self.layers = []
+        self.eliminated_ids = set()
+        return True
+
+    def _remove_from_online_hull(self, grid_x, grid_y, point_id):
+        """Takes a point (already gone from self.points) out of the online hull."""
+        neighbours = self.online_hull.remove(grid_x, grid_y, point_id)
+        if neighbours is None:
+            return # An interior point: the hull is unchanged
+        u, w = neighbours
+        if u == w:
+            self._rebuild_online_hull()
+            return
+        # Only points in the triangle the vertex spanned can surface
+        xs, ys, ids = self.points.xs, self.points.ys, self.points.ids
+        for i in hull_kernels.triangle_points(xs, ys, u[:2], (grid_x, grid_y), w[:2]):
+            self.online_hull.add(xs[i], ys[i], ids[i])
+
+    def _rebuild_online_hull(self):
+        self.online_hull.clear()
+        xs, ys, ids = self.points.xs, self.points.ys, self.points.ids
+        for i in hull_kernels.quickhull(xs, ys) if len(xs) >= 3 else range(len(xs)):
+            self.online_hull.add(xs[i], ys[i], ids[i])
+
     def get_points(self):
         return self.points
 
     def get_hull(self):
         return self.hull
 
+    def get_layers(self):
+        return self.layers
+
+    def get_live_hull(self):
+        """The online hull of every point added so far, as point dicts (counter-clockwise)."""
+        return [{'grid_x': x, 'grid_y': y, 'id': point_id} for x, y, point_id in self.online_hull.vertices()]
+
     def get_point_count(self):
         return len(self.points)
 
+    def get_eliminated_ids(self):
+        return self.eliminated_ids
+
     def reset(self):
         self.points.clear()
+        self.online_hull.clear()
         self.hull.clear()
+        self.layers = []
         self.pivot = None
+        self.eliminated_ids = set()
+        self.prefilter_stats = {}
+        self.kinetic = None
+
+    # --- Pre-filter Stage ---
+
+    def set_prefilter(self, name):
+        """Selects the pre-filter (a PREFILTERS name) every engine runs behind."""
+        if name not in self.PREFILTERS:
+            raise ValueError(f"Unknown pre-filter: {name}")
+        self.prefilter = name
+
+    def set_granularity(self, name):
+        """Selects how many steps the generators yield (a GRANULARITIES name)."""
+        if name not in self.GRANULARITIES:
+            raise ValueError(f"Unknown granularity: {name}")
+        self.granularity = name
+
+    def _detail(self):
+        """(every comparison shown, candidate changes shown) for the selected granularity."""
+        return self.granularity == "fine", self.granularity != "vertex"
+
+    def set_approximation(self, strips=None, epsilon=None):
+        """
+        Sets the approximate engine's resolution: a number of strips, or the
+        largest distance (in grid units) a point may lie outside its hull.
+        """
+        if (strips is None) == (epsilon is None):
+            raise ValueError("Give either a strip count or an epsilon.")
+        if strips is not None and strips < 1 or epsilon is not None and epsilon <= 0:
+            raise ValueError("The strip count and epsilon must be positive.")
+        options = {'strips': int(strips)} if strips is not None else {'epsilon': epsilon}
+        self.engine_options["Approximate (BFP)"] = options
+
+    def _run_prefilter(self, points):
+        """
+        Runs the selected pre-filter on `points` and returns the indices
+        of those an engine still has to look at (a range over all of them
+        without a pre-filter). The dropped points are remembered in
+        eliminated_ids.
+        """
+        kernel = self.PREFILTERS[self.prefilter]
+        self.prefilter_stats = {}
+        if kernel is None:
+            self.eliminated_ids = set()
+            return range(len(points))
+        xs, ys = self._coordinates(points)
+        kept = kernel(xs, ys, self.prefilter_stats)
+        if len(kept) < 3:
+            # Degenerate (collinear) input: let the engine see every point
+            self.prefilter_stats.update(prefilter_kept=len(points), prefilter_eliminated=0)
+            self.eliminated_ids = set()
+            return range(len(points))
+        kept_set = set(kept)
+        ids = points.ids if isinstance(points, PointStore) else [p['id'] for p in points]
+        self.eliminated_ids = {ids[i] for i in range(len(points)) if i not in kept_set}
+        return kept
+
+    def _prefiltered_points(self):
+        """self.points minus what the selected pre-filter eliminates."""
+        return [self.points[i] for i in self._run_prefilter(self.points)]
+
+    @staticmethod
+    def _coordinates(points, indices=None):
+        """
+        The xs and ys of `points`, or of points[i] for i in `indices`. A
+        PointStore's columns are used as they are when every point is wanted.
+        """
+        if isinstance(points, PointStore):
+            if indices is None or isinstance(indices, range):
+                return points.xs, points.ys
+            return [points.xs[i] for i in indices], [points.ys[i] for i in indices]
+        if indices is not None:
+            points = [points[i] for i in indices]
+        return [p['grid_x'] for p in points], [p['grid_y'] for p in points]
+
+    def prefilter_summary(self):
+        """One line on what the last pre-filter run removed, or '' without one."""
+        if not self.prefilter_stats:
+            return ""
+        eliminated = self.prefilter_stats.get('prefilter_eliminated', 0)
+        total = eliminated + self.prefilter_stats.get('prefilter_kept', 0)
+        return f"Pre-filter ({self.prefilter}): eliminated {eliminated} of {total} points."
 
     # --- Static Math Helpers ---
     @staticmethod
@@ -46,10 +283,8 @@ class ConvexHullModel:
         # 0 -> Collinear
         # 2 -> Clockwise (negative)
         # 1 -> Counterclockwise (positive)
-        val = (q['grid_x'] - p['grid_x']) * (r['grid_y'] - p['grid_y']) - \
-              (q['grid_y'] - p['grid_y']) * (r['grid_x'] - p['grid_x'])
-              
-        if math.isclose(val, 0): return 0, val
+        val = predicates.orient(p['grid_x'], p['grid_y'], q['grid_x'], q['grid_y'], r['grid_x'], r['grid_y'])
+        if val == 0: return 0, val
         return (2, val) if val > 0 else (1, val)
 
     # --- Jarvis March Algorithm ---
@@ -57,7 +292,8 @@ class ConvexHullModel:
     def run_jarvis_march(self):
         """
         Generator for Jarvis March (Gift Wrapping) Algorithm.
-        Yields the state at each check.
+        Yields a JarvisStep at each check (only those that change Q at
+        'candidate' granularity) and at each hull vertex found (see step_events).
         """
         self.start_time = time.perf_counter()
         self.hull = []
@@ -65,56 +301,46 @@ class ConvexHullModel:
         if self.n < 3:
             return
 
-        # 1. Find the starting point
-        start_idx = min(range(self.n), key=lambda i: (self.points[i]['grid_y'], self.points[i]['grid_x']))
+        # Only the points the pre-filter kept are candidates
+        candidates = self._run_prefilter(self.points)
+        show_fine, show_candidate = self._detail()
+
+        # 1. Find the starting point (from the columns of a PointStore, or of a plain list of points)
+        xs, ys = self._coordinates(self.points)
+        start_idx = min(candidates, key=lambda i: (ys[i], xs[i]))
         p_idx = start_idx
         
         while True:
             self.hull.append(self.points[p_idx])
             
             # Find the first valid 'next' point (q)
-            q_idx = (p_idx + 1) % self.n
+            q_idx = candidates[bisect.bisect_right(candidates, p_idx) % len(candidates)]
 
-            # This is the 'find_next_hull_point' logic
-            p = self.points[p_idx]
+            # This is the 'find_next_hull_point' logic, read straight from the columns
+            px, py = xs[p_idx], ys[p_idx]
 
             # Iterate through all other points
-            for check_idx in range(self.n):
+            for check_idx in candidates:
                 if check_idx == p_idx:
                     continue
                 
-                q = self.points[q_idx]
-                r = self.points[check_idx]
-                o, val = self._orientation(p, q, r)
-                
-                desc = (f"P: ({p['grid_x']},{p['grid_y']}), Q (best): ({q['grid_x']},{q['grid_y']}), I (test): ({r['grid_x']},{r['grid_y']})\n\n"
-                        f"Checking orientation of (P, Q, I).\nResult: {val:.1f}\n\n")
-
-                if o == 1:  # Counter-clockwise
-                    desc += "Result is positive -> Counter-clockwise.\nI is 'more left' than Q. New Q = I."
+                best_idx = q_idx
+                val = predicates.orient(px, py, xs[q_idx], ys[q_idx], xs[check_idx], ys[check_idx])
+                if val < 0:
                     q_idx = check_idx
-                elif o == 0:  # Collinear
-                    desc += "Result is zero -> Collinear.\n"
-                    dist_pi = self._distance_sq(p, r)
-                    dist_pq = self._distance_sq(p, q)
+                elif val == 0:
+                    # Collinear: keep the farther of Q and I
+                    dist_pi = (xs[check_idx] - px) ** 2 + (ys[check_idx] - py) ** 2
+                    dist_pq = (xs[q_idx] - px) ** 2 + (ys[q_idx] - py) ** 2
                     if dist_pi > dist_pq:
-                        desc += f"I is farther than Q. New Q = I."
                         q_idx = check_idx
-                    else:
-                        desc += "Q is farther or equal. Q remains."
-                else: # Clockwise
-                    desc += "Result is negative -> Clockwise.\nQ remains the best candidate."
                 
-                yield {
-                    'type': 'jarvis',
-                    'p_idx': p_idx,
-                    'q_idx': q_idx,
-                    'check_idx': check_idx,
-                    'description': desc,
-                    'hull_so_far': self.hull
-                }
+                # Indices and the orientation only; the text is built if it is shown
+                if show_fine or show_candidate and q_idx != best_idx:
+                    yield JarvisStep(self.points, p_idx, best_idx, q_idx, check_idx, val, self.hull)
 
             # Loop finished, we found the next hull point
+            yield JarvisStep(self.points, p_idx, q_idx, q_idx, q_idx, None, self.hull, 'vertex')
             p_idx = q_idx
             
             # Check if we're back at the start
@@ -130,39 +356,43 @@ class ConvexHullModel:
             'status': 'finished',
             'hull_so_far': self.hull,
             'time_ms': self.time_taken_ms,
-            'complexity': f"Jarvis March: O(nh) = {self.n} * {self.h} ops"
+            'complexity': self._complexity_text("Jarvis March")
         }
 
+    def jarvis_march_vectorized(self):
+        """
+        Non-animated Jarvis March engine.
+        Keeps the points in NumPy arrays and does each wrap step as one
+        cross-product pass, so nothing is yielded. Produces the same hull
+        (in the same order) as draining run_jarvis_march().
+        """
+        self.start_time = time.perf_counter()
+        self.n = len(self.points)
+        kept = self._run_prefilter(self.points)
+        xs, ys = self._coordinates(self.points, kept)
+        self.hull = [self.points[kept[i]] for i in hull_kernels.jarvis_march(xs, ys)]
+        self.h = len(self.hull)
+        self.time_taken_ms = (time.perf_counter() - self.start_time) * 1000
+        return self.hull
+
     # --- NEW: Graham Scan Algorithm ---
 
-    def _get_pivot_and_sort_points(self):
+    def _get_pivot_and_sort_points(self, points):
         """Helper for Graham Scan: finds pivot and sorts remaining points by polar angle."""
-        if self.n < 3:
+        if len(points) < 3:
             return None, None
             
+        xs = [p['grid_x'] for p in points]
+        ys = [p['grid_y'] for p in points]
+
         # 1. Find pivot (bottom-most, then left-most)
-        pivot_idx = min(range(self.n), key=lambda i: (self.points[i]['grid_y'], self.points[i]['grid_x']))
-        self.pivot = self.points[pivot_idx]
-        
-        # 2. Create list of other points
-        other_points = [p for i, p in enumerate(self.points) if i != pivot_idx]
+        pivot_idx = hull_kernels.bottom_left(xs, ys)
+        self.pivot = points[pivot_idx]
         
-        # 3. Define a comparison function for sorting
-        def compare(p1, p2):
-            o, _ = self._orientation(self.pivot, p1, p2)
-            
-            if o == 0: # Collinear
-                # Keep the farthest point
-                if self._distance_sq(self.pivot, p1) < self._distance_sq(self.pivot, p2):
-                    return -1 # p2 is farther, so it comes "after" p1
-                else:
-                    return 1  # p1 is farther or equal, so it comes "after" p2
-            
-            # Not collinear, sort by angle
-            return 1 if o == 1 else -1 # 1 = Clockwise (p2 is "after"), -1 = CCW (p1 is "after")
-
-        # 4. Sort points based on polar angle
-        sorted_points = sorted(other_points, key=cmp_to_key(compare))
+        # 2. Sort the other points by polar angle (closer first when collinear)
+        #    using an exact pseudo-angle key instead of a comparison callback
+        order = hull_kernels.polar_order(xs, ys, pivot_idx)
+        sorted_points = [points[i] for i in order]
 
         return self.pivot, sorted_points
 
@@ -170,7 +400,9 @@ class ConvexHullModel:
     def run_graham_scan(self):
         """
         Generator for Graham Scan Algorithm.
-        Yields the state at each stack operation.
+        Yields a GrahamStep at each stack operation (pops and pushes only at
+        'candidate' granularity), or at 'vertex' granularity one per hull
+        vertex once the scan is over, since only then is a push final.
         """
         self.start_time = time.perf_counter()
         self.hull = []
@@ -179,27 +411,25 @@ class ConvexHullModel:
             return
 
         # --- Step 1 & 2: Find Pivot and Sort ---
-        pivot, sorted_points = self._get_pivot_and_sort_points()
+        pivot, sorted_points = self._get_pivot_and_sort_points(self._prefiltered_points())
         
         if not pivot or len(sorted_points) < 2:
             return # Not enough unique points to form a hull
 
-        yield {
-            'type': 'graham',
-            'status': 'sorted',
-            'pivot': pivot,
-            'sorted_points': [pivot] + sorted_points,
-            'stack': [],
-            'check_idx': -1,
-            'description': f"Found pivot P: ({pivot['grid_x']},{pivot['grid_y']}).\nSorted all other points by polar angle.\nReversed last collinear group."
-        }
+        # One immutable pivot-first order shared by every event; events index into it
+        order = tuple([pivot] + sorted_points)
+        show_fine, show_candidate = self._detail()
+        yield GrahamStep('sorted', order, None)
 
         # --- Step 3: Main Algorithm with proper collinear handling ---
-        stack = [pivot, sorted_points[0]]
+        # Persistent stack: each cell is (order index, cell below), so an event
+        # holds its own stack in O(1) and later pushes and pops never change it
+        stack = (1, (0, None))
+        size = 2
         
         # Special case: if only 2 points total
-        if len(sorted_points) == 1:
-            self.hull = stack
+        if len(order) == 2:
+            self.hull = list(order)
             end_time = time.perf_counter()
             self.h = len(self.hull)
             self.time_taken_ms = (end_time - self.start_time) * 1000
@@ -207,72 +437,743 @@ class ConvexHullModel:
                 'status': 'finished',
                 'hull_so_far': self.hull,
                 'time_ms': self.time_taken_ms,
-                'complexity': f"Graham Scan: O(n log n) = {self.n} * {math.log(self.n, 2):.1f} ops (for sorting)"
+                'complexity': self._complexity_text("Graham Scan")
             }
             return
         
         # Start with second point
-        stack.append(sorted_points[1])
+        stack, size = (2, stack), size + 1
         
         # We start checking from the 3rd sorted point
-        for i in range(2, len(sorted_points)):
-            current_point = sorted_points[i]
+        for k in range(3, len(order)):
+            current_point = order[k]
             
             # Yield the 'checking' state
-            yield {
-                'type': 'graham',
-                'status': 'checking',
-                'pivot': pivot,
-                'sorted_points': [pivot] + sorted_points,
-                'stack': stack,
-                'check_point_id': current_point['id'],
-                'description': f"Checking point I: ({current_point['grid_x']},{current_point['grid_y']})\nAgainst stack top: ({stack[-1]['grid_x']},{stack[-1]['grid_y']})"
-            }
+            if show_fine:
+                yield GrahamStep('checking', order, stack, k)
 
             # --- Step 4: Pop from stack if not CCW ---
             # Keep popping while we have at least 2 points and turn is not counter-clockwise
-            while len(stack) > 1:
-                o, val = self._orientation(stack[-2], stack[-1], current_point)
+            while size > 1:
+                o, val = self._orientation(order[stack[1][0]], order[stack[0]], current_point)
                 
                 # CRITICAL: Pop if clockwise (o == 1) OR collinear (o == 0)
                 # We use <= 0 check to handle collinear points
                 if o != 2:  # Not counter-clockwise (either clockwise or collinear)
-                    popped = stack.pop()
-                    
-                    turn_type = "collinear" if o == 0 else "right turn"
-                    yield {
-                        'type': 'graham',
-                        'status': 'popping',
-                        'pivot': pivot,
-                        'sorted_points': [pivot] + sorted_points,
-                        'stack': stack,
-                        'check_point_id': current_point['id'],
-                        'description': f"({stack[-1]['grid_x'] if len(stack) > 0 else '?'},{stack[-1]['grid_y'] if len(stack) > 0 else '?'}) -> ({popped['grid_x']},{popped['grid_y']}) -> ({current_point['grid_x']},{current_point['grid_y']}) is {turn_type}.\nPopping ({popped['grid_x']},{popped['grid_y']}) from stack."
-                    }
+                    popped, stack, size = stack[0], stack[1], size - 1
+                    if show_candidate:
+                        yield GrahamStep('popping', order, stack, k, popped, val)
                 else:
                     break  # Counter-clockwise, stop popping
 
             # --- Step 5: Push to stack ---
-            stack.append(current_point)
+            stack, size = (k, stack), size + 1
+            if show_candidate:
+                yield GrahamStep('pushing', order, stack, k)
+
+        # --- Algorithm Finished ---
+        self.hull = [order[i] for i in unwind_stack(stack)]
+        if not show_candidate:
+            # The final stack's cells, bottom up, are the hull growing one vertex at a time
+            cells = []
+            cell = stack
+            while cell is not None:
+                cells.append(cell)
+                cell = cell[1]
+            for cell in reversed(cells):
+                yield GrahamStep('vertex', order, cell, cell[0])
+        end_time = time.perf_counter()
+        self.h = len(self.hull)
+        self.time_taken_ms = (end_time - self.start_time) * 1000
+        
+        yield {
+            'status': 'finished',
+            'hull_so_far': self.hull,
+            'time_ms': self.time_taken_ms,
+            'complexity': self._complexity_text("Graham Scan")
+        }
+
+    # --- Andrew's Monotone Chain Algorithm ---
+
+    def run_monotone_chain(self):
+        """
+        Generator for Andrew's Monotone Chain Algorithm.
+        Sorts the points by x (then y) and builds the lower chain left to right,
+        then the upper chain right to left, yielding a MonotoneStep at each
+        stack operation (Graham's event form, so draw_graham_step shows them).
+        At 'vertex' granularity it yields each chain's vertices once it is done.
+        """
+        self.start_time = time.perf_counter()
+        self.hull = []
+        self.n = len(self.points)
+        if self.n < 3:
+            return
+
+        points = self._prefiltered_points()
+        xs = [p['grid_x'] for p in points]
+        ys = [p['grid_y'] for p in points]
+        order = tuple(points[i] for i in hull_kernels.lexicographic_order(xs, ys))
+        self.pivot = order[0]
+        show_fine, show_candidate = self._detail()
+
+        yield MonotoneStep('lower', 'sorted', order, None)
+
+        # Persistent stack of order indices, as in Graham Scan. The upper chain
+        # starts on the finished lower chain less its last point, so the
+        # stack on screen is always the hull built so far.
+        stack = None
+        for chain_name, chain in (('lower', range(len(order))), ('upper', range(len(order) - 1, -1, -1))):
+            base = stack[1] if chain_name == 'upper' else None
+            stack, size = base, 0
+
+            for k in chain:
+                if show_fine and size > 1:
+                    yield MonotoneStep(chain_name, 'checking', order, stack, k)
+
+                # Pop while the turn is clockwise or collinear
+                while size > 1:
+                    o, val = self._orientation(order[stack[1][0]], order[stack[0]], order[k])
+                    if o != 2:
+                        popped, stack, size = stack[0], stack[1], size - 1
+                        if show_candidate:
+                            yield MonotoneStep(chain_name, 'popping', order, stack, k, popped, val)
+                    else:
+                        break
+
+                stack, size = (k, stack), size + 1
+                if show_candidate:
+                    yield MonotoneStep(chain_name, 'pushing', order, stack, k)
+
+            if not show_candidate:
+                # The chain's cells, bottom up; the upper chain's ends are the lower chain's
+                cells = []
+                cell = stack
+                while cell is not base:
+                    cells.append(cell)
+                    cell = cell[1]
+                if chain_name == 'upper':
+                    cells = cells[1:-1]
+                for cell in reversed(cells):
+                    yield MonotoneStep(chain_name, 'vertex', order, cell, cell[0])
+
+        # The upper chain ends back at the left-most point
+        self.hull = [order[i] for i in unwind_stack(stack)[:-1]]
+
+        # --- Algorithm Finished ---
+        end_time = time.perf_counter()
+        self.h = len(self.hull)
+        self.time_taken_ms = (end_time - self.start_time) * 1000
+
+        yield {
+            'status': 'finished',
+            'hull_so_far': self.hull,
+            'time_ms': self.time_taken_ms,
+            'complexity': self._complexity_text("Monotone Chain")
+        }
+
+    # --- QuickHull Algorithm ---
+
+    def run_quickhull(self):
+        """
+        Generator for QuickHull.
+        Works through a stack of hull segments: each one takes the farthest
+        point outside it, then keeps only the points outside the two new
+        segments. Yields at each farthest-point pick (a hull vertex), partition
+        ('candidate' and finer) and finished edge ('fine' only).
+        """
+        self.start_time = time.perf_counter()
+        self.hull = []
+        self.n = len(self.points)
+        if self.n < 3:
+            return
+
+        pts = self._prefiltered_points()
+        xs = [p['grid_x'] for p in pts]
+        ys = [p['grid_y'] for p in pts]
+        a, b, below, above = hull_kernels.quickhull_start(xs, ys)
+        stack = [(b, a, above), (a, b, below)]
+        out = []
+        show_fine, show_candidate = self._detail()
+
+        def event(status, description, segment, farthest=None, candidates=(), kept=()):
+            # Current polygon: the finished vertices, then the start of every pending segment
+            polygon = [pts[i] for i in out] + [pts[seg[0]] for seg in reversed(stack)]
+            return {
+                'type': 'quickhull',
+                'status': status,
+                'segment': (pts[segment[0]], pts[segment[1]]),
+                'farthest': pts[farthest] if farthest is not None else None,
+                'candidates': [pts[i] for i in candidates],
+                'kept': [pts[i] for i in kept],
+                'hull_so_far': polygon,
+                'description': description
+            }
+
+        yield event('start', f"Left-most point A: ({xs[a]},{ys[a]}), right-most point B: ({xs[b]},{ys[b]}).\n"
+                             f"{len(below)} point(s) below AB, {len(above)} above, {len(pts) - 2 - len(below) - len(above)} on it.",
+                    (a, b), candidates=below + above)
+
+        while stack:
+            s, t, cand = stack.pop()
+            if not cand:
+                out.append(s)
+                if show_fine:
+                    yield event('edge', f"No points outside ({xs[s]},{ys[s]}) -> ({xs[t]},{ys[t]}).\nIt is a hull edge.", (s, t))
+                continue
+
+            c, left, right = hull_kernels.quickhull_split(xs, ys, s, t, cand)
+            yield event('farthest', f"Segment ({xs[s]},{ys[s]}) -> ({xs[t]},{ys[t]}) has {len(cand)} point(s) outside.\n"
+                                    f"Farthest: ({xs[c]},{ys[c]}). It is a hull vertex.",
+                        (s, t), c, cand)
+            stack.append((c, t, right))
+            stack.append((s, c, left))
+            if show_candidate:
+                yield event('partition', f"Kept {len(left)} point(s) outside the first new segment and {len(right)} outside the second.\n"
+                                         f"Discarded {len(cand) - len(left) - len(right) - 1} point(s) inside the triangle.",
+                            (s, t), c, cand, left + right)
+
+        # Same start as Jarvis March: the bottom-most, then left-most vertex
+        first = min(range(len(out)), key=lambda k: (ys[out[k]], xs[out[k]]))
+        self.hull = [pts[i] for i in out[first:] + out[:first]]
+
+        # --- Algorithm Finished ---
+        end_time = time.perf_counter()
+        self.h = len(self.hull)
+        self.time_taken_ms = (end_time - self.start_time) * 1000
+
+        yield {
+            'status': 'finished',
+            'hull_so_far': self.hull,
+            'time_ms': self.time_taken_ms,
+            'complexity': self._complexity_text("QuickHull")
+        }
+
+    # --- Chan's Algorithm ---
+
+    def run_chan(self):
+        """
+        Generator for Chan's Algorithm.
+        Each round groups the points into mini-hulls of size m, then wraps
+        around them, asking every mini-hull for its tangent by binary search.
+        Yields at each tangent probe ('fine' only), tangent (only those that
+        change Q at 'candidate') and new hull vertex.
+        """
+        self.start_time = time.perf_counter()
+        self.hull = []
+        self.n = len(self.points)
+        if self.n < 3:
+            return
+
+        pts = self._prefiltered_points()
+        xs = [p['grid_x'] for p in pts]
+        ys = [p['grid_y'] for p in pts]
+        start = hull_kernels.bottom_left(xs, ys)
+        alive = list(range(len(pts)))
+        t = 1
+        show_fine, show_candidate = self._detail()
+
+        while True:
+            m = min(len(alive), 2 ** (2 ** t))
+            groups = hull_kernels.chan_mini_hulls(xs, ys, m, alive)
+            mini_hulls = [[pts[i] for i in g] for g in groups]
+            self.hull = []
+
+            def event(status, description, p=None, probe=None, tangents=(), q=None):
+                return {
+                    'type': 'chan',
+                    'status': status,
+                    'group_size': m,
+                    'mini_hulls': mini_hulls,
+                    'p': p,
+                    'probe': probe,
+                    'tangents': list(tangents),
+                    'q': q,
+                    'hull_so_far': self.hull,
+                    'description': description
+                }
+
+            yield event('grouping', f"Round {t}: m = {m}.\nSplit {len(alive)} points into {len(groups)} group(s) and built each mini-hull.")
+
+            g = next(i for i, mini in enumerate(groups) if start in mini)
+            pos = groups[g].index(start)
+            closed = False
+            for _ in range(m):
+                p_idx = groups[g][pos]
+                p = pts[p_idx]
+                self.hull.append(p)
+                best = None
+                q = None
+                tangents = []
+
+                for other, mini in enumerate(groups):
+                    if other == g:
+                        if len(mini) < 2:
+                            continue
+                        found = (pos + 1) % len(mini)
+                    else:
+                        probes = [] if show_fine else None
+                        found = hull_kernels.chan_tangent(xs, ys, mini, p_idx, probes)
+                        for c in probes or ():
+                            probe = pts[mini[c]]
+                            yield event('probing', f"P: ({p['grid_x']},{p['grid_y']}). Binary search on mini-hull {other + 1}.\nProbing ({probe['grid_x']},{probe['grid_y']}).", p, probe, tangents, q)
+
+                    r = pts[mini[found]]
+                    tangents.append(r)
+                    if q is None:
+                        better = True
+                    else:
+                        o, val = self._orientation(p, q, r)
+                        better = o == 1 or (o == 0 and self._distance_sq(p, r) > self._distance_sq(p, q))
+                    if better:
+                        best, q = (other, found), r
+                    if show_fine or show_candidate and better:
+                        yield event('tangent', f"Tangent from P to mini-hull {other + 1}: ({r['grid_x']},{r['grid_y']}).\n" + ("Most clockwise so far. New Q." if better else "Q remains the best candidate."), p, None, tangents, q)
+
+                if best is None:
+                    closed = True
+                    break
+                g, pos = best
+                yield event('wrapping', f"Next hull vertex: ({q['grid_x']},{q['grid_y']}).", p, None, tangents, q)
+                if groups[g][pos] == start:
+                    closed = True
+                    break
+
+            if closed:
+                break
+            yield event('restart', f"Hull not closed after {m} steps.\nSquaring the group size and keeping only mini-hull vertices.")
+            alive = [i for mini in groups for i in mini]
+            t += 1
+
+        # --- Algorithm Finished ---
+        end_time = time.perf_counter()
+        self.h = len(self.hull)
+        self.time_taken_ms = (end_time - self.start_time) * 1000
+
+        yield {
+            'status': 'finished',
+            'hull_so_far': self.hull,
+            'time_ms': self.time_taken_ms,
+            'complexity': self._complexity_text("Chan's Algorithm")
+        }
+
+    def run_divide_and_conquer(self):
+        """
+        Generator for the Preparata-Hong divide and conquer hull.
+        Sorts the points once, splits them in half by x until at most three
+        remain, then merges neighbouring hulls by walking their lower and
+        upper bridges. Yields at each split, leaf hull, bridge found and merge
+        ('candidate' and finer) and each bridge step ('fine'); at 'vertex'
+        granularity, only the final hull's vertices.
+        """
+        self.start_time = time.perf_counter()
+        self.hull = []
+        self.n = len(self.points)
+        if self.n < 3:
+            return
+
+        pts = self._prefiltered_points()
+        xs = [p['grid_x'] for p in pts]
+        ys = [p['grid_y'] for p in pts]
+        order = hull_kernels.lexicographic_order(xs, ys)
+        solved = {} # (lo, hi) range of `order` -> its hull, until merged into its parent
+        show_fine, show_candidate = self._detail()
+
+        def event(status, description, split=None, bridge=None):
+            return {
+                'type': 'dc',
+                'status': status,
+                'sub_hulls': [[pts[i] for i in h] for h in solved.values()],
+                'split': split,
+                'bridge': bridge,
+                'hull_so_far': self.hull,
+                'description': description
+            }
+
+        def solve(lo, hi):
+            if hi - lo <= 3:
+                solved[(lo, hi)] = hull_kernels.dc_leaf_hull(xs, ys, order[lo:hi])
+                if show_candidate:
+                    yield event('leaf', f"Base case: hull of {hi - lo} point(s) built directly.")
+                return
+            mid = (lo + hi) // 2
+            split = (xs[order[mid - 1]] + xs[order[mid]]) / 2
+            if show_candidate:
+                yield event('split', f"Split {hi - lo} points into {mid - lo} left and {hi - mid} right of x = {split:g}.", split)
+            yield from solve(lo, mid)
+            yield from solve(mid, hi)
+
+            left, right = solved[(lo, mid)], solved[(mid, hi)]
+            bridges = []
+            for lower in (True, False):
+                name = "lower" if lower else "upper"
+                trace = [] if show_fine else None
+                ia, ib, _ = hull_kernels.dc_bridge(xs, ys, left, right, lower, trace)
+                for step, (ta, tb) in enumerate(trace or ()):
+                    a, b = pts[left[ta]], pts[right[tb]]
+                    text = "Start" if step == 0 else "Advance"
+                    yield event(f'{name}_bridge', f"{text} the {name} bridge: ({a['grid_x']},{a['grid_y']}) - ({b['grid_x']},{b['grid_y']}).", split, (a, b))
+                bridges.append((ia, ib))
+                a, b = pts[left[ia]], pts[right[ib]]
+                if show_candidate:
+                    yield event(f'{name}_bridge', f"{name.capitalize()} bridge found: ({a['grid_x']},{a['grid_y']}) - ({b['grid_x']},{b['grid_y']}).", split, (a, b))
+
+            del solved[(lo, mid)], solved[(mid, hi)]
+            solved[(lo, hi)] = hull_kernels.dc_stitch(left, right, bridges[0], bridges[1])
+            if show_candidate:
+                yield event('merged', f"Merged into one hull of {len(solved[(lo, hi)])} vertices; the points between the bridges drop out.")
+
+        yield from solve(0, len(pts))
+        hull = [pts[i] for i in solved.pop((0, len(pts)))]
+        if not show_candidate:
+            # No vertex is final before the last merge; show the hull one vertex at a time
+            for k, p in enumerate(hull):
+                self.hull = hull[:k + 1]
+                yield event('vertex', f"Hull vertex {k + 1} of {len(hull)}: ({p['grid_x']},{p['grid_y']}).")
+        self.hull = hull
+
+        # --- Algorithm Finished ---
+        end_time = time.perf_counter()
+        self.h = len(self.hull)
+        self.time_taken_ms = (end_time - self.start_time) * 1000
+
+        yield {
+            'status': 'finished',
+            'hull_so_far': self.hull,
+            'time_ms': self.time_taken_ms,
+            'complexity': self._complexity_text("Divide & Conquer")
+        }
+
+    def run_kirkpatrick_seidel(self):
+        """
+        Generator for Kirkpatrick-Seidel (marriage before conquest).
+        For the lower, then the upper hull, finds the bridge over the median x
+        before recursing on either side. Yields at every bridge found, every
+        bridge search ('candidate' and finer) and every pruning round (median
+        pair slope, supporting line, pruned points; 'fine' only).
+        """
+        self.start_time = time.perf_counter()
+        self.hull = []
+        self.n = len(self.points)
+        if self.n < 3:
+            return
+
+        pts = self._prefiltered_points()
+        xs = [p['grid_x'] for p in pts]
+        ys = [p['grid_y'] for p in pts]
+        trace = []
+        result = hull_kernels.kirkpatrick_seidel(xs, ys, trace=trace)
+        bridges = []
+        show_fine, show_candidate = self._detail()
+
+        def event(status, description, candidates=(), split=None, support=None, slope=None, pruned=()):
+            return {
+                'type': 'ks',
+                'status': status,
+                'candidates': [pts[i] for i in candidates],
+                'split': split,
+                'support': support,
+                'slope': slope,
+                'pruned': [pts[i] for i in pruned],
+                'bridges': list(bridges),
+                'hull_so_far': self.hull,
+                'description': description
+            }
+
+        for chain, a, b, candidates, xm, rounds, (i, j) in trace:
+            # The lower hull was found as the upper hull of the mirrored points
+            flip = -1 if chain == 'lower' else 1
+            pa, pb = pts[a], pts[b]
+            if show_candidate:
+                yield event('split', f"{chain.capitalize()} hull between ({pa['grid_x']},{pa['grid_y']}) and ({pb['grid_x']},{pb['grid_y']}):\n"
+                                     f"{len(candidates)} candidates, bridge over the median x = {xm}.", candidates, xm)
+            for cand, (dy, dx), (pk, pm), pruned in rounds if show_fine else ():
+                slope = flip * dy / dx
+                touch = pts[pk]
+                if pruned:
+                    side = "right" if xs[pk] > xm else "left"
+                    text = f"Median pair slope {slope:.3g}: the supporting line touches ({touch['grid_x']},{touch['grid_y']}), {side} of the median.\nPruned {len(pruned)} of {len(cand)} candidates."
+                else:
+                    text = f"Median pair slope {slope:.3g}: the supporting line touches both sides of the median. Bridge found."
+                yield event('prune', text, cand, xm, touch, slope, pruned)
+            bridges.append((pts[i], pts[j]))
+            yield event('bridge', f"{chain.capitalize()} bridge: ({pts[i]['grid_x']},{pts[i]['grid_y']}) - ({pts[j]['grid_x']},{pts[j]['grid_y']}).\nRecursing only on the points outside it.", (), xm)
+
+        self.hull = [pts[i] for i in result]
+
+        # --- Algorithm Finished ---
+        end_time = time.perf_counter()
+        self.h = len(self.hull)
+        self.time_taken_ms = (end_time - self.start_time) * 1000
+
+        yield {
+            'status': 'finished',
+            'hull_so_far': self.hull,
+            'time_ms': self.time_taken_ms,
+            'complexity': self._complexity_text("Kirkpatrick–Seidel")
+        }
+
+    def run_convex_layers(self):
+        """
+        Generator for convex layers (onion peeling). Peels the hull off the
+        points again and again until none are left, yielding each layer as
+        it is removed. Every point takes part, so the pre-filter is skipped.
+        """
+        self.start_time = time.perf_counter()
+        self.hull = []
+        self.n = len(self.points)
+        if self.n < 3:
+            return
+
+        self.eliminated_ids = set()
+        self.prefilter_stats = {}
+        peeler = ConvexLayers(*self._coordinates(self.points))
+        remaining = self.n
+        for depth, layer in enumerate(peeler):
+            current = [self.points[i] for i in layer]
+            remaining -= len(layer)
             yield {
-                'type': 'graham',
-                'status': 'pushing',
-                'pivot': pivot,
-                'sorted_points': [pivot] + sorted_points,
-                'stack': stack,
-                'check_point_id': current_point['id'],
-                'description': f"Left turn detected.\nPushing ({current_point['grid_x']},{current_point['grid_y']}) to stack."
+                'type': 'layers',
+                'status': 'peel',
+                'layers': list(self.layers),
+                'current': current,
+                'hull_so_far': self.hull,
+                'description': f"Layer {depth}: the hull of the {remaining + len(layer)} remaining points has {len(layer)} vertices.\n"
+                               f"Removing them leaves {remaining} points."
             }
+            self.layers.append(current)
+            if depth == 0:
+                self.hull = current
 
         # --- Algorithm Finished ---
-        self.hull = stack
         end_time = time.perf_counter()
         self.h = len(self.hull)
         self.time_taken_ms = (end_time - self.start_time) * 1000
-        
+
         yield {
+            'status': 'finished',
+            'hull_so_far': self.hull,
+            'layers': self.layers,
+            'time_ms': self.time_taken_ms,
+            'complexity': self._complexity_text("Convex Layers"),
+            'counters': peeler.stats()
+        }
+
+    # --- Headless Engines (no animation) ---
+
+    def is_animated(self, algorithm):
+        """True if `algorithm` has a step generator (the approximate engine has none)."""
+        return algorithm in self._STEP_ENGINES
+
+    def run_algorithm(self, algorithm):
+        """Returns the step generator for `algorithm` (a combobox name)."""
+        method = self._STEP_ENGINES.get(algorithm)
+        if method is None:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.layers = []
+        return getattr(self, method)()
+
+    def compute_hull(self, points=None, algorithm="Jarvis March"):
+        """
+        Runs `algorithm` on `points` (the model's own points by default)
+        without yields, step descriptions or per-step state dicts.
+        Returns the same shape as the generators' 'finished' event, plus
+        'n', 'h' and the engine's 'counters'.
+        """
+        if algorithm == "Convex Layers":
+            return self.compute_layers(points)
+        engine = self._FAST_ENGINES.get(algorithm)
+        if engine is None:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        if points is None:
+            points = self.points
+
+        self.start_time = time.perf_counter()
+        n = len(points)
+        kept = self._run_prefilter(points)
+        xs, ys = self._coordinates(points, kept)
+        counters = dict(self.prefilter_stats)
+        options = self.engine_options.get(algorithm, {})
+        self.layers = []
+        self.hull = [points[kept[i]] for i in engine(xs, ys, counters, **options)]
+        end_time = time.perf_counter()
+
+        self.n = n
+        self.h = len(self.hull)
+        self.k = counters.get('strips', 0) # Strips used by the approximate engine
+        self.workers = counters.get('workers', 1) # Processes used by the parallel engine
+        self.time_taken_ms = (end_time - self.start_time) * 1000
+        result = {
             'status': 'finished',
             'hull_so_far': self.hull,
             'time_ms': self.time_taken_ms,
-            'complexity': f"Graham Scan: O(n log n) = {self.n} * {math.log(self.n, 2):.1f} ops (for sorting)"
-        }
\ No newline at end of file
+            'complexity': self._complexity_text(algorithm),
+            'n': self.n,
+            'h': self.h,
+            'counters': counters
+        }
+        if 'error_bound' in counters:
+            # Worst-case distance of any point outside the returned hull
+            result['error_bound'] = counters['error_bound']
+        return result
+
+    def compute_layers(self, points=None):
+        """
+        Convex layers of `points` (the model's own points by default) without
+        yields. Returns the shape of compute_hull() with the outermost layer
+        as the hull, plus 'layers' (point dicts per layer, outermost first)
+        and 'layer_of' (point id -> layer index, 0 = outermost).
+        """
+        if points is None:
+            points = self.points
+        self.start_time = time.perf_counter()
+        self.eliminated_ids = set()
+        self.prefilter_stats = {}
+        xs, ys = self._coordinates(points)
+        peeler = ConvexLayers(xs, ys)
+        self.layers = [[points[i] for i in layer] for layer in peeler]
+        self.hull = self.layers[0] if self.layers else []
+        end_time = time.perf_counter()
+
+        self.n = len(points)
+        self.h = len(self.hull)
+        self.time_taken_ms = (end_time - self.start_time) * 1000
+        return {
+            'status': 'finished',
+            'hull_so_far': self.hull,
+            'layers': self.layers,
+            'layer_of': {p['id']: depth for depth, layer in enumerate(self.layers) for p in layer},
+            'time_ms': self.time_taken_ms,
+            'complexity': self._complexity_text("Convex Layers"),
+            'n': self.n,
+            'h': self.h,
+            'counters': peeler.stats()
+        }
+
+    # --- Batch Mode ---
+
+    def compute_hulls_batch(self, xs, ys, offsets, workers=1):
+        """
+        Hulls many independent point groups in one call, without point
+        dicts, generators or a model per group. Group g is points
+        offsets[g] to offsets[g + 1] - 1 of the flat (xs, ys) arrays (CSR
+        layout); the hulls come back the same way, as 'hull_indices' (into
+        xs and ys) and 'hull_offsets'. workers > 1 fans the groups out over
+        a process pool. Does not touch the model's own points.
+        """
+        start = time.perf_counter()
+        counters = {}
+        if workers > 1:
+            hull_indices, hull_offsets = parallel_hull.parallel_batch_hulls(xs, ys, offsets, counters, workers)
+        else:
+            hull_indices, hull_offsets = hull_kernels.monotone_chain_batch(xs, ys, offsets, counters)
+        elapsed = time.perf_counter() - start
+        groups = len(offsets) - 1
+        return {
+            'status': 'finished',
+            'hull_indices': hull_indices,
+            'hull_offsets': hull_offsets,
+            'groups': groups,
+            'time_ms': elapsed * 1000,
+            'groups_per_second': groups / elapsed if elapsed > 0 else float('inf'),
+            'counters': counters
+        }
+
+    # --- Streaming Mode ---
+
+    def run_streaming(self, source, chunk_size=100_000, publish_every=1):
+        """
+        Generator hulling a point stream (a path, file, pipe or iterable of
+        (x, y) pairs, see streaming_hull.read_chunks) without loading it into
+        self.points. Yields the running hull every `publish_every` chunks,
+        then a 'finished' event; only the hull and one chunk are in memory.
+        """
+        self.start_time = time.perf_counter()
+        stream = StreamingHull()
+        for vertices in stream.consume(read_chunks(source, chunk_size), publish_every):
+            # Negative ids keep stream vertices apart from the model's own points
+            self.hull = [{'grid_x': x, 'grid_y': y, 'id': -(i + 1)} for i, (x, y) in enumerate(vertices)]
+            yield {
+                'type': 'stream',
+                'status': 'streaming',
+                'hull_so_far': self.hull,
+                'description': f"Read {stream.points_read} points in {stream.chunks} chunks.\n"
+                               f"Running hull: {len(self.hull)} vertices."
+            }
+
+        self.n = stream.points_read
+        self.h = len(self.hull)
+        self.time_taken_ms = (time.perf_counter() - self.start_time) * 1000
+        yield {
+            'status': 'finished',
+            'hull_so_far': self.hull,
+            'time_ms': self.time_taken_ms,
+            'complexity': self._complexity_text("Streaming"),
+            'n': self.n,
+            'h': self.h,
+            'counters': {'chunks': stream.chunks, 'points_read': stream.points_read,
+                         'peak_candidates': stream.peak_candidates}
+        }
+
+    # --- Kinetic Mode ---
+
+    def start_kinetic(self, vxs=None, vys=None):
+        """
+        Starts a kinetic run: point i moves by (vxs[i], vys[i]) grid units per
+        second from its current position. Without given velocities every
+        point drifts in a random direction.
+        """
+        n = len(self.points)
+        if vxs is None or vys is None:
+            vxs = [random.uniform(-1, 1) for _ in range(n)]
+            vys = [random.uniform(-1, 1) for _ in range(n)]
+        if len(vxs) != n or len(vys) != n:
+            raise ValueError("Need one velocity per point.")
+        self.kinetic = KineticHull(self.points.xs, self.points.ys, vxs, vys)
+
+    def kinetic_step(self, dt):
+        """
+        Advances the kinetic run by dt seconds. The hull is only repaired at
+        the certificate failures in between, so the cost follows the number
+        of combinatorial changes rather than n. Returns the frame to draw.
+        """
+        events = self.kinetic.advance(self.kinetic.now + dt)
+        xs, ys = self.kinetic.positions()
+        ids = self.points.ids
+        points = [{'grid_x': round(x, 2), 'grid_y': round(y, 2), 'id': ids[i]} for i, (x, y) in enumerate(zip(xs, ys))]
+        return {
+            'status': 'kinetic',
+            'points': points,
+            'hull_so_far': [points[i] for i in self.kinetic.hull()],
+            'time': self.kinetic.now,
+            'events': events,
+            'stats': dict(self.kinetic.stats)
+        }
+
+    def stop_kinetic(self):
+        self.kinetic = None
+
+    def _complexity_text(self, algorithm):
+        if algorithm == "Jarvis March":
+            return f"Jarvis March: O(nh) = {self.n} * {self.h} ops"
+        if algorithm == "Graham Scan":
+            return f"Graham Scan: O(n log n) = {self.n} * {math.log(max(self.n, 1), 2):.1f} ops (for sorting)"
+        if algorithm == "Monotone Chain":
+            return f"Monotone Chain: O(n log n) = {self.n} * {math.log(max(self.n, 1), 2):.1f} ops (lexicographic sort)"
+        if algorithm == "QuickHull":
+            return f"QuickHull: O(n log n) expected = {self.n} * {math.log(max(self.n, 1), 2):.1f} ops (O(n^2) worst case)"
+        if algorithm == "Chan's Algorithm":
+            return f"Chan's Algorithm: O(n log h) = {self.n} * {math.log(max(self.h, 2), 2):.1f} ops"
+        if algorithm == "Streaming":
+            return f"Streaming hull: O(n log h) = {self.n} * {math.log(max(self.h, 2), 2):.1f} ops, O(h + chunk) memory"
+        if algorithm == "Divide & Conquer":
+            return f"Divide & Conquer: O(n log n) = {self.n} * {math.log(max(self.n, 1), 2):.1f} ops (linear-time merges)"
+        if algorithm == "Kirkpatrick–Seidel":
+            return f"Kirkpatrick–Seidel: O(n log h) = {self.n} * {math.log(max(self.h, 2), 2):.1f} ops (linear-time bridges)"
+        if algorithm == "Parallel (sharded)":
+            workers = max(self.workers, 1)
+            return f"Parallel QuickHull: O(n log h / p) = {self.n} * {math.log(max(self.h, 2), 2):.1f} / {workers} ops (p = {workers} workers)"
+        if algorithm == "Convex Layers":
+            return f"Convex layers: O(log n) hull-tree work per peeled point = {self.n} * {math.log(max(self.n, 2), 2):.1f} ops ({len(self.layers)} layers)"
+        if algorithm == "Approximate (BFP)":
+            return f"BFP approximation: O(n + k) = {self.n} + {self.k} ops ({self.k} strips)"
+        return algorithm
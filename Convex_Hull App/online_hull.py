@@ -0,0 +1,140 @@
+# online_hull.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Convex hull maintained point by point as the model receives them, so the
+# current hull is always known without running any algorithm.
+import bisect
+import predicates
+
+
+class _Chain:
+    """
+    One monotone hull chain: vertices (x, y, id) sorted by (x, y), every
+    consecutive triple turning strictly the same way. `turn` is +1 for the
+    lower chain (left turns) and -1 for the upper chain (right turns).
+    """
+
+    def __init__(self, turn):
+        self.turn = turn
+        self.vertices = []
+
+    def _convex(self, a, b, c):
+        return self.turn * predicates.orient(a[0], a[1], b[0], b[1], c[0], c[1]) > 0
+
+    def insert(self, vertex):
+        """
+        Adds `vertex` if it lies outside the chain, splicing out the vertices
+        it hides. Returns False when the chain is unchanged (a binary search
+        plus one orientation test).
+        """
+        v = self.vertices
+        i = bisect.bisect_left(v, vertex)
+        if i < len(v) and v[i] == vertex:
+            return False
+        if 0 < i < len(v) and not self._convex(v[i - 1], vertex, v[i]):
+            return False
+
+        # Walk outwards from the insertion point over the vertices that stop
+        # being convex; each one is removed exactly once over the chain's life.
+        lo = i
+        while lo >= 2 and not self._convex(v[lo - 2], v[lo - 1], vertex):
+            lo -= 1
+        hi = i
+        while hi + 1 < len(v) and not self._convex(vertex, v[hi], v[hi + 1]):
+            hi += 1
+        v[lo:hi] = [vertex]
+        return True
+
+    def __contains__(self, vertex):
+        v = self.vertices
+        i = bisect.bisect_left(v, vertex)
+        return i < len(v) and v[i] == vertex
+
+    def remove(self, vertex):
+        """Drops `vertex` if it is on the chain."""
+        v = self.vertices
+        i = bisect.bisect_left(v, vertex)
+        if i < len(v) and v[i] == vertex:
+            del v[i]
+
+    def clear(self):
+        self.vertices = []
+
+
+class OnlineHull:
+    """
+    Incremental convex hull as a lower and an upper chain, both running from
+    the lexicographically smallest to the largest point (Andrew's monotone
+    chain, kept up to date instead of rebuilt). Adding a point costs a
+    binary search per chain, O(log h), plus the vertices it removes, which
+    is amortized O(1). Removing a point that is not a vertex is a binary
+    search; removing a vertex needs the caller to re-add the points it
+    covered (see remove()). Collinear points are not kept as vertices.
+    """
+
+    def __init__(self):
+        self.lower = _Chain(1)
+        self.upper = _Chain(-1)
+
+    def __len__(self):
+        n = len(self.lower.vertices) + len(self.upper.vertices) - 2
+        return max(n, len(self.lower.vertices))
+
+    def add(self, grid_x, grid_y, point_id):
+        """Adds one point. Returns True if it changed the hull."""
+        vertex = (grid_x, grid_y, point_id)
+        changed = self.lower.insert(vertex)
+        return self.upper.insert(vertex) or changed
+
+    def remove(self, grid_x, grid_y, point_id):
+        """
+        Drops a point from the hull. Returns None if it was not a hull vertex
+        (nothing changes), otherwise its former neighbours (u, w) in
+        counter-clockwise order. The hull is then that of the remaining
+        vertices; the caller re-adds the points inside triangle (u, v, w),
+        the only ones that can surface, or rebuilds when u == w (the hull had
+        at most two vertices).
+        """
+        vertex = (grid_x, grid_y, point_id)
+        if vertex not in self.lower and vertex not in self.upper:
+            return None
+        hull = self.vertices()
+        k = hull.index(vertex)
+        neighbours = hull[k - 1], hull[(k + 1) % len(hull)]
+        self.lower.remove(vertex)
+        self.upper.remove(vertex)
+
+        # A removed endpoint leaves the chains starting (or ending) at
+        # different points; the lexicographically outer one belongs to both
+        lower, upper = self.lower.vertices, self.upper.vertices
+        if lower and upper:
+            for end in (0, -1):
+                a, b = lower[end], upper[end]
+                self.lower.insert(b)
+                self.upper.insert(a)
+        return neighbours
+
+    def contains(self, grid_x, grid_y):
+        """True if (grid_x, grid_y) lies inside or on the current hull."""
+        lower, upper = self.lower.vertices, self.upper.vertices
+        if not lower or not lower[0][:2] <= (grid_x, grid_y) <= lower[-1][:2]:
+            return False
+        for chain, vertices in ((self.lower, lower), (self.upper, upper)):
+            i = bisect.bisect_left(vertices, (grid_x, grid_y))
+            if i == 0 or i == len(vertices):
+                continue  # Equal to an endpoint
+            a, b = vertices[i - 1], vertices[i]
+            if chain.turn * predicates.orient(a[0], a[1], grid_x, grid_y, b[0], b[1]) > 0:
+                return False
+        return True
+
+    def vertices(self):
+        """Hull vertices (x, y, id), counter-clockwise from the leftmost, lowest one."""
+        lower, upper = self.lower.vertices, self.upper.vertices
+        if len(lower) < 2:
+            return list(lower)
+        return lower + upper[-2:0:-1]
+
+    def clear(self):
+        self.lower.clear()
+        self.upper.clear()
@@ -0,0 +1,191 @@
+# parallel_hull.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Sharded multi-process hull. The coordinates are copied once into a
+# shared-memory block; worker processes map it and hull their own slice
+# in place (nothing is pickled but the slice bounds and the few indices
+# that come back), and a final pass hulls the union of the shard hulls.
+# Batches of independent groups are fanned out over the same pool.
+#
+# Command line use:
+#   python parallel_hull.py points.npy --workers 8
+#   python parallel_hull.py --random 20000000 --workers 8
+import os
+import sys
+import time
+import argparse
+import hull_kernels
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+    from multiprocessing import shared_memory
+except ImportError:  # NumPy is optional, the engine then runs on one core
+    np = None
+
+# Below this many points per worker, process start-up and the copy into
+# shared memory cost more than they save.
+MIN_POINTS_PER_WORKER = 250_000
+
+_pool = None
+_pool_size = 0
+
+
+def _executor(workers):
+    """A process pool reused across calls (starting workers costs more than a small hull)."""
+    global _pool, _pool_size
+    if _pool is None or _pool_size != workers:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool, _pool_size = ProcessPoolExecutor(max_workers=workers), workers
+    return _pool
+
+
+def _shard_hull(name, n, dtype, start, stop):
+    """Worker: hull of points [start, stop) read straight from shared block `name`. Returns global indices."""
+    if stop - start < 3:
+        return list(range(start, stop))
+    block = shared_memory.SharedMemory(name=name)
+    coords = np.ndarray((2, n), dtype=dtype, buffer=block.buf)
+    hull = hull_kernels.quickhull(coords[0, start:stop], coords[1, start:stop])
+    del coords  # The view must go before the block can close
+    block.close()
+    return [start + i for i in hull]
+
+
+def parallel_hull(xs, ys, stats=None, workers=None):
+    """
+    Splits the points into one contiguous shard per worker, hulls the
+    shards in parallel from shared memory and merges their vertices with
+    a final QuickHull. Falls back to a single-process QuickHull when NumPy
+    is missing, the coordinates need exact Python ints, or the input is
+    too small to pay for the processes. Returns hull indices like quickhull().
+    """
+    n = len(xs)
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, n // MIN_POINTS_PER_WORKER)
+    X = Y = None
+    if np is not None and workers >= 2:
+        X, Y = hull_kernels._as_arrays(xs, ys)
+        if X.dtype == object:
+            X = Y = None
+    if X is None:
+        hull = hull_kernels.quickhull(xs, ys, stats)
+        if stats is not None:
+            stats.update(workers=1)
+        return hull
+
+    block = shared_memory.SharedMemory(create=True, size=2 * n * X.dtype.itemsize)
+    try:
+        coords = np.ndarray((2, n), dtype=X.dtype, buffer=block.buf)
+        coords[0], coords[1] = X, Y
+        del coords
+        bounds = [n * k // workers for k in range(workers + 1)]
+        pool = _executor(workers)
+        jobs = [pool.submit(_shard_hull, block.name, n, X.dtype.str, lo, hi)
+                for lo, hi in zip(bounds, bounds[1:])]
+        shard_hulls = [job.result() for job in jobs]
+    finally:
+        block.close()
+        block.unlink()
+
+    candidates = np.unique(np.concatenate([np.asarray(h, dtype=np.int64) for h in shard_hulls]))
+    local = hull_kernels.quickhull(X[candidates], Y[candidates])
+    if stats is not None:
+        stats.update(workers=workers, shard_vertices=len(candidates))
+    return candidates[local].tolist()
+
+
+def _shard_batch(name, n, dtype, offsets):
+    """Worker: batched hulls of the groups whose CSR offsets are given, read from shared block `name`."""
+    block = shared_memory.SharedMemory(name=name)
+    coords = np.ndarray((2, n), dtype=dtype, buffer=block.buf)
+    lo, hi = offsets[0], offsets[-1]
+    hull_indices, hull_offsets = hull_kernels.monotone_chain_batch(
+        coords[0, lo:hi], coords[1, lo:hi], np.asarray(offsets) - lo)
+    del coords
+    block.close()
+    return hull_indices + lo, np.diff(hull_offsets)
+
+
+def parallel_batch_hulls(xs, ys, offsets, stats=None, workers=None):
+    """
+    monotone_chain_batch() fanned out over the process pool: the groups are
+    split into runs of roughly equal point counts, one per worker, and each
+    worker reads its run from shared memory. Same CSR input and output.
+    """
+    n = len(xs)
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, n // MIN_POINTS_PER_WORKER, len(offsets) - 1)
+    X = Y = None
+    if np is not None and workers >= 2:
+        X, Y = hull_kernels._as_arrays(xs, ys)
+        if X.dtype == object:
+            X = Y = None
+    if X is None:
+        result = hull_kernels.monotone_chain_batch(xs, ys, offsets, stats)
+        if stats is not None:
+            stats.update(workers=1)
+        return result
+
+    offsets = np.asarray(offsets, dtype=np.int64)
+    # Cut at the group boundaries closest to equal shares of the points
+    cuts = np.searchsorted(offsets, np.arange(1, workers) * offsets[-1] // workers)
+    cuts = np.unique(np.concatenate(([0], cuts, [len(offsets) - 1])))
+    block = shared_memory.SharedMemory(create=True, size=max(2 * n * X.dtype.itemsize, 1))
+    try:
+        coords = np.ndarray((2, n), dtype=X.dtype, buffer=block.buf)
+        coords[0], coords[1] = X, Y
+        del coords
+        pool = _executor(workers)
+        jobs = [pool.submit(_shard_batch, block.name, n, X.dtype.str, offsets[a:b + 1].tolist())
+                for a, b in zip(cuts, cuts[1:]) if b > a]
+        parts = [job.result() for job in jobs]
+    finally:
+        block.close()
+        block.unlink()
+
+    hull_indices = np.concatenate([indices for indices, _ in parts])
+    hull_offsets = np.concatenate(([0], np.cumsum(np.concatenate([lengths for _, lengths in parts]))))
+    if stats is not None:
+        stats.update(workers=len(jobs), groups=len(offsets) - 1, hull_vertices=int(hull_offsets[-1]))
+    return hull_indices, hull_offsets
+
+
+# --- Command Line ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convex hull on several cores from shared memory.")
+    parser.add_argument("source", nargs="?", help='.npy array of shape (n, 2), or a file of "x y" lines')
+    parser.add_argument("--random", type=int, metavar="N", help="hull N random points instead of a file")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    if (args.source is None) == (args.random is None):
+        parser.error("give a source file or --random N")
+    if np is None:
+        parser.error("NumPy is required")
+
+    if args.random is not None:
+        rng = np.random.default_rng()
+        xs, ys = rng.integers(-10**6, 10**6, args.random), rng.integers(-10**6, 10**6, args.random)
+    elif args.source.endswith(".npy"):
+        points = np.load(args.source, mmap_mode="r")
+        xs, ys = points[:, 0], points[:, 1]
+    else:
+        from streaming_hull import read_chunks
+        chunks = list(read_chunks(args.source))
+        xs = np.concatenate([np.asarray(cx) for cx, _ in chunks])
+        ys = np.concatenate([np.asarray(cy) for _, cy in chunks])
+
+    stats = {}
+    start = time.perf_counter()
+    hull = parallel_hull(xs, ys, stats, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"{len(xs)} points, {len(hull)} hull vertices, {stats.get('workers', 1)} workers, {elapsed * 1000:.1f} ms",
+          file=sys.stderr)
+    for i in hull:
+        print(xs[i], ys[i])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+# point_store.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Compact point storage for the model: grid coordinates and ids live in
+# typed columns, and a hash index answers "is this point already here?"
+# in O(1) instead of a scan over every stored point.
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the index falls back to a dict
+    np = None
+
+# Fibonacci-hashing multipliers; (x, y) is mixed into 64 bits and the top
+# bits pick the slot, identically for scalar and vectorized lookups.
+_MIX_X = 0x9E3779B97F4A7C15
+_MIX_Y = 0xC2B2AE3D27D4EB4F
+_MASK_64 = (1 << 64) - 1
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+_MIN_SLOT_BITS = 4
+
+
+def _grid_int(value):
+    """value as a plain int, rejecting anything the array('q') columns cannot hold."""
+    if not isinstance(value, int) and not (np is not None and isinstance(value, np.integer)):
+        raise TypeError("PointStore holds integer grid coordinates.")
+    value = int(value)
+    if not _INT64_MIN <= value <= _INT64_MAX:
+        raise OverflowError("PointStore grid coordinates must fit in 64 bits.")
+    return value
+
+
+class PointStore:
+    """
+    Struct-of-arrays point list. The columns xs, ys and ids are array('q')
+    (so the kernels can view them as NumPy arrays without copying), and
+    store[i] reads row i back as the {'grid_x', 'grid_y', 'id'} dict the
+    views and step generators have always used.
+
+    With NumPy the index is an open-addressing table of row numbers (linear
+    probing, at most 2/3 full), which keeps 10M points within a few hundred
+    MB; without NumPy it is a plain dict keyed by (x, y).
+    """
+
+    def __init__(self):
+        self.xs = array('q')
+        self.ys = array('q')
+        self.ids = array('q')
+        self._next_id = 0
+        self._reset_index(0)
+
+    # --- Read View ---
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self.xs)))]
+        return {'grid_x': self.xs[i], 'grid_y': self.ys[i], 'id': self.ids[i]}
+
+    def __iter__(self):
+        for x, y, point_id in zip(self.xs, self.ys, self.ids):
+            yield {'grid_x': x, 'grid_y': y, 'id': point_id}
+
+    def find(self, grid_x, grid_y):
+        """Row holding (grid_x, grid_y), or -1 when the point is not stored."""
+        if self._slots is None:
+            return self._rows.get((grid_x, grid_y), -1)
+        return self._probe(grid_x, grid_y)[1]
+
+    # --- Writes ---
+
+    def add(self, grid_x, grid_y):
+        """Appends (grid_x, grid_y) unless it is already stored. Returns True if it was added."""
+        grid_x, grid_y = _grid_int(grid_x), _grid_int(grid_y)
+        row = len(self.xs)
+        if self._slots is None:
+            if (grid_x, grid_y) in self._rows:
+                return False
+            self._rows[(grid_x, grid_y)] = row
+        else:
+            slot, found = self._probe(grid_x, grid_y)
+            if found >= 0:
+                return False
+            self._slots[slot] = row + 1
+        self.xs.append(grid_x)
+        self.ys.append(grid_y)
+        self.ids.append(self._next_id)
+        self._next_id += 1
+        if self._slots is not None and 3 * len(self.xs) > 2 * len(self._slots):
+            self._reset_index(len(self.xs))
+        return True
+
+    def add_points(self, xs, ys):
+        """
+        Batched add(): appends every (xs[i], ys[i]) that is neither stored
+        nor repeated earlier in the batch, in input order. Returns how many
+        points were added.
+        """
+        if self._slots is None:
+            return sum(self.add(x, y) for x, y in zip(xs, ys))
+
+        X, Y = np.asarray(xs), np.asarray(ys)
+        if len(X) == 0:
+            return 0
+        if X.dtype.kind not in 'iu' or Y.dtype.kind not in 'iu':
+            raise TypeError("PointStore holds integer grid coordinates.")
+        X, Y = X.astype(np.int64, copy=False), Y.astype(np.int64, copy=False)
+        n0 = len(self.xs)
+        if 3 * (n0 + len(X)) > 2 * len(self._slots):
+            self._reset_index(n0 + len(X))
+        new, slots = self._claim(X, Y)
+
+        # Claimed slots hold -(batch index + 1) until the rows are numbered
+        rows = np.arange(n0 + 1, n0 + 1 + len(new), dtype=self._slots.dtype)
+        self._slots[slots] = rows
+        self.xs.frombytes(X[new].tobytes())
+        self.ys.frombytes(Y[new].tobytes())
+        self.ids.frombytes(np.arange(self._next_id, self._next_id + len(new), dtype=np.int64).tobytes())
+        self._next_id += len(new)
+        return len(new)
+
+    def remove(self, row):
+        """
+        Deletes row `row` in O(1): the last row moves into its place, so ids
+        stay with their points but row numbers past `row` are not stable.
+        """
+        last = len(self.xs) - 1
+        x, y = self.xs[row], self.ys[row]
+        if self._slots is None:
+            del self._rows[(x, y)]
+            if row != last:
+                self._rows[(self.xs[last], self.ys[last])] = row
+        else:
+            self._unlink(self._probe(x, y)[0])
+            if row != last:
+                self._slots[self._probe(self.xs[last], self.ys[last])[0]] = row + 1
+        for column in (self.xs, self.ys, self.ids):
+            column[row] = column[last]
+            column.pop()
+
+    def move(self, row, grid_x, grid_y):
+        """Gives row `row` new coordinates, keeping its id. Returns False if another point is already there."""
+        grid_x, grid_y = _grid_int(grid_x), _grid_int(grid_y)
+        if self.find(grid_x, grid_y) >= 0:
+            return False
+        x, y = self.xs[row], self.ys[row]
+        if self._slots is None:
+            del self._rows[(x, y)]
+            self._rows[(grid_x, grid_y)] = row
+        else:
+            self._unlink(self._probe(x, y)[0])
+        self.xs[row], self.ys[row] = grid_x, grid_y
+        if self._slots is not None:
+            self._slots[self._probe(grid_x, grid_y)[0]] = row + 1
+        return True
+
+    def pop(self):
+        """Removes and returns the last point."""
+        point = self[-1]
+        self.remove(len(self.xs) - 1)
+        return point
+
+    def clear(self):
+        self.xs = array('q')
+        self.ys = array('q')
+        self.ids = array('q')
+        self._next_id = 0
+        self._reset_index(0)
+
+    # --- Hash Index ---
+
+    def _reset_index(self, n):
+        """Rebuilds the index with room for n points (or at least one table's worth)."""
+        if np is None:
+            self._slots = None
+            self._rows = {(x, y): i for i, (x, y) in enumerate(zip(self.xs, self.ys))}
+            return
+        bits = max(_MIN_SLOT_BITS, (3 * n // 2 + 1).bit_length())
+        self._bits = bits
+        self._slots = np.zeros(1 << bits, dtype=np.int32 if len(self.xs) < 2**31 - 1 else np.int64)
+        if len(self.xs):
+            X = np.frombuffer(self.xs, dtype=np.int64)
+            Y = np.frombuffer(self.ys, dtype=np.int64)
+            new, slots = self._claim(X, Y)
+            self._slots[slots] = new + 1
+            del X, Y  # Release the buffer views so the columns can grow again
+
+    def _home(self, grid_x, grid_y):
+        return (((grid_x * _MIX_X) ^ (grid_y * _MIX_Y)) & _MASK_64) >> (64 - self._bits)
+
+    def _probe(self, grid_x, grid_y):
+        """(slot, row) for a point: its slot and row if stored, else the empty slot it would take and -1."""
+        slots, mask = self._slots, len(self._slots) - 1
+        slot = self._home(grid_x, grid_y)
+        while True:
+            row = int(slots[slot]) - 1
+            if row < 0:
+                return slot, -1
+            if self.xs[row] == grid_x and self.ys[row] == grid_y:
+                return slot, row
+            slot = (slot + 1) & mask
+
+    def _claim(self, X, Y):
+        """
+        Vectorized insert of a batch into the table. Every point probes in
+        lockstep; when several reach the same empty slot the earliest one in
+        the batch takes it, and the rest keep probing (and are dropped if
+        they turn out to be that same point). Returns the batch indices that
+        were new, in order, and the slots they claimed (marked with
+        -(batch index + 1) for the caller to fill in).
+        """
+        slots, mask = self._slots, len(self._slots) - 1
+        stored_x = np.frombuffer(self.xs, dtype=np.int64)
+        stored_y = np.frombuffer(self.ys, dtype=np.int64)
+        h = (X.astype(np.uint64) * np.uint64(_MIX_X)) ^ (Y.astype(np.uint64) * np.uint64(_MIX_Y))
+        slot = (h >> np.uint64(64 - self._bits)).astype(np.int64)
+        claimed = np.full(len(X), -1, dtype=np.int64)
+
+        pending = np.arange(len(X))
+        while len(pending):
+            s = slot[pending]
+            occupant = slots[s].astype(np.int64)
+            retry = np.zeros(len(pending), dtype=bool)
+
+            empty = occupant == 0
+            if empty.any():
+                takers, want = pending[empty], s[empty]
+                # Repeated fancy-index writes keep the last value, so writing in
+                # reverse lets the earliest batch index win a contested slot
+                slots[want[::-1]] = -(takers[::-1] + 1)
+                won = slots[want] == -(takers + 1)
+                claimed[takers[won]] = want[won]
+                retry[empty] = ~won  # Losers compare against the winner next round
+
+            busy = ~empty
+            rest, occupant = pending[busy], occupant[busy]
+            in_batch = occupant < 0
+            other_x, other_y = X[np.where(in_batch, -occupant - 1, 0)], Y[np.where(in_batch, -occupant - 1, 0)]
+            if len(stored_x):
+                row = np.where(in_batch, 0, occupant - 1)
+                other_x = np.where(in_batch, other_x, stored_x[row])
+                other_y = np.where(in_batch, other_y, stored_y[row])
+            distinct = (other_x != X[rest]) | (other_y != Y[rest])
+            slot[rest[distinct]] = (slot[rest[distinct]] + 1) & mask
+            retry[busy] = distinct
+            pending = pending[retry]
+
+        new = np.flatnonzero(claimed >= 0)
+        return new, claimed[new]
+
+    def _unlink(self, slot):
+        """Empties a slot, shifting later entries of its probe run back so every lookup still finds them."""
+        slots, mask = self._slots, len(self._slots) - 1
+        slots[slot] = 0
+        j = slot
+        while True:
+            j = (j + 1) & mask
+            row = int(slots[j]) - 1
+            if row < 0:
+                return
+            home = self._home(self.xs[row], self.ys[row])
+            # The entry may move back to `slot` unless its home lies cyclically in (slot, j]
+            if (slot < j and slot < home <= j) or (j < slot and (home > slot or home <= j)):
+                continue
+            slots[slot] = row + 1
+            slots[j] = 0
+            slot = j
@@ -0,0 +1,172 @@
+# step_events.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Compact step events for the busiest generators. An event only stores
+# indices, point references and the orientation value of its step; the text
+# for the analysis panel is built by describe() when someone reads it, which
+# at animation speed is a small fraction of the steps generated.
+from abc import ABC, abstractmethod
+
+
+class StepEvent(ABC):
+    """
+    Base for slotted step events. Reads like the generators' dict events
+    (event['p_idx'], event.get('status')) so consumers can take either;
+    'description' is formatted on access.
+    """
+    __slots__ = ()
+    type = None
+    status = None
+    hull_so_far = None
+
+    @abstractmethod
+    def describe(self):
+        """The analysis panel text for this step."""
+
+    @property
+    def description(self):
+        return self.describe()
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+def _xy(point):
+    return f"({point['grid_x']},{point['grid_y']})"
+
+
+class JarvisStep(StepEvent):
+    """
+    One orientation test of Jarvis March: P is the current hull vertex,
+    `best_idx` the candidate Q before the test, I the point tested and
+    `q_idx` the candidate after it. Indices are rows of `points`.
+    A 'vertex' step closes the wrap around P: Q is the next hull vertex.
+    """
+    __slots__ = ('points', 'p_idx', 'best_idx', 'q_idx', 'check_idx', 'value', 'hull_so_far', 'status')
+    type = 'jarvis'
+
+    def __init__(self, points, p_idx, best_idx, q_idx, check_idx, value, hull_so_far, status='checking'):
+        self.status = status
+        self.points = points
+        self.p_idx = p_idx
+        self.best_idx = best_idx
+        self.q_idx = q_idx
+        self.check_idx = check_idx
+        self.value = value
+        self.hull_so_far = hull_so_far
+
+    def describe(self):
+        p, q, r = self.points[self.p_idx], self.points[self.best_idx], self.points[self.check_idx]
+        if self.status == 'vertex':
+            return f"P: {_xy(p)}. Every point tested.\nNext hull vertex: {_xy(q)}."
+        desc = (f"P: {_xy(p)}, Q (best): {_xy(q)}, I (test): {_xy(r)}\n\n"
+                f"Checking orientation of (P, Q, I).\nResult: {self.value:.1f}\n\n")
+        if self.value < 0:
+            return desc + "Result is positive -> Counter-clockwise.\nI is 'more left' than Q. New Q = I."
+        if self.value == 0:
+            desc += "Result is zero -> Collinear.\n"
+            if self.q_idx != self.best_idx:
+                return desc + "I is farther than Q. New Q = I."
+            return desc + "Q is farther or equal. Q remains."
+        return desc + "Result is negative -> Clockwise.\nQ remains the best candidate."
+
+
+def unwind_stack(cell):
+    """Order indices of a persistent stack (top cell, or None), bottom first."""
+    indices = []
+    while cell is not None:
+        indices.append(cell[0])
+        cell = cell[1]
+    indices.reverse()
+    return indices
+
+
+class GrahamStep(StepEvent):
+    """
+    One stack operation of Graham Scan ('sorted', 'checking', 'popping' or
+    'pushing'), or a 'vertex' of the finished hull, shown with the stack
+    up to it. `order` is the run's polar order, pivot first, as one tuple
+    every event shares; `check` and `popped` index into it. The stack is
+    persistent: `stack` is its top cell (order index, cell below), or None
+    when empty, so a push or pop makes at most one cell and copies nothing,
+    and an event kept for later still shows the stack of its own step.
+    """
+    __slots__ = ('status', 'order', 'stack', 'check', 'popped', 'value')
+    type = 'graham'
+
+    def __init__(self, status, order, stack, check=None, popped=None, value=None):
+        self.status = status
+        self.order = order
+        self.stack = stack
+        self.check = check
+        self.popped = popped
+        self.value = value
+
+    @property
+    def pivot(self):
+        return self.order[0]
+
+    @property
+    def check_point(self):
+        return self.order[self.check] if self.check is not None else None
+
+    def stack_indices(self):
+        """The stack as order indices, bottom first (O(stack size), for drawing)."""
+        return unwind_stack(self.stack)
+
+    def stack_points(self):
+        return [self.order[i] for i in self.stack_indices()]
+
+    def describe(self):
+        if self.status == 'sorted':
+            return f"Found pivot P: {_xy(self.pivot)}.\nSorted all other points by polar angle.\nReversed last collinear group."
+        top = _xy(self.order[self.stack[0]]) if self.stack is not None else "(?,?)"
+        if self.status == 'checking':
+            return f"Checking point I: {_xy(self.check_point)}\nAgainst stack top: {top}"
+        if self.status == 'popping':
+            popped = _xy(self.order[self.popped])
+            turn_type = "collinear" if self.value == 0 else "right turn"
+            return (f"{top} -> {popped} -> {_xy(self.check_point)} is {turn_type}.\n"
+                    f"Popping {popped} from stack.")
+        if self.status == 'vertex':
+            return f"Scan finished. Hull vertex {_xy(self.check_point)}:\nits push was never undone."
+        return f"Left turn detected.\nPushing {_xy(self.check_point)} to stack."
+
+
+class MonotoneStep(GrahamStep):
+    """
+    One stack operation of Andrew's Monotone Chain, in Graham's form so the
+    same drawing shows it. `order` is the x (then y) order; the upper chain
+    is pushed onto the lower chain's stack, less its last point, so the
+    stack on screen is always the hull built so far.
+    """
+    __slots__ = ('chain',)
+
+    def __init__(self, chain, status, order, stack, check=None, popped=None, value=None):
+        super().__init__(status, order, stack, check, popped, value)
+        self.chain = chain
+
+    def describe(self):
+        if self.status == 'sorted':
+            return f"Sorted all points by x (then y).\nLeft-most point: {_xy(self.pivot)}.\nBuilding the lower chain first."
+        check = _xy(self.check_point)
+        if self.status == 'vertex':
+            return f"{self.chain.capitalize()} chain finished. Hull vertex {check}."
+        top = _xy(self.order[self.stack[0]])
+        if self.status == 'checking':
+            return f"{self.chain.capitalize()} chain: checking point I: {check}\nAgainst chain top: {top}"
+        if self.status == 'popping':
+            popped = _xy(self.order[self.popped])
+            turn_type = "collinear" if self.value == 0 else "right turn"
+            return f"{top} -> {popped} -> {check} is {turn_type}.\nPopping {popped} from the {self.chain} chain."
+        # A chain of at most two points has no turn to test
+        first = 0 if self.chain == 'lower' else len(self.order) - 1
+        below = self.stack[1]
+        start = self.check == first or below is None or below[0] == first
+        return f"{'Chain start.' if start else 'Left turn detected.'}\nPushing {check} to the {self.chain} chain."
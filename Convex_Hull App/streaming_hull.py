@@ -0,0 +1,145 @@
+# streaming_hull.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Convex hull of a point stream too large to hold in memory. Points arrive
+# in chunks from an iterator, a file or a pipe; only the running hull and
+# the chunk being merged are ever kept, so peak memory is O(h + chunk).
+#
+# Command line use (reads stdin when no file is given):
+#   python streaming_hull.py points.txt --chunk-size 100000 --every 10
+import sys
+import argparse
+import hull_kernels
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the merge then works on lists
+    np = None
+
+
+# --- Reading ---
+
+def _parse_number(token):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def read_chunks(source, chunk_size=100_000):
+    """
+    Yields (xs, ys) lists of at most chunk_size points from `source`: a
+    path ("-" for stdin), an open text file or pipe, or any iterable of
+    (x, y) pairs. Text lines hold "x y" or "x,y"; lines that are not two
+    numbers (headers, comments, blanks) are skipped.
+    """
+    if isinstance(source, str):
+        if source == "-":
+            yield from read_chunks(sys.stdin, chunk_size)
+            return
+        with open(source) as f:
+            yield from read_chunks(f, chunk_size)
+        return
+
+    xs, ys = [], []
+    for item in source:
+        if isinstance(item, str):
+            fields = item.replace(",", " ").split()
+            if len(fields) != 2:
+                continue
+            try:
+                x, y = _parse_number(fields[0]), _parse_number(fields[1])
+            except ValueError:
+                continue
+        else:
+            x, y = item
+        xs.append(x)
+        ys.append(y)
+        if len(xs) == chunk_size:
+            yield xs, ys
+            xs, ys = [], []
+    if xs:
+        yield xs, ys
+
+
+# --- Merging ---
+
+class StreamingHull:
+    """
+    Running hull of every point fed so far. Each chunk is merged by taking
+    the hull of (current hull vertices + chunk); vertices of the old hull
+    that the chunk covers simply drop out. Collinear input keeps its two
+    end points.
+    """
+
+    def __init__(self):
+        self.xs, self.ys = [], []   # Hull vertices, counter-clockwise
+        self.points_read = 0
+        self.chunks = 0
+        self.peak_candidates = 0     # Largest hull + chunk merged at once
+
+    def feed(self, xs, ys):
+        """Merges one chunk of points into the hull."""
+        if len(xs) != len(ys):
+            raise ValueError("xs and ys must have the same length.")
+        self.points_read += len(xs)
+        self.chunks += 1
+        if np is not None:
+            cx, cy = np.asarray(xs), np.asarray(ys)
+            if self.xs:
+                cx = np.concatenate((np.asarray(self.xs), cx))
+                cy = np.concatenate((np.asarray(self.ys), cy))
+        else:
+            cx, cy = self.xs + list(xs), self.ys + list(ys)
+        self.peak_candidates = max(self.peak_candidates, len(cx))
+
+        keep = hull_kernels.quickhull(cx, cy)
+        if not keep and len(cx):
+            # Fewer than three points, or all collinear: keep the two ends
+            key = lambda i: (cx[i], cy[i])
+            first, last = min(range(len(cx)), key=key), max(range(len(cx)), key=key)
+            keep = [first] if key(first) == key(last) else [first, last]
+        if np is not None:
+            self.xs, self.ys = cx[keep].tolist(), cy[keep].tolist()
+        else:
+            self.xs, self.ys = [cx[i] for i in keep], [cy[i] for i in keep]
+
+    def consume(self, chunks, publish_every=1):
+        """
+        Feeds every (xs, ys) chunk, yielding the hull vertices [(x, y), ...]
+        after every `publish_every` chunks and once more at the end.
+        """
+        published = 0
+        for xs, ys in chunks:
+            self.feed(xs, ys)
+            if self.chunks % publish_every == 0:
+                published = self.chunks
+                yield self.vertices()
+        if published != self.chunks or self.chunks == 0:
+            yield self.vertices()
+
+    def vertices(self):
+        return list(zip(self.xs, self.ys))
+
+
+# --- Command Line ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convex hull of a point stream in O(h + chunk) memory.")
+    parser.add_argument("source", nargs="?", default="-", help='file of "x y" lines, or - for stdin (default)')
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="points merged at a time")
+    parser.add_argument("--every", type=int, default=1, help="report progress every N chunks")
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1 or args.every < 1:
+        parser.error("--chunk-size and --every must be positive")
+
+    stream = StreamingHull()
+    hull = []
+    for hull in stream.consume(read_chunks(args.source, args.chunk_size), args.every):
+        print(f"{stream.points_read} points read, {len(hull)} hull vertices", file=sys.stderr)
+    for x, y in hull:
+        print(x, y)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# test_kirkpatrick_seidel.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Float regression check for kirkpatrick_seidel(): rounded heights once let
+# the bridge search prune a real bridge end. Compared against a hull built
+# in exact rational arithmetic.
+import random
+from fractions import Fraction
+import pytest
+import hull_kernels
+
+
+def _exact_hull(xs, ys):
+    """Hull vertices as a sorted list of exact (x, y) pairs (Andrew's monotone chain on Fractions)."""
+    points = sorted(set((Fraction(x), Fraction(y)) for x, y in zip(xs, ys)))
+
+    def chain(ordered):
+        hull = []
+        for p in ordered:
+            while len(hull) >= 2 and ((hull[-1][0] - hull[-2][0]) * (p[1] - hull[-2][1]) -
+                                      (hull[-1][1] - hull[-2][1]) * (p[0] - hull[-2][0])) <= 0:
+                hull.pop()
+            hull.append(p)
+        return hull[:-1]
+
+    return sorted(chain(points) + chain(points[::-1]))
+
+
+def _float_inputs():
+    for seed in range(120):
+        rnd = random.Random(seed)
+        n = rnd.choice([6, 7, 10, 40, 200, 2000])
+        xs = [rnd.uniform(-1, 1) for _ in range(n)]
+        ys = [rnd.uniform(-1, 1) for _ in range(n)]
+        yield xs, ys
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_float_input_matches_exact_hull(vectorized, monkeypatch):
+    if vectorized:
+        if hull_kernels.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(hull_kernels, "np", None)
+    for xs, ys in _float_inputs():
+        if vectorized:
+            xs, ys = hull_kernels.np.array(xs), hull_kernels.np.array(ys)
+        hull = hull_kernels.kirkpatrick_seidel(xs, ys)
+        assert sorted((Fraction(float(xs[i])), Fraction(float(ys[i]))) for i in hull) == _exact_hull(xs, ys)
@@ -0,0 +1,28 @@
+# test_point_store.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# A rejected move() must leave the hash index as it was: the coordinates
+# are checked before the old entry is unlinked.
+import pytest
+import point_store
+from point_store import PointStore
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+@pytest.mark.parametrize("target, error", [((2**70, 2), OverflowError), ((1.5, 2), TypeError)])
+def test_rejected_move_keeps_index_consistent(indexed, target, error, monkeypatch):
+    if indexed:
+        if point_store.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(point_store, "np", None)
+    store = PointStore()
+    store.add(1, 2)
+    store.add(3, 4)
+    with pytest.raises(error):
+        store.move(0, *target)
+    assert store.find(1, 2) == 0
+    assert store[0]['grid_x'] == 1 and store[0]['grid_y'] == 2
+    assert store.add(1, 2) is False
+    assert len(store) == 2
+    assert store.move(0, 5, 6) and store.find(5, 6) == 0 and store.find(1, 2) == -1
@@ -0,0 +1,270 @@
+# trace_recorder.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Records a step generator into typed columns so a run can be scrubbed,
+# stepped backwards and replayed without running the algorithm again.
+# Jarvis March and Graham Scan steps are stored as one row of numbers each;
+# Graham's stack is recovered from a keyframe every K rows, so any step
+# is rebuilt in O(K). Past a memory threshold the columns move to temporary
+# files read back through mmap, so very long runs stay within RAM.
+import mmap
+import bisect
+import tempfile
+from array import array
+from step_events import JarvisStep, GrahamStep, MonotoneStep
+
+# Values kept in memory per column once spilled, before the next write to disk
+_WRITE_BUFFER = 1 << 16
+
+_GRAHAM_STATUSES = ('sorted', 'checking', 'popping', 'pushing', 'vertex')
+_GRAHAM_KIND = {status: kind for kind, status in enumerate(_GRAHAM_STATUSES, start=1)}
+_JARVIS = 0
+_JARVIS_VERTEX = len(_GRAHAM_STATUSES) + 1
+_CHAINS = ('lower', 'upper')  # Monotone Chain steps: column c; -1 for Graham Scan
+
+
+class _Column:
+    """
+    One typed column. Values go to an array.array; after spill() that array
+    is only a write buffer in front of an append-only temporary file, which
+    is read through a memory map (re-mapped as the file grows).
+    """
+
+    def __init__(self, typecode):
+        self.typecode = typecode
+        self.data = array(typecode)
+        self.itemsize = self.data.itemsize
+        self.file = None
+        self.flushed = 0      # Values already in the file
+        self.mapped = 0       # Values covered by the current map
+        self._map = self._view = None
+
+    def __len__(self):
+        return self.flushed + len(self.data)
+
+    def append(self, value):
+        self.data.append(value)
+        if self.file is not None and len(self.data) >= _WRITE_BUFFER:
+            self._flush()
+
+    def __getitem__(self, i):
+        if i >= self.flushed:
+            return self.data[i - self.flushed]
+        if i >= self.mapped:
+            self._remap()
+        return self._view[i]
+
+    @property
+    def nbytes(self):
+        return len(self.data) * self.itemsize
+
+    def spill(self, directory=None):
+        self.file = tempfile.TemporaryFile(dir=directory)
+        self._flush()
+
+    def _flush(self):
+        self.data.tofile(self.file)
+        self.flushed += len(self.data)
+        self.data = array(self.typecode)
+
+    def _remap(self):
+        self.file.flush()
+        self._unmap()
+        self._map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map).cast(self.typecode)
+        self.mapped = self.flushed
+
+    def _unmap(self):
+        if self._view is not None:
+            self._view.release()
+            self._map.close()
+            self._map = self._view = None
+
+    def close(self):
+        self._unmap()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class TraceRecorder:
+    """
+    Pulls events from a step generator as they are asked for and keeps every
+    one of them. event(t) returns step t (recording up to it first if need
+    be), so a viewer can play, seek and step back over the same run.
+
+    Columns per row: kind, four indices (Jarvis: p, best, q, check; Graham:
+    check, popped, Monotone Chain's chain), the orientation value, and a
+    depth (Jarvis: hull size so far; Graham: stack size). Jarvis rows stand alone, with the hull so far a
+    prefix of the final hull. Graham rows hold only how the stack changed;
+    every `keyframe_every` rows the persistent stack cell itself is kept
+    (and at any row where the stack did not follow from the previous one by
+    one push or pop), and a seek replays at most that many rows from the
+    nearest one (or from the step rebuilt last, when playing forward).
+    Events of the other engines (dicts) are kept as they are, or only the
+    latest `keep_last` of them; `first` is then the earliest step still held.
+    """
+
+    def __init__(self, events, keyframe_every=256, spill_bytes=256 << 20, spill_dir=None, keep_last=None):
+        if keyframe_every < 1:
+            raise ValueError("keyframe_every must be positive.")
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last must be positive.")
+        self.events = events
+        self.keyframe_every = keyframe_every
+        self.spill_bytes = spill_bytes
+        self.spill_dir = spill_dir
+        self.keep_last = keep_last
+        self.first = 0         # Earliest step still held (dict events past keep_last are dropped)
+        self.final = None      # The 'finished' event, once reached
+        self.done = False
+        self.spilled = False
+
+        self.kind = _Column('B')
+        self.a, self.b, self.c, self.d = (_Column('i') for _ in range(4))
+        self.value = _Column('d')
+        self.depth = _Column('i')
+        self._columns = (self.kind, self.a, self.b, self.c, self.d, self.value, self.depth)
+        self._objects = []     # Events without a columnar form
+        self._keyframes = {}   # Row -> Graham stack cell, at rows 0, K, 2K, ...
+        self._irregular = []   # ... and at the (sorted) rows the stack jumped
+        self._last_stack = None
+        self._cursor = None    # (row, Graham stack cell) last rebuilt, so playing forward costs O(1) a step
+        self._points = self._hull = self._order = None
+
+    def __len__(self):
+        return self.first + len(self._objects) or len(self.kind)
+
+    # --- Recording ---
+
+    def record(self, upto=None):
+        """Records until `upto` events are held (or the generator ends). Returns len(self)."""
+        while not self.done and (upto is None or len(self) < upto):
+            try:
+                event = next(self.events)
+            except StopIteration:
+                self.done = True
+                break
+            if event.get('status') == 'finished':
+                self.final = event
+                self.done = True
+                break
+            self._append(event)
+        return len(self)
+
+    def _append(self, event):
+        if isinstance(event, JarvisStep):
+            self._points, self._hull = event.points, event.hull_so_far
+            self._row(_JARVIS_VERTEX if event.status == 'vertex' else _JARVIS, event.p_idx, event.best_idx, event.q_idx, event.check_idx,
+                      event.value, len(event.hull_so_far))
+        elif isinstance(event, GrahamStep):
+            row = len(self.kind)
+            self._order = event.order
+            stack, last = event.stack, self._last_stack
+            size = self.depth[row - 1] if row else 0
+            if row and event.status == 'popping' and last is not None and stack is last[1]:
+                size -= 1
+            elif row and event.status in ('pushing', 'vertex') and stack is not None and stack[1] is last:
+                size += 1
+            elif not row or stack is not last:
+                # Not one push or pop away (the scan's first stack): keep the cell itself
+                size = len(event.stack_indices())
+                if row % self.keyframe_every:
+                    self._irregular.append(row)
+                self._keyframes[row] = stack
+            if row % self.keyframe_every == 0:
+                self._keyframes[row] = stack
+            self._last_stack = stack
+            chain = _CHAINS.index(event.chain) if isinstance(event, MonotoneStep) else -1
+            self._row(_GRAHAM_KIND[event.status], _index(event.check), _index(event.popped), chain, -1,
+                      event.value, size)
+        else:
+            self._objects.append(event)
+            if self.keep_last is not None and len(self._objects) > self.keep_last:
+                del self._objects[0]
+                self.first += 1
+
+    def _row(self, kind, a, b, c, d, value, depth):
+        self.kind.append(kind)
+        self.a.append(a)
+        self.b.append(b)
+        self.c.append(c)
+        self.d.append(d)
+        self.value.append(float('nan') if value is None else float(value))
+        self.depth.append(depth)
+        if not self.spilled and len(self.kind) % _WRITE_BUFFER == 0:
+            if sum(column.nbytes for column in self._columns) > self.spill_bytes:
+                for column in self._columns:
+                    column.spill(self.spill_dir)
+                self.spilled = True
+
+    # --- Playback ---
+
+    def status(self, t):
+        """Status of step t without rebuilding the event, or None past the end of the run (or before first)."""
+        if t < self.first:
+            return None
+        if t >= len(self):
+            self.record(t + 1)
+            if t >= len(self):
+                return None
+        if self._objects:
+            return self._objects[t - self.first].get('status')
+        kind = self.kind[t]
+        if kind == _JARVIS:
+            return 'checking'
+        if kind == _JARVIS_VERTEX:
+            return 'vertex'
+        return _GRAHAM_STATUSES[kind - 1]
+
+    def event(self, t):
+        """Step t rebuilt as an event, or None past the end of the run (or before first)."""
+        if t < self.first:
+            return None
+        if t >= len(self):
+            self.record(t + 1)
+            if t >= len(self):
+                return None
+        if self._objects:
+            return self._objects[t - self.first]
+
+        kind = self.kind[t]
+        value = self.value[t]
+        if kind == _JARVIS or kind == _JARVIS_VERTEX:
+            return JarvisStep(self._points, self.a[t], self.b[t], self.c[t], self.d[t],
+                              None if value != value else value, self._hull[:self.depth[t]],
+                              'vertex' if kind == _JARVIS_VERTEX else 'checking')
+
+        start = t - t % self.keyframe_every
+        k = bisect.bisect_right(self._irregular, t)
+        if k and self._irregular[k - 1] > start:
+            start = self._irregular[k - 1]
+        cell = self._keyframes[start]
+        if self._cursor is not None and start < self._cursor[0] <= t:
+            start, cell = self._cursor  # No keyframe in between: carry on from the last rebuilt step
+        for row in range(start + 1, t + 1):
+            row_kind = self.kind[row]
+            if row_kind == _GRAHAM_KIND['popping']:
+                cell = cell[1]
+            elif row_kind == _GRAHAM_KIND['pushing'] or row_kind == _GRAHAM_KIND['vertex']:
+                cell = (self.a[row], cell)
+        self._cursor = (t, cell)
+        step = (_GRAHAM_STATUSES[kind - 1], self._order, cell, _unindex(self.a[t]), _unindex(self.b[t]),
+                None if value != value else value)
+        chain = self.c[t]
+        return GrahamStep(*step) if chain < 0 else MonotoneStep(_CHAINS[chain], *step)
+
+    def close(self):
+        """Stops recording and deletes any spill files."""
+        for column in self._columns:
+            column.close()
+        self.events = iter(())
+        self.done = True
+
+
+def _index(i):
+    return -1 if i is None else i
+
+
+def _unindex(i):
+    return None if i < 0 else i
@@ -1,7 +1,7 @@
 # view.py
 # (Owned by the GUI Team)
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog
 from PIL import Image, ImageTk, ImageDraw, ImageFont
 
 class ConvexHullView:
@@ -24,6 +24,8 @@ class ConvexHullView:
     C_POINT_P = "#f59e0b"
     C_LINE_Q = "#10b981"
     C_LINE_I = "#ef4444"
+    C_MINI_HULL = "#8b5cf6"
+    C_POINT_ELIMINATED = "#48484a"
     
     FONT_BOLD = ("Inter", 12, "bold")
     FONT_NORMAL = ("Inter", 10)
@@ -40,6 +42,9 @@ class ConvexHullView:
         self.origin_x = 0
         self.origin_y = 0
         self._click_job = None
+        self.eliminated_ids = set() # Point ids the pre-filter dropped, drawn greyed out
+        self.timeline_command = None
+        self._timeline_updating = False # Set while the controller moves the slider
         try:
             self.pil_font_bold = ImageFont.truetype("arialbd.ttf", 14)
         except IOError:
@@ -64,8 +69,12 @@ class ConvexHullView:
     
     def bind_start_animation(self, command): self.start_button_command = command
     def bind_reset(self, command): self.reset_button_command = command
+    def bind_stream_file(self, command): self.stream_button_command = command
     def bind_pause_resume(self, command): self.pause_resume_command = command
     def bind_next_step(self, command): self.next_step_command = command
+    def bind_next_vertex(self, command): self.next_vertex_command = command
+    def bind_run_to_end(self, command): self.run_to_end_command = command
+    def bind_kinetic_toggle(self, command): self.kinetic_checkbutton.config(command=command)
     def bind_canvas_events(self, on_press, on_pan, on_release, on_zoom):
         self.canvas.bind("<Button-1>", on_press)
         self.canvas.bind("<B1-Motion>", on_pan)
@@ -73,7 +82,13 @@ class ConvexHullView:
         self.canvas.bind("<MouseWheel>", on_zoom)
         self.canvas.bind("<Button-4>", on_zoom)
         self.canvas.bind("<Button-5>", on_zoom)
+    def bind_delete_point(self, command): self.canvas.bind("<Button-3>", command)
     def bind_resize(self, command): self.canvas.bind("<Configure>", command)
+    def bind_timeline(self, on_seek, on_step_back, on_step_forward, on_play_pause):
+        """Timeline slider seeks; Left/Right step through the recorded run and Space plays or pauses it."""
+        self.timeline_command = on_seek
+        for key, command in (("<Left>", on_step_back), ("<Right>", on_step_forward), ("<space>", on_play_pause)):
+            self.root.bind(key, lambda e, command=command: None if isinstance(e.widget, (tk.Entry, ttk.Entry)) else command())
     def bind_back_to_start(self, command):
         """Bind the back to start button command."""
         self.back_to_start_command = command
@@ -84,6 +99,62 @@ class ConvexHullView:
     def get_speed(self):
         return int(self.speed_scale.get())
 
+    def get_finish_seconds(self):
+        """Seconds the rest of the run should take, or None to play at the slider's speed."""
+        if not self.finish_var.get():
+            return None
+        try:
+            return max(1.0, float(self.finish_spinbox.get()))
+        except ValueError:
+            return 10.0
+
+    def get_skip_animation(self):
+        return self.skip_animation_var.get()
+
+    def get_kinetic_mode(self):
+        return self.kinetic_var.get()
+
+    def get_selected_prefilter(self):
+        return self.prefilter_combobox.get()
+
+    def get_selected_granularity(self):
+        return self.granularity_combobox.get()
+
+    def ask_stream_source(self):
+        """Asks for a point file to stream; returns its path or '' if cancelled."""
+        return filedialog.askopenfilename(
+            title="Stream points from file",
+            filetypes=[("Point files", "*.txt *.csv *.xy"), ("All files", "*.*")]
+        )
+
+    def get_stream_every(self):
+        """Chunks read between hull updates while streaming a file."""
+        try:
+            return max(1, int(self.stream_every_spinbox.get()))
+        except ValueError:
+            return 1
+
+    def get_approx_strips(self):
+        try:
+            return max(1, int(self.strips_spinbox.get()))
+        except ValueError:
+            return 64
+
+    def set_timeline(self, step, recorded, complete):
+        """Puts the slider on `step` of the `recorded` steps so far ('+' while the run is still being recorded)."""
+        self._timeline_updating = True
+        self.timeline_scale.config(to=max(recorded - 1, 0))
+        self.timeline_scale.set(max(step, 0))
+        self._timeline_updating = False
+        self.timeline_text.set(f"{step + 1} / {recorded}{'' if complete else '+'}" if recorded else "—")
+
+    def _on_timeline_moved(self, value):
+        if not self._timeline_updating and self.timeline_command:
+            self.timeline_command(int(float(value)))
+
+    def set_eliminated_points(self, point_ids):
+        self.eliminated_ids = point_ids
+
     def update_status(self, text): self.status_text.set(text)
     def update_analysis(self, text): self.analysis_text.set(text)
     def show_animation_panels(self):
@@ -97,10 +168,14 @@ class ConvexHullView:
     
     def set_button_states(self, start_state, reset_state, pause_text, pause_state, next_state, combo_state):
         self.start_button.config(state=start_state)
+        self.stream_button.config(state=tk.DISABLED if combo_state == "disabled" else tk.NORMAL)
         self.reset_button.config(state=reset_state)
         # self.pause_resume_button.config(state=pause_state)
         # self.next_step_button.config(state=next_state)
         self.algo_combobox.config(state=combo_state)
+        self.prefilter_combobox.config(state=combo_state)
+        self.granularity_combobox.config(state=combo_state)
+        self.strips_spinbox.config(state=combo_state)
         
         # self._update_button_text(self.pause_resume_button, pause_text)
 
@@ -128,12 +203,26 @@ class ConvexHullView:
         if clear: self.canvas.delete("all")
         self._draw_axes_and_grid()
         for p in points:
-            cx, cy = self.grid_to_canvas(p['grid_x'], p['grid_y'])
-            self.canvas.create_oval(cx-4, cy-4, cx+4, cy+4, fill=self.C_POINT_BLUE, outline="", tags="point")
-            self.canvas.create_text(cx + 8, cy - 8, text=f"({p['grid_x']},{p['grid_y']})", anchor="sw", fill=self.C_LIGHT_GRAY_TEXT, font=("Inter", 9))
+            self._draw_point(p)
         if hull:
             self._draw_final_hull_shape(hull)
 
+    def _draw_point(self, p):
+        cx, cy = self.grid_to_canvas(p['grid_x'], p['grid_y'])
+        tags = ("point", f"point_{p['id']}")
+        if p['id'] in self.eliminated_ids:
+            self.canvas.create_oval(cx-3, cy-3, cx+3, cy+3, fill=self.C_POINT_ELIMINATED, outline="", tags=tags)
+            return
+        self.canvas.create_oval(cx-4, cy-4, cx+4, cy+4, fill=self.C_POINT_BLUE, outline="", tags=tags)
+        self.canvas.create_text(cx + 8, cy - 8, text=f"({p['grid_x']},{p['grid_y']})", anchor="sw", fill=self.C_LIGHT_GRAY_TEXT, font=("Inter", 9), tags=tags)
+
+    def draw_dragged_point(self, point, hull):
+        """Cheap redraw while a point is dragged: only that point and the hull are replaced."""
+        self.canvas.delete(f"point_{point['id']}")
+        self.canvas.delete("hull")
+        self._draw_point(point)
+        self._draw_final_hull_shape(hull)
+
     def draw_jarvis_step(self, points, p_point, q_point, i_point, hull_so_far):
         """Draws a single step of the Jarvis March animation."""
         self.draw_all(points, hull=None, clear=True)
@@ -148,16 +237,23 @@ class ConvexHullView:
         
         self._draw_final_hull_shape(hull_so_far, outline_only=True)
 
-    def draw_graham_step(self, points, pivot, sorted_points, stack, check_point, status):
-        """Draws a single step of the Graham Scan animation."""
+    def draw_graham_step(self, points, order, stack, check, status):
+        """
+        Draws a single step of the Graham Scan animation. `order` is the
+        polar order (pivot first); `stack` (bottom first) and `check` are
+        indices into it.
+        """
         self.draw_all(points, hull=None, clear=True)
+        pivot = order[0]
+        check_point = order[check] if check is not None else None
+        stack = [order[i] for i in stack]
         
         if pivot:
             p_c = self.grid_to_canvas(pivot['grid_x'], pivot['grid_y'])
             self.canvas.create_oval(p_c[0]-7, p_c[1]-7, p_c[0]+7, p_c[1]+7, fill=self.C_POINT_P, outline="")
             
         if status == 'sorted':
-            for point in sorted_points:
+            for point in order:
                 pt_c = self.grid_to_canvas(point['grid_x'], point['grid_y'])
                 self.canvas.create_line(p_c, pt_c, fill=self.C_MED_GRAY, width=1, dash=(2, 4))
         
@@ -175,17 +271,139 @@ class ConvexHullView:
             self.canvas.create_line(next_top_c, top_c, fill=self.C_LINE_Q, width=4)
             self.canvas.create_line(top_c, check_c, fill=self.C_LINE_I, width=2, dash=(4, 4))
 
+    def draw_chan_step(self, points, mini_hulls, p_point, probe_point, tangents, q_point, hull_so_far):
+        """Draws a single step of Chan's Algorithm: mini-hulls, tangents and the probe."""
+        self.draw_all(points, hull=None, clear=True)
+
+        for mini in mini_hulls:
+            coords = [c for p in mini for c in self.grid_to_canvas(p['grid_x'], p['grid_y'])]
+            if len(coords) >= 4:
+                self.canvas.create_line(coords + coords[:2], fill=self.C_MINI_HULL, width=1, dash=(3, 3))
+
+        if p_point:
+            p_c = self.grid_to_canvas(p_point['grid_x'], p_point['grid_y'])
+            self.canvas.create_oval(p_c[0]-6, p_c[1]-6, p_c[0]+6, p_c[1]+6, fill=self.C_POINT_P, outline="")
+            for t in tangents:
+                self.canvas.create_line(p_c, self.grid_to_canvas(t['grid_x'], t['grid_y']), fill=self.C_MED_GRAY, width=1)
+            if q_point:
+                self.canvas.create_line(p_c, self.grid_to_canvas(q_point['grid_x'], q_point['grid_y']), fill=self.C_LINE_Q, width=2)
+            if probe_point:
+                self.canvas.create_line(p_c, self.grid_to_canvas(probe_point['grid_x'], probe_point['grid_y']), fill=self.C_LINE_I, width=1, dash=(4, 4))
+
+        self._draw_final_hull_shape(hull_so_far, outline_only=True)
+
+    def draw_quickhull_step(self, points, segment, farthest, candidates, kept, status, hull_so_far):
+        """Draws a single step of QuickHull: the segment, the points outside it and the farthest one."""
+        self.draw_all(points, hull=None, clear=True)
+        self._draw_final_hull_shape(hull_so_far, outline_only=True)
+
+        highlighted = kept if status == 'partition' else candidates
+        for p in highlighted:
+            cx, cy = self.grid_to_canvas(p['grid_x'], p['grid_y'])
+            self.canvas.create_oval(cx-6, cy-6, cx+6, cy+6, outline=self.C_LINE_I, width=2)
+
+        s_c = self.grid_to_canvas(segment[0]['grid_x'], segment[0]['grid_y'])
+        t_c = self.grid_to_canvas(segment[1]['grid_x'], segment[1]['grid_y'])
+        self.canvas.create_line(s_c, t_c, fill=self.C_LINE_Q, width=4)
+
+        if farthest:
+            f_c = self.grid_to_canvas(farthest['grid_x'], farthest['grid_y'])
+            self.canvas.create_line(s_c, f_c, t_c, fill=self.C_LINE_I, width=2, dash=(4, 4))
+            self.canvas.create_oval(f_c[0]-7, f_c[1]-7, f_c[0]+7, f_c[1]+7, fill=self.C_POINT_P, outline="")
+
+    def draw_dc_step(self, points, sub_hulls, split, bridge, status, hull_so_far):
+        """Draws a single divide and conquer step: the solved sub-hulls, the split line and the bridge being walked."""
+        self.draw_all(points, hull=None, clear=True)
+
+        for sub in sub_hulls:
+            coords = [c for p in sub for c in self.grid_to_canvas(p['grid_x'], p['grid_y'])]
+            if len(coords) >= 4:
+                self.canvas.create_line(coords + coords[:2], fill=self.C_MINI_HULL, width=2)
+            for p in sub:
+                cx, cy = self.grid_to_canvas(p['grid_x'], p['grid_y'])
+                self.canvas.create_oval(cx-5, cy-5, cx+5, cy+5, fill=self.C_MINI_HULL, outline="")
+
+        if split is not None:
+            sx, _ = self.grid_to_canvas(split, 0)
+            self.canvas.create_line(sx, 0, sx, self.canvas.winfo_height(), fill=self.C_LIGHT_GRAY_TEXT, width=1, dash=(6, 4))
+
+        if bridge:
+            a_c = self.grid_to_canvas(bridge[0]['grid_x'], bridge[0]['grid_y'])
+            b_c = self.grid_to_canvas(bridge[1]['grid_x'], bridge[1]['grid_y'])
+            color = self.C_LINE_Q if status == 'lower_bridge' else self.C_POINT_P
+            self.canvas.create_line(a_c, b_c, fill=color, width=3)
+            for c in (a_c, b_c):
+                self.canvas.create_oval(c[0]-7, c[1]-7, c[0]+7, c[1]+7, outline=color, width=2)
+
+        self._draw_final_hull_shape(hull_so_far, outline_only=True)
+
+    def draw_ks_step(self, points, candidates, split, support, slope, pruned, bridges, hull_so_far):
+        """Draws a single Kirkpatrick-Seidel step: candidates, median line, supporting line, pruned points and bridges."""
+        self.draw_all(points, hull=None, clear=True)
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+
+        if split is not None:
+            sx, _ = self.grid_to_canvas(split, 0)
+            self.canvas.create_line(sx, 0, sx, height, fill=self.C_LIGHT_GRAY_TEXT, width=1, dash=(6, 4))
+
+        for p in candidates:
+            cx, cy = self.grid_to_canvas(p['grid_x'], p['grid_y'])
+            self.canvas.create_oval(cx-6, cy-6, cx+6, cy+6, outline=self.C_MINI_HULL, width=2)
+        for p in pruned:
+            cx, cy = self.grid_to_canvas(p['grid_x'], p['grid_y'])
+            self.canvas.create_line(cx-5, cy-5, cx+5, cy+5, fill=self.C_LINE_I, width=2)
+            self.canvas.create_line(cx-5, cy+5, cx+5, cy-5, fill=self.C_LINE_I, width=2)
+
+        if support:
+            # The line of the median slope through the point it touches, across the canvas
+            x0, _ = self.canvas_to_grid(0, 0)
+            x1, _ = self.canvas_to_grid(width, 0)
+            y0 = support['grid_y'] + slope * (x0 - support['grid_x'])
+            y1 = support['grid_y'] + slope * (x1 - support['grid_x'])
+            self.canvas.create_line(self.grid_to_canvas(x0, y0), self.grid_to_canvas(x1, y1), fill=self.C_POINT_P, width=1, dash=(4, 4))
+            sx, sy = self.grid_to_canvas(support['grid_x'], support['grid_y'])
+            self.canvas.create_oval(sx-7, sy-7, sx+7, sy+7, fill=self.C_POINT_P, outline="")
+
+        for a, b in bridges:
+            self.canvas.create_line(self.grid_to_canvas(a['grid_x'], a['grid_y']), self.grid_to_canvas(b['grid_x'], b['grid_y']), fill=self.C_LINE_Q, width=3)
+
+        self._draw_final_hull_shape(hull_so_far, outline_only=True)
+
+    def draw_layers_step(self, points, layers, current):
+        """Draws the convex layers peeled so far as nested polygons, and the layer being removed (if any) on top."""
+        self.draw_all(points, hull=None, clear=True)
+        palette = (self.C_HULL_LINE, self.C_MINI_HULL, self.C_LINE_Q, self.C_POINT_P)
+
+        for depth, layer in enumerate(layers):
+            color = palette[depth % len(palette)]
+            coords = [c for p in layer for c in self.grid_to_canvas(p['grid_x'], p['grid_y'])]
+            if len(coords) >= 4:
+                self.canvas.create_line(coords + coords[:2], fill=color, width=2)
+            for p in layer:
+                cx, cy = self.grid_to_canvas(p['grid_x'], p['grid_y'])
+                self.canvas.create_oval(cx-4, cy-4, cx+4, cy+4, fill=color, outline="")
+
+        if current:
+            coords = [c for p in current for c in self.grid_to_canvas(p['grid_x'], p['grid_y'])]
+            if len(coords) >= 6:
+                self.canvas.create_polygon(coords, fill=self.C_HULL_FILL, outline="", stipple="gray25")
+            if len(coords) >= 4:
+                self.canvas.create_line(coords + coords[:2], fill=self.C_LINE_I, width=3)
+            for p in current:
+                cx, cy = self.grid_to_canvas(p['grid_x'], p['grid_y'])
+                self.canvas.create_oval(cx-7, cy-7, cx+7, cy+7, outline=self.C_LINE_I, width=2)
+
     def _draw_final_hull_shape(self, hull, outline_only=False):
         if not hull: return
         hull_coords = [c for p in hull for c in self.grid_to_canvas(p['grid_x'], p['grid_y'])]
         if len(hull_coords) >= 6 and not outline_only:
-            self.canvas.create_polygon(hull_coords, fill=self.C_HULL_FILL, outline="", stipple="gray25")
+            self.canvas.create_polygon(hull_coords, fill=self.C_HULL_FILL, outline="", stipple="gray25", tags="hull")
         if len(hull_coords) >= 4:
             closed_coords = hull_coords + [hull_coords[0], hull_coords[1]]
-            self.canvas.create_line(closed_coords, fill=self.C_HULL_LINE, width=3)
+            self.canvas.create_line(closed_coords, fill=self.C_HULL_LINE, width=3, tags="hull")
         for p in hull:
             cx, cy = self.grid_to_canvas(p['grid_x'], p['grid_y'])
-            self.canvas.create_oval(cx-6, cy-6, cx+6, cy+6, fill=self.C_HULL_LINE, outline="")
+            self.canvas.create_oval(cx-6, cy-6, cx+6, cy+6, fill=self.C_HULL_LINE, outline="", tags="hull")
     
     def _draw_axes_and_grid(self):
         grid_step = self.grid_size
@@ -325,27 +543,85 @@ class ConvexHullView:
         
         self.algo_combobox = ttk.Combobox(
             algo_frame, 
-            values=["Jarvis March", "Graham Scan"],
+            values=["Jarvis March", "Graham Scan", "Monotone Chain", "Chan's Algorithm", "QuickHull", "Divide & Conquer", "Kirkpatrick–Seidel", "Approximate (BFP)", "Parallel (sharded)", "Convex Layers"],
             state="readonly",
             font=self.FONT_NORMAL
         )
         self.algo_combobox.set("Jarvis March")
         self.algo_combobox.pack(fill=tk.X, expand=True)
 
+        prefilter_frame = tk.Frame(controls_panel, bg=self.C_NEAR_BLACK)
+        prefilter_frame.pack(fill=tk.X, pady=(0, 10))
+        tk.Label(prefilter_frame, text="Pre-filter:", font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK).pack(side=tk.LEFT, padx=(4, 10))
+        self.prefilter_combobox = ttk.Combobox(
+            prefilter_frame,
+            values=["None", "Akl–Toussaint", "Lattice columns", "Lattice columns + rows"],
+            state="readonly",
+            font=self.FONT_NORMAL
+        )
+        self.prefilter_combobox.set("None")
+        self.prefilter_combobox.pack(fill=tk.X, expand=True)
+
+        granularity_frame = tk.Frame(controls_panel, bg=self.C_NEAR_BLACK)
+        granularity_frame.pack(fill=tk.X, pady=(0, 10))
+        tk.Label(granularity_frame, text="Steps shown:", font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK).pack(side=tk.LEFT, padx=(4, 10))
+        self.granularity_combobox = ttk.Combobox(
+            granularity_frame,
+            values=["fine", "candidate", "vertex"],
+            state="readonly",
+            font=self.FONT_NORMAL
+        )
+        self.granularity_combobox.set("fine")
+        self.granularity_combobox.pack(fill=tk.X, expand=True)
+
+        strips_frame = tk.Frame(controls_panel, bg=self.C_NEAR_BLACK)
+        strips_frame.pack(fill=tk.X, pady=(0, 10))
+        tk.Label(strips_frame, text="Strips (approximate):", font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK).pack(side=tk.LEFT, padx=(4, 10))
+        self.strips_spinbox = ttk.Spinbox(strips_frame, from_=4, to=4096, increment=4, font=self.FONT_NORMAL)
+        self.strips_spinbox.set(64)
+        self.strips_spinbox.pack(fill=tk.X, expand=True)
+
+        stream_every_frame = tk.Frame(controls_panel, bg=self.C_NEAR_BLACK)
+        stream_every_frame.pack(fill=tk.X, pady=(0, 10))
+        tk.Label(stream_every_frame, text="Stream: draw every (chunks):", font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK).pack(side=tk.LEFT, padx=(4, 10))
+        self.stream_every_spinbox = ttk.Spinbox(stream_every_frame, from_=1, to=10000, increment=1, font=self.FONT_NORMAL)
+        self.stream_every_spinbox.set(1)
+        self.stream_every_spinbox.pack(fill=tk.X, expand=True)
+
+        self.skip_animation_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(controls_panel, text="Skip animation (show result instantly)", variable=self.skip_animation_var,
+                       font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK,
+                       activebackground=self.C_NEAR_BLACK, activeforeground=self.C_WHITE_TEXT,
+                       selectcolor=self.C_DARK_GRAY, highlightthickness=0, anchor="w").pack(fill=tk.X, pady=(0, 10))
+
+        self.kinetic_var = tk.BooleanVar(value=False)
+        self.kinetic_checkbutton = tk.Checkbutton(controls_panel, text="Kinetic motion (points drift, hull repaired on events)", variable=self.kinetic_var,
+                                                  font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK,
+                                                  activebackground=self.C_NEAR_BLACK, activeforeground=self.C_WHITE_TEXT,
+                                                  selectcolor=self.C_DARK_GRAY, highlightthickness=0, anchor="w")
+        self.kinetic_checkbutton.pack(fill=tk.X, pady=(0, 10))
+
         buttons_row = tk.Frame(controls_panel, bg=self.C_NEAR_BLACK)
         buttons_row.pack(fill=tk.X, pady=(0, 12))
         
         self.start_button = self._create_rounded_button(buttons_row, "Start", lambda: self.start_button_command(), bg=self.C_BLUE, fg=self.C_WHITE_TEXT, bg_active=self.C_BLUE_ACTIVE, parent_bg=self.C_NEAR_BLACK)
         self.reset_button = self._create_rounded_button(buttons_row, "Reset", lambda: self.reset_button_command(), bg=self.C_DARK_GRAY, fg=self.C_WHITE_TEXT, bg_active=self.C_MED_GRAY, parent_bg=self.C_NEAR_BLACK)
-        buttons_row.grid_columnconfigure((0, 1), weight=1)
+        self.stream_button = self._create_rounded_button(buttons_row, "Stream File", lambda: self.stream_button_command(), bg=self.C_DARK_GRAY, fg=self.C_WHITE_TEXT, bg_active=self.C_MED_GRAY, parent_bg=self.C_NEAR_BLACK)
+        buttons_row.grid_columnconfigure((0, 1, 2), weight=1)
         self.start_button.grid(row=0, column=0, sticky="ew", padx=(0, 6))
         self.reset_button.grid(row=0, column=1, sticky="ew", padx=(0, 6))
+        self.stream_button.grid(row=0, column=2, sticky="ew", padx=(0, 6))
 
         tk.Frame(controls_panel, height=1, bg=self.C_MED_GRAY).pack(fill=tk.X, pady=10)
         self.anim_controls_frame = tk.Frame(controls_panel, bg=self.C_NEAR_BLACK)
         # tk.Label(self.anim_controls_frame, text="Animation", font=("Inter", 18, "bold"), fg=self.C_WHITE_TEXT, bg=self.C_NEAR_BLACK).pack(anchor="w", pady=(0, 15))
         buttons_frame = tk.Frame(self.anim_controls_frame, bg=self.C_NEAR_BLACK)
         buttons_frame.pack(fill=tk.X, pady=(0, 10))
+        self.next_vertex_button = self._create_rounded_button(buttons_frame, "Next Vertex", lambda: self.next_vertex_command(), bg=self.C_DARK_GRAY, fg=self.C_WHITE_TEXT, bg_active=self.C_MED_GRAY, parent_bg=self.C_NEAR_BLACK)
+        self.run_to_end_button = self._create_rounded_button(buttons_frame, "Run to End", lambda: self.run_to_end_command(), bg=self.C_DARK_GRAY, fg=self.C_WHITE_TEXT, bg_active=self.C_MED_GRAY, parent_bg=self.C_NEAR_BLACK)
+        buttons_frame.grid_columnconfigure((0, 1), weight=1)
+        self.next_vertex_button.grid(row=0, column=0, sticky="ew", padx=(0, 6))
+        self.run_to_end_button.grid(row=0, column=1, sticky="ew", padx=(0, 6))
         # self.pause_resume_button = self._create_rounded_button(buttons_frame, "Pause", lambda: self.pause_resume_command(), bg=self.C_DARK_GRAY, fg=self.C_WHITE_TEXT, bg_active=self.C_MED_GRAY, parent_bg=self.C_NEAR_BLACK)
         # self.pause_resume_button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
         # self.next_step_button = self._create_rounded_button(buttons_frame, "Next Step", lambda: self.next_step_command(), bg=self.C_DARK_GRAY, fg=self.C_WHITE_TEXT, bg_active=self.C_MED_GRAY, parent_bg=self.C_NEAR_BLACK)
@@ -354,9 +630,26 @@ class ConvexHullView:
         speed_frame.pack(fill=tk.X, pady=(10, 0))
         tk.Label(speed_frame, text="Speed:", font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK).pack(side=tk.LEFT)
         style.configure("Transparent.Horizontal.TScale", troughcolor=self.C_DARK_GRAY, background=self.C_NEAR_BLACK)
-        self.speed_scale = ttk.Scale(speed_frame, from_=800, to=50, orient="horizontal", style="Transparent.Horizontal.TScale")
+        self.speed_scale = ttk.Scale(speed_frame, from_=800, to=1, orient="horizontal", style="Transparent.Horizontal.TScale")
         self.speed_scale.set(350)
         self.speed_scale.pack(side=tk.RIGHT, expand=True, fill=tk.X, padx=(10, 0))
+        finish_frame = tk.Frame(self.anim_controls_frame, bg=self.C_NEAR_BLACK)
+        finish_frame.pack(fill=tk.X, pady=(10, 0))
+        self.finish_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(finish_frame, text="Finish in (seconds):", variable=self.finish_var,
+                       font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK,
+                       activebackground=self.C_NEAR_BLACK, activeforeground=self.C_WHITE_TEXT,
+                       selectcolor=self.C_DARK_GRAY, highlightthickness=0, anchor="w").pack(side=tk.LEFT)
+        self.finish_spinbox = ttk.Spinbox(finish_frame, from_=1, to=600, increment=1, font=self.FONT_NORMAL)
+        self.finish_spinbox.set(10)
+        self.finish_spinbox.pack(side=tk.RIGHT, expand=True, fill=tk.X, padx=(10, 0))
+        timeline_frame = tk.Frame(self.anim_controls_frame, bg=self.C_NEAR_BLACK)
+        timeline_frame.pack(fill=tk.X, pady=(10, 0))
+        tk.Label(timeline_frame, text="Step:", font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK).pack(side=tk.LEFT)
+        self.timeline_text = tk.StringVar(value="—")
+        tk.Label(timeline_frame, textvariable=self.timeline_text, font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK).pack(side=tk.RIGHT, padx=(10, 0))
+        self.timeline_scale = ttk.Scale(timeline_frame, from_=0, to=0, orient="horizontal", style="Transparent.Horizontal.TScale", command=self._on_timeline_moved)
+        self.timeline_scale.pack(side=tk.RIGHT, expand=True, fill=tk.X, padx=(10, 0))
         self.status_text = tk.StringVar(value="Add at least 3 points to start.")
         status_frame = tk.Frame(controls_panel, bg=self.C_NEAR_BLACK)
         status_frame.pack(fill=tk.X, pady=(5, 5))
@@ -111,6 +111,12 @@ class ConvexHullController:
         self.is_paused = False
         self.view.show_animation_panels()
         self.view.hide_results()
+        self.model.set_reduction(self.view.get_selected_reduction())
+
+        if self.view.get_skip_animation():
+            # Headless run: no generator, jump straight to the final result
+            self._animation_finished(self.model.run_vectorized())
+            return
         
         # Create the algorithm generator
         self.algorithm_generator = self.model.run_algorithm()
@@ -165,7 +171,10 @@ class ConvexHullController:
         
         if final_data:
             self.view.update_status("Convex hull complete!")
-            self.view.update_analysis("Algorithm finished. The final convex hull is shown.")
+            analysis = "Algorithm finished. The final convex hull is shown."
+            if final_data.get('eliminated'):
+                analysis += f"\n\n{self.model.reduction}: {final_data['eliminated']} of {final_data['n']} points ruled out before wrapping."
+            self.view.update_analysis(analysis)
             self.view.show_results(
                 time_text=f"Time: {final_data['time_ms']:.2f} ms",
                 complexity_text=final_data['complexity']
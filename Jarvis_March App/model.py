@@ -1,23 +1,38 @@
 # model.py
 # (Owned by the Logic/Algorithm Team)
 # --- NO TKINTER OR PIL IMPORTS ---
-import math
 import time
+import predicates
+from point_store import PointStore
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, run_vectorized falls back to a plain loop
+    np = None
 
 class JarvisMarchModel:
+    # Candidate reductions for grid-snapped points, as the view's combobox shows them
+    REDUCTIONS = ("None", "Lattice columns", "Lattice columns + rows")
+
     def __init__(self):
-        self.points = []
+        self.points = PointStore()
         self.hull = []
         self.n = 0
         self.h = 0
         self.start_time = 0
+        self.reduction = "None"
+        self.eliminated = 0 # Points the last reduction dropped
 
     def add_point(self, grid_x, grid_y):
-        """Adds a new unique point to the list."""
-        if not any(p['grid_x'] == grid_x and p['grid_y'] == grid_y for p in self.points):
-            self.points.append({'grid_x': grid_x, 'grid_y': grid_y})
-            return True
-        return False
+        """
+        Adds a new unique point to the list. The point store only takes
+        64-bit integer grid coordinates, so the float path of
+        predicates.orient() is never reached through the model.
+        """
+        return self.points.add(grid_x, grid_y)
+
+    def add_points(self, xs, ys):
+        """Adds every new unique (xs[i], ys[i]) in one batch. Returns how many were added."""
+        return self.points.add_points(xs, ys)
 
     def get_points(self):
         return self.points
@@ -32,6 +47,43 @@ class JarvisMarchModel:
         self.points.clear()
         self.hull.clear()
 
+    # --- Candidate Reduction ---
+
+    def set_reduction(self, name):
+        if name not in self.REDUCTIONS:
+            raise ValueError(f"Unknown reduction: {name}")
+        self.reduction = name
+
+    def _candidate_indices(self):
+        """
+        Indices of the points that can still be hull vertices. All points are
+        on integer grid coordinates, and on any column (or row) only its two
+        extreme points can be a vertex, so one bucketing pass drops the rest.
+        """
+        n = len(self.points)
+        self.eliminated = 0
+        if self.reduction == "None":
+            return range(n)
+        xs, ys = self.points.xs, self.points.ys
+        candidates = self._line_extremes(xs, ys)
+        if self.reduction == "Lattice columns + rows":
+            candidates &= self._line_extremes(ys, xs)
+        if len(candidates) < 3:
+            return range(n) # Collinear input, nothing to gain
+        self.eliminated = n - len(candidates)
+        return sorted(candidates)
+
+    @staticmethod
+    def _line_extremes(keys, values):
+        """Indices holding the smallest or largest value among the points sharing their key."""
+        lowest, highest = {}, {}
+        for i, (k, v) in enumerate(zip(keys, values)):
+            if k not in lowest or v < values[lowest[k]]:
+                lowest[k] = i
+            if k not in highest or v > values[highest[k]]:
+                highest[k] = i
+        return set(lowest.values()) | set(highest.values())
+
     # --- Static Math Helpers ---
     @staticmethod
     def _distance_sq(p1, p2):
@@ -39,9 +91,8 @@ class JarvisMarchModel:
 
     @staticmethod
     def _orientation(p, q, r):
-        val = (q['grid_x'] - p['grid_x']) * (r['grid_y'] - p['grid_y']) - \
-              (q['grid_y'] - p['grid_y']) * (r['grid_x'] - p['grid_x'])
-        if math.isclose(val, 0): return 0, val
+        val = predicates.orient(p['grid_x'], p['grid_y'], q['grid_x'], q['grid_y'], r['grid_x'], r['grid_y'])
+        if val == 0: return 0, val
         return (1, val) if val > 0 else (2, val)
 
     # --- Core Algorithm as a Generator ---
@@ -58,8 +109,10 @@ class JarvisMarchModel:
         if self.n < 3:
             return  # Stop the generator if not enough points
 
+        candidates = self._candidate_indices()
+
         # 1. Find the starting point (bottom-most, then left-most)
-        start_idx = min(range(self.n), key=lambda i: (self.points[i]['grid_y'], self.points[i]['grid_x']))
+        start_idx = min(candidates, key=lambda i: (self.points[i]['grid_y'], self.points[i]['grid_x']))
         p_idx = start_idx
         
         while True:
@@ -67,7 +120,7 @@ class JarvisMarchModel:
             
             # Find the first valid 'next' point (q)
             q_idx = -1
-            for i in range(self.n):
+            for i in candidates:
                 if i != p_idx:
                     q_idx = i
                     break
@@ -79,7 +132,7 @@ class JarvisMarchModel:
 
             # Now, iterate through all other points to find the real 'q'
             # This is the 'check_candidate_point' loop
-            for check_idx in range(self.n):
+            for check_idx in candidates:
                 if check_idx == p_idx or check_idx == q_idx:
                     continue
                 
@@ -135,5 +188,102 @@ class JarvisMarchModel:
             'time_ms': self.time_taken_ms,
             'n': self.n,
             'h': self.h,
+            'eliminated': self.eliminated,
             'complexity': f"O(nh): {self.n} * {self.h} = {self.n * self.h} ops"
-        }
\ No newline at end of file
+        }
+
+    # --- Vectorized Engine (no animation) ---
+
+    def run_vectorized(self):
+        """
+        Computes the same hull as run_algorithm(), in the same order, without
+        yielding. With NumPy each wrap step is one cross-product pass over all
+        points: the most clockwise candidate wins, collinear ties go to the
+        farthest point.
+        """
+        self.start_time = time.perf_counter()
+        self.hull = []
+        self.n = len(self.points)
+        self.eliminated = 0
+        if self.n >= 3:
+            candidates = self._candidate_indices()
+            xs, ys = self.points.xs, self.points.ys
+            if len(candidates) < self.n:
+                xs, ys = [xs[i] for i in candidates], [ys[i] for i in candidates]
+            wrap = self._wrap_numpy if np is not None else self._wrap_python
+            self.hull = [self.points[candidates[i]] for i in wrap(xs, ys)]
+
+        self.h = len(self.hull)
+        self.time_taken_ms = (time.perf_counter() - self.start_time) * 1000
+        return {
+            'status': 'finished',
+            'hull_so_far': self.hull,
+            'time_ms': self.time_taken_ms,
+            'n': self.n,
+            'h': self.h,
+            'eliminated': self.eliminated,
+            'complexity': f"O(nh): {self.n} * {self.h} = {self.n * self.h} ops (vectorized)"
+        }
+
+    @staticmethod
+    def _wrap_python(xs, ys):
+        n = len(xs)
+        start = min(range(n), key=lambda i: (ys[i], xs[i]))
+        hull = []
+        p = start
+        while True:
+            hull.append(p)
+            px, py = xs[p], ys[p]
+            q = 0 if p != 0 else 1
+            qx, qy = xs[q] - px, ys[q] - py
+            for r in range(n):
+                if r == p:
+                    continue
+                rx, ry = xs[r] - px, ys[r] - py
+                val = qx * ry - qy * rx
+                if val < 0 or (val == 0 and rx * rx + ry * ry > qx * qx + qy * qy):
+                    q, qx, qy = r, rx, ry
+            p = q
+            if p == start or len(hull) > n:
+                break
+        return hull
+
+    @staticmethod
+    def _wrap_numpy(xs, ys):
+        X, Y = np.asarray(xs), np.asarray(ys)
+        if X.dtype.kind in 'iu' and Y.dtype.kind in 'iu' and max(int(np.abs(X).max()), int(np.abs(Y).max())) < 2**30:
+            X, Y = X.astype(np.int64, copy=False), Y.astype(np.int64, copy=False)
+        else:
+            X, Y = X.astype(np.float64), Y.astype(np.float64)
+        n = len(X)
+
+        bottom = np.flatnonzero(Y == Y.min())
+        start = int(bottom[np.argmin(X[bottom])])
+        hull = []
+        p = start
+        while True:
+            hull.append(p)
+            dx = X - X[p]
+            dy = Y - Y[p]
+            q = 0 if p != 0 else 1
+
+            # Move Q to the most clockwise point until none is left clockwise of P->Q;
+            # only the points that were clockwise need re-testing
+            cand = np.arange(n)
+            while True:
+                cross = dx[q] * dy[cand] - dy[q] * dx[cand]
+                clockwise = np.flatnonzero(cross < 0)
+                if len(clockwise) == 0:
+                    break
+                q = int(cand[clockwise[np.argmin(cross[clockwise])]])
+                cand = cand[clockwise]
+
+            # Collinear tie-break: farthest point on the P->Q ray
+            collinear = np.flatnonzero(dx[q] * dy - dy[q] * dx == 0)
+            dist = dx[collinear] ** 2 + dy[collinear] ** 2
+            q = int(collinear[np.argmax(dist)])
+
+            p = q
+            if p == start or len(hull) > n:
+                break
+        return hull
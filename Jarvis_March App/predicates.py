@@ -0,0 +1,61 @@
+# predicates.py
+# (Owned by the Logic/Algorithm Team)
+# --- NO TKINTER OR PIL IMPORTS ---
+# Robust geometric predicates used by the model.
+import math
+
+# Relative error bound of the plain float orientation determinant
+# (Shewchuk, "Adaptive Precision Floating-Point Arithmetic", ccwerrboundA).
+_EPSILON = 2.0 ** -53
+_CCW_ERRBOUND = (3.0 + 16.0 * _EPSILON) * _EPSILON
+
+
+def orient(ax, ay, bx, by, cx, cy):
+    """
+    Orientation determinant of the triangle (a, b, c) with an exact sign:
+    positive for a counter-clockwise turn, negative for clockwise, zero
+    when the three points are collinear.
+
+    Integer input is exact as is. Float input is first evaluated in plain
+    floating point and only recomputed exactly when the result is too close
+    to zero for its sign to be trusted.
+    """
+    detleft = (bx - ax) * (cy - ay)
+    detright = (by - ay) * (cx - ax)
+    det = detleft - detright
+    if type(det) is int:
+        return det
+
+    # Opposite signs (or a zero term) cannot cancel, so the sign is already right
+    if detleft > 0:
+        if detright <= 0:
+            return det
+        detsum = detleft + detright
+    elif detleft < 0:
+        if detright >= 0:
+            return det
+        detsum = -detleft - detright
+    else:
+        return det
+
+    errbound = _CCW_ERRBOUND * detsum
+    if det >= errbound or -det >= errbound:
+        return det
+    return _orient_exact(ax, ay, bx, by, cx, cy)
+
+
+def _orient_exact(ax, ay, bx, by, cx, cy):
+    """
+    Exact fallback for orient(). Every float is a dyadic rational, so scaling
+    all coordinates by a common denominator turns the determinant into an
+    integer one. Returns a float that carries the exact sign.
+    """
+    ratios = [v.as_integer_ratio() for v in (ax, ay, bx, by, cx, cy)]
+    scale = math.lcm(*(d for _, d in ratios))
+    ax, ay, bx, by, cx, cy = (n * (scale // d) for n, d in ratios)
+    det = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    value = det / (scale * scale)
+    if value == 0 and det != 0:  # Underflowed, keep the sign
+        return math.copysign(5e-324, det)
+    return value
+
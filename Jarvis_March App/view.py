@@ -86,6 +86,12 @@ class ConvexHullView:
     def get_speed(self):
         return int(self.speed_scale.get())
 
+    def get_skip_animation(self):
+        return self.skip_animation_var.get()
+
+    def get_selected_reduction(self):
+        return self.reduction_combobox.get()
+
     def update_status(self, text):
         self.status_text.set(text)
         
@@ -107,6 +113,7 @@ class ConvexHullView:
     def set_button_states(self, start_state, reset_state, pause_text, pause_state, next_state):
         self.start_button.config(state=start_state)
         self.reset_button.config(state=reset_state)
+        self.reduction_combobox.config(state="readonly" if reset_state == tk.NORMAL else "disabled")
         self.pause_resume_button.config(state=pause_state)
         self.next_step_button.config(state=next_state)
         
@@ -288,6 +295,24 @@ class ConvexHullView:
         self.start_button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 6))
         self.reset_button = self._create_rounded_button(buttons_row, "Reset", lambda: self.reset_button_command(), bg=self.C_DARK_GRAY, fg=self.C_WHITE_TEXT, bg_active=self.C_MED_GRAY, parent_bg=self.C_NEAR_BLACK)
         self.reset_button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(6, 0))
+
+        self.skip_animation_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(controls_panel, text="Skip animation (show result instantly)", variable=self.skip_animation_var,
+                       font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK,
+                       activebackground=self.C_NEAR_BLACK, activeforeground=self.C_WHITE_TEXT,
+                       selectcolor=self.C_DARK_GRAY, highlightthickness=0, anchor="w").pack(fill=tk.X)
+
+        reduction_frame = tk.Frame(controls_panel, bg=self.C_NEAR_BLACK)
+        reduction_frame.pack(fill=tk.X, pady=(6, 0))
+        tk.Label(reduction_frame, text="Candidates:", font=self.FONT_NORMAL, fg=self.C_LIGHT_GRAY_TEXT, bg=self.C_NEAR_BLACK).pack(side=tk.LEFT, padx=(4, 10))
+        self.reduction_combobox = ttk.Combobox(
+            reduction_frame,
+            values=["None", "Lattice columns", "Lattice columns + rows"],
+            state="readonly",
+            font=self.FONT_NORMAL
+        )
+        self.reduction_combobox.set("None")
+        self.reduction_combobox.pack(fill=tk.X, expand=True)
         
         tk.Frame(controls_panel, height=1, bg=self.C_MED_GRAY).pack(fill=tk.X, pady=10)
         self.anim_controls_frame = tk.Frame(controls_panel, bg=self.C_NEAR_BLACK)